@@ -0,0 +1,158 @@
+"""
+오프라인 파이프라인 부하 테스트 (API 키 없이 로컬 LLM 대역 사용).
+
+사용법:
+    python -m benchmarks.copy_pipeline
+    python -m benchmarks.copy_pipeline --products 40 --concurrency 1 4 8 --latency 1.5 --error-rate 0.1 --malformed-rate 0.1
+
+상품마다 합성 검색 결과(상품명 --titles개)로 키워드 리포트를 만들고, 상위 키워드로 원고 요청을 구성한 뒤
+- sequential: generate_copy_async를 하나씩 await
+- batch xN: generate_copies (동시 요청 N개 상한, 완료 순서대로 수신)
+- stream: stream_copy_async 첫 필드 도착 시간 (time-to-first-field)
+- cached: 같은 요청을 다시 실행 (응답 캐시 히트)
+를 비교함. 재시도/실패(100건당)와 토큰 사용량도 함께 출력.
+속도 제한(RATE_LIMIT_RPM)은 --rpm으로 바꿀 수 있음 (기본: 부하 테스트용으로 사실상 해제).
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+import config
+from src.analyzer.keyword_analyzer import KeywordAnalyzer
+from src.models.copy_request import CopyRequest
+from src.writer.ai_copywriter import PERSONA_INSTRUCTION, AICopywriter
+from src.writer.local_model import LocalStubModel
+
+from benchmarks.sharded_analysis import make_titles
+
+
+def make_requests(analyzer: KeywordAnalyzer, products: int, titles_per_product: int):
+    requests = []
+    for i in range(products):
+        titles = make_titles(titles_per_product, seed=i)
+        df = pd.DataFrame({"상품명": titles, "is_ad": [False] * len(titles), "순위": range(1, len(titles) + 1)})
+        report = analyzer.build_keyword_report(df)
+        requests.append(CopyRequest(product_name=titles[0], keywords=report.top_keywords(10), tags=[], target_keyword=titles[0].split()[0]))
+    return requests
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def report(label, elapsed, latencies, n):
+    print(
+        f"{label:>12} | {elapsed:7.2f}s | {n / elapsed:6.2f} copies/s"
+        f" | p50 {percentile(latencies, 50):5.2f}s | p95 {percentile(latencies, 95):5.2f}s"
+    )
+
+
+def make_writer(args, cache_path: Path) -> AICopywriter:
+    model = LocalStubModel(
+        PERSONA_INSTRUCTION,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        malformed_rate=args.malformed_rate,
+        seed=0,
+    )
+    config.COPY_CACHE_CONFIG["PATH"] = cache_path
+    return AICopywriter(use_cache=True, model=model)
+
+
+async def run_sequential(writer: AICopywriter, requests, use_cache: bool):
+    latencies = []
+    start = time.perf_counter()
+    for request in requests:
+        t = time.perf_counter()
+        await writer.generate_copy_async(
+            request.product_name, request.keywords, request.tags,
+            request.image_paths, request.target_keyword, use_cache,
+        )
+        latencies.append(time.perf_counter() - t)
+    return time.perf_counter() - start, latencies
+
+
+async def run_batch(writer: AICopywriter, requests, concurrency: int, use_cache: bool):
+    latencies = []
+    start = time.perf_counter()
+    async for _, _, _ in writer.generate_copies(requests, max_concurrency=concurrency, use_cache=use_cache):
+        latencies.append(time.perf_counter() - start)
+    return time.perf_counter() - start, latencies
+
+
+async def run_stream(writer: AICopywriter, requests):
+    first_fields, totals = [], []
+    for request in requests:
+        async for _ in writer.stream_copy_async(
+            request.product_name, request.keywords, request.tags,
+            request.image_paths, request.target_keyword, use_cache=False,
+        ):
+            pass
+        if writer.last_stream_stats.get("first_field_seconds") is not None:
+            first_fields.append(writer.last_stream_stats["first_field_seconds"])
+            totals.append(writer.last_stream_stats["total_seconds"])
+    return first_fields, totals
+
+
+async def run(args):
+    analyzer = KeywordAnalyzer(use_cache=False, phrase_top_n=0, dedupe=False)
+    start = time.perf_counter()
+    requests = make_requests(analyzer, args.products, args.titles)
+    print(f"keyword reports: {args.products} products x {args.titles} titles in {time.perf_counter() - start:.2f}s")
+    print(
+        f"local LLM: latency {args.latency}s, error rate {args.error_rate}, malformed rate {args.malformed_rate}, "
+        f"rpm {config.GENAI_CONFIG['RATE_LIMIT_RPM']}"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = make_writer(args, Path(tmp) / "seq_cache.sqlite3")
+        elapsed, latencies = await run_sequential(writer, requests, use_cache=False)
+        report("sequential", elapsed, latencies, len(requests))
+
+        for concurrency in args.concurrency:
+            writer = make_writer(args, Path(tmp) / f"batch_{concurrency}.sqlite3")
+            elapsed, latencies = await run_batch(writer, requests, concurrency, use_cache=False)
+            report(f"batch x{concurrency}", elapsed, latencies, len(requests))
+
+        first_fields, totals = await run_stream(writer, requests[:args.stream_samples])
+        if first_fields:
+            print(
+                f"{'stream':>12} | first field {statistics.mean(first_fields):5.2f}s"
+                f" | full response {statistics.mean(totals):5.2f}s (mean of {len(first_fields)})"
+            )
+
+        elapsed, latencies = await run_batch(writer, requests, max(args.concurrency), use_cache=True)
+        report("cached", elapsed, latencies, len(requests))
+        print(f"response cache: {writer.response_cache.stats()}")
+        print(f"generation: {writer.generation_stats.per_100()}")
+        print(f"tokens: {writer.token_usage.summary()}")
+        writer.response_cache.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", type=int, default=24)
+    parser.add_argument("--titles", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[4, 8])
+    parser.add_argument("--latency", type=float, default=config.LOCAL_LLM_CONFIG["LATENCY_SECONDS"])
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--malformed-rate", type=float, default=0.05)
+    parser.add_argument("--rpm", type=float, default=6000)
+    parser.add_argument("--stream-samples", type=int, default=3)
+    args = parser.parse_args()
+
+    config.GENAI_CONFIG["RATE_LIMIT_RPM"] = args.rpm
+    config.GENAI_CONFIG["RATE_LIMIT_BURST"] = max(args.concurrency)
+    # 일시적 오류 재시도 대기를 짧게 (실제 대기 시간 대신 재시도 횟수를 보기 위함)
+    config.GENAI_CONFIG["BACKOFF_BASE"] = 0.05
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+릴스 프레임 생성 속도 벤치마크 (자막 제외, 인코딩 제외).
+
+사용법:
+    python -m benchmarks.reels_render
+    python -m benchmarks.reels_render --images 8 --frames 48
+    python -m benchmarks.reels_render --caption "여름엔 역시 린넨 원피스"
+
+- legacy: 기존 ReelsMaker 경로 (ImageClip.resize(lambda t) + crossfadein + concatenate_videoclips(compose))
+- renderer: KenBurnsRenderer (소스 1회 리사이즈 + 프레임마다 crop/scale + uint16 블렌딩)
+같은 프레임 시각들(전체 타임라인에 고르게 분포)에 대해 frames/sec와 두 경로의 평균 픽셀 차이를 출력함.
+--caption을 주면 SubtitleRenderer 자막 레이어 1회 생성 시간과 프레임당 합성 비용도 출력함.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import PIL.Image
+
+if not hasattr(PIL.Image, 'ANTIALIAS'):
+    PIL.Image.ANTIALIAS = PIL.Image.LANCZOS
+
+from moviepy.editor import ImageClip, concatenate_videoclips, CompositeVideoClip
+
+from src.video.frame_renderer import KenBurnsRenderer
+from src.video.subtitle import SubtitleRenderer
+
+
+def make_images(directory: str, n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    paths = []
+    for i in range(n):
+        # 상세페이지 이미지처럼 세로로 긴 이미지와 가로 이미지를 섞음
+        w, h = (860, 4000) if i % 2 == 0 else (1600, 1200)
+        y, x = np.mgrid[0:h, 0:w]
+        image = np.stack([(x * 255 // w), (y * 255 // h), ((x + y) % 256)], axis=-1).astype(np.uint8)
+        image[rng.integers(0, h, 2000), rng.integers(0, w, 2000)] = 255
+        path = os.path.join(directory, f"bench_{i}.jpg")
+        PIL.Image.fromarray(image).save(path, quality=90)
+        paths.append(path)
+    return paths
+
+
+def legacy_video(image_paths, width=1080, height=1920, duration=3.0, transition=0.5):
+    clips = []
+    for img_path in image_paths:
+        clip = ImageClip(img_path)
+        img_w, img_h = clip.size
+        if img_w / img_h > width / height:
+            clip = clip.resize(height=height)
+        else:
+            clip = clip.resize(width=width)
+        clip = clip.crop(x_center=clip.w / 2, y_center=clip.h / 2, width=width, height=height)
+        clip = clip.set_duration(duration)
+        clip = clip.resize(lambda t: 1 + 0.05 * (t / duration))
+        clip = clip.set_position(('center', 'center'))
+        clip = clip.crossfadein(transition)
+        clips.append(clip)
+    video = concatenate_videoclips(clips, method="compose", padding=-transition)
+    return CompositeVideoClip([video], size=(width, height))
+
+
+def timed(label, times, render):
+    start = time.perf_counter()
+    frames = [render(float(t)) for t in times]
+    elapsed = time.perf_counter() - start
+    print(f"{label:>10} | {len(times)} frames | {elapsed:7.2f}s | {len(times) / elapsed:7.2f} frames/s")
+    return frames, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--images", type=int, default=4)
+    parser.add_argument("--frames", type=int, default=24, help="측정할 프레임 수 (타임라인에서 고르게 추출)")
+    parser.add_argument("--caption", default="", help="자막 합성 비용 측정용 텍스트")
+    args = parser.parse_args()
+
+    renderer = KenBurnsRenderer()
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = make_images(tmp, args.images)
+        all_times = renderer.frame_times(len(paths))
+        times = all_times[np.linspace(0, len(all_times) - 1, args.frames).astype(int)]
+        print(f"{len(paths)} images, {len(all_times)} frames in full reel ({renderer.total_duration(len(paths)):.1f}s @ {renderer.fps}fps)")
+
+        start = time.perf_counter()
+        video = legacy_video(paths)
+        print(f"{'legacy':>10} | setup {time.perf_counter() - start:.2f}s")
+        legacy_frames, legacy_time = timed("legacy", times, video.get_frame)
+
+        start = time.perf_counter()
+        sources = [renderer.load_source(p) for p in paths]
+        print(f"{'renderer':>10} | setup {time.perf_counter() - start:.2f}s")
+        frames, new_time = timed("renderer", times, lambda t: renderer.frame_at(sources, t))
+
+    diffs = [np.abs(a.astype(np.int16) - b.astype(np.int16)).mean() for a, b in zip(legacy_frames, frames)]
+    print(f"speedup {legacy_time / new_time:.1f}x | mean abs pixel diff {np.mean(diffs):.2f} (max frame {np.max(diffs):.2f})")
+
+    if args.caption:
+        start = time.perf_counter()
+        overlay = SubtitleRenderer().overlay(args.caption, (renderer.width, renderer.height), top=renderer.height - 300)
+        setup = time.perf_counter() - start
+        start = time.perf_counter()
+        for frame in frames:
+            overlay.apply(frame)
+        per_frame = (time.perf_counter() - start) / len(frames)
+        print(f"{'caption':>10} | setup {setup * 1000:.1f}ms | {per_frame * 1000:.2f}ms/frame")
+
+
+if __name__ == "__main__":
+    main()
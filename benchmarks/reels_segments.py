@@ -0,0 +1,57 @@
+"""
+릴스 구간 병렬 렌더링 벤치마크 (ffmpeg 백엔드, 인코딩 포함).
+
+사용법:
+    python -m benchmarks.reels_segments
+    python -m benchmarks.reels_segments --images 8 --workers 4
+
+같은 이미지/자막으로 WORKERS=1(한 프로세스) 과 WORKERS=N(구간 병렬 + concat) 을 렌더링해
+걸린 시간과 두 결과의 프레임 수/프레임 시각(pts) 일치 여부를 출력함.
+"""
+import argparse
+import os
+import re
+import subprocess
+import tempfile
+import time
+
+from imageio_ffmpeg import get_ffmpeg_exe
+
+import config
+from benchmarks.reels_render import make_images
+from src.video.reels_maker import ReelsMaker
+
+
+def frame_pts(path: str):
+    result = subprocess.run(
+        [get_ffmpeg_exe(), "-i", path, "-vf", "showinfo", "-f", "null", "-"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    return re.findall(r"pts_time:([\d.]+)", result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--images", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--caption", default="여름엔 역시 린넨 원피스")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = make_images(tmp, args.images)
+        results, times = {}, {}
+        for workers in (1, args.workers):
+            config.REELS_CONFIG["WORKERS"] = workers
+            output = os.path.join(tmp, f"reels_w{workers}.mp4")
+            start = time.perf_counter()
+            ReelsMaker(backend="ffmpeg").make_reels(paths, args.caption, output)
+            times[workers] = time.perf_counter() - start
+            results[workers] = frame_pts(output)
+            print(f"workers {workers:>2} | {times[workers]:7.2f}s | {len(results[workers])} frames")
+
+    print(f"speedup {times[1] / times[args.workers]:.2f}x (cpu_count={os.cpu_count()})")
+    print(f"frame timing identical: {results[1] == results[args.workers]}")
+
+
+if __name__ == "__main__":
+    main()
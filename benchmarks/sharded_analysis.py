@@ -0,0 +1,76 @@
+"""
+ShardedKeywordExecutor 병렬 확장성 벤치마크.
+
+사용법:
+    python -m benchmarks.sharded_analysis
+    python -m benchmarks.sharded_analysis --titles 40000 --workers 1 2 4 8
+
+단일 프로세스 KeywordAnalyzer(캐시 없음) 대비 워커 수별 처리 시간과 속도 향상을 출력함.
+워커 풀 시작 시간(forkserver의 Kiwi preload 포함)은 처리 시간과 분리해서 표시.
+코어 수에 가까운 선형 확장을 기대하지만, 실행 환경의 물리 코어 수가 상한임.
+"""
+import argparse
+import os
+import random
+import time
+from collections import Counter
+
+from src.analyzer.keyword_analyzer import KeywordAnalyzer
+from src.analyzer.parallel import ShardedKeywordExecutor
+
+WORDS = [
+    "기모", "부츠컷", "슬랙스", "겨울", "바지", "밍크", "팬츠", "밴딩", "스판", "블랙", "하이웨스트",
+    "와이드", "니트", "가디건", "원피스", "롱", "코트", "자켓", "울", "캐시미어", "셔츠", "블라우스",
+    "체형커버", "모임룩", "하객룩", "엄마옷", "중년여성의류", "데일리", "오피스룩", "트위드", "플리츠",
+    "스커트", "린넨", "오버핏", "크롭", "빅사이즈", "베이직", "라운드", "브이넥", "터틀넥",
+]
+
+
+def make_titles(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(WORDS, k=rng.randint(5, 10))) + f" {rng.randint(1, 999)}호" for _ in range(n)]
+
+
+def serial_count(analyzer: KeywordAnalyzer, titles):
+    counts = Counter()
+    product_counts = Counter()
+    for title in titles:
+        extracted = analyzer._extract_keywords(title)
+        counts.update(extracted)
+        product_counts.update(set(extracted))
+    return counts, product_counts
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--titles", type=int, default=20000)
+    parser.add_argument("--workers", type=int, nargs="+", default=None)
+    parser.add_argument("--shard-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    cpu = os.cpu_count() or 1
+    worker_counts = args.workers or sorted({1, 2, 4, cpu} & set(range(1, cpu + 1)) | {1})
+    titles = make_titles(args.titles)
+    print(f"{len(titles):,} titles, {cpu} CPU(s)")
+
+    analyzer = KeywordAnalyzer(use_cache=False, phrase_top_n=0)
+    start = time.perf_counter()
+    expected = serial_count(analyzer, titles)
+    serial_time = time.perf_counter() - start
+    print(f"{'serial':>8} | {serial_time:8.2f}s | {'':>8} | speedup 1.00x")
+
+    for workers in worker_counts:
+        with ShardedKeywordExecutor(workers=workers, shard_size=args.shard_size) as executor:
+            executor._ensure_pool()
+            start = time.perf_counter()
+            result = executor.count_keywords(titles)
+            elapsed = time.perf_counter() - start
+            assert result == expected, "병렬 결과가 단일 프로세스 결과와 다릅니다"
+            print(
+                f"{workers:>6} w | {elapsed:8.2f}s | startup {executor.startup_seconds:5.2f}s "
+                f"({executor.start_method}) | speedup {serial_time / elapsed:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
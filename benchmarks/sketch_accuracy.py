@@ -0,0 +1,83 @@
+"""
+근사 키워드 집계(mode="approx") 정확도 리포트 (합성 상품명 토큰 코퍼스).
+
+사용법:
+    python -m benchmarks.sketch_accuracy
+    python -m benchmarks.sketch_accuracy --products 100000 --capacity 1000 --hll-precision 8
+
+Zipf 분포 토큰 코퍼스에서 KeywordScorer(정확 집계)와 ApproxKeywordCounter(스케치)를 비교함.
+- 상위 k 재현율: 정확 집계 Top k 키워드 중 근사 Top k에 포함된 비율
+- 등장횟수 / 관련_상품수 / 쇼핑몰수 / 가중점수 평균 상대 오차 (근사 Top k 기준)
+- 스케치 메모리 (입력 크기와 무관) vs 정확 집계 키워드 수
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.analyzer.keyword_scoring import KeywordScorer
+from src.analyzer.sketches import ApproxKeywordCounter
+
+
+def make_corpus(products: int, vocab_size: int = 50000, n_stores: int = 3000, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    vocab = np.array([f"키워드{i}" for i in range(vocab_size)], dtype=object)
+    # 상품명당 키워드 3~12개, Zipf 분포 (소수 키워드에 쏠림 + 긴 꼬리)
+    lengths = rng.integers(3, 13, size=products)
+    ids = np.minimum(rng.zipf(1.2, size=lengths.sum()) - 1, vocab_size - 1)
+    bounds = np.concatenate([[0], np.cumsum(lengths)])
+    token_lists = [list(vocab[ids[bounds[i]:bounds[i + 1]]]) for i in range(products)]
+    prices = rng.lognormal(10.5, 0.6, size=products).round(-2)
+    stores = [f"쇼핑몰{s}" for s in np.minimum(rng.zipf(1.5, size=products), n_stores)]
+    ranks = (np.arange(products) % 40) + 1
+    return token_lists, ranks, prices, stores
+
+
+def relative_error(approx: pd.Series, exact: pd.Series) -> float:
+    return float(np.mean(np.abs(approx - exact) / np.maximum(exact, 1)))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", type=int, default=50_000)
+    parser.add_argument("--top", type=int, default=30)
+    parser.add_argument("--capacity", type=int, default=None)
+    parser.add_argument("--epsilon", type=float, default=None)
+    parser.add_argument("--delta", type=float, default=None)
+    parser.add_argument("--hll-precision", type=int, default=None)
+    args = parser.parse_args()
+
+    print(f"Generating synthetic corpus ({args.products:,} products)...")
+    token_lists, ranks, prices, stores = make_corpus(args.products)
+
+    scorer = KeywordScorer()
+    started = time.perf_counter()
+    exact = scorer.score(token_lists, ranks, prices, stores)
+    exact_time = time.perf_counter() - started
+
+    counter = ApproxKeywordCounter(
+        capacity=args.capacity, epsilon=args.epsilon, delta=args.delta, hll_precision=args.hll_precision,
+        store_diversity_power=scorer.store_diversity_power,
+    )
+    started = time.perf_counter()
+    counter.update(token_lists, scorer.product_weights(len(token_lists), ranks, prices), stores)
+    approx = counter.top(args.top)
+    approx_time = time.perf_counter() - started
+
+    exact_top = exact.head(args.top)
+    recall = len(set(exact_top['키워드']) & set(approx['키워드'])) / max(len(exact_top), 1)
+    merged = approx.merge(exact, on='키워드', suffixes=('_approx', '_exact'))
+
+    print(f"\nexact : {len(exact):,} keywords, {exact_time:.2f}s")
+    print(f"approx: {counter.error_bounds()}, {approx_time:.2f}s")
+    print(f"\nTop {args.top} recall: {recall:.3f}")
+    for column in ['등장횟수', '관련_상품수', '쇼핑몰수', '가중점수']:
+        error = relative_error(merged[f'{column}_approx'], merged[f'{column}_exact'])
+        print(f"{column:>8} mean relative error: {error:.4f}")
+    overestimated = (merged['등장횟수_approx'] >= merged['등장횟수_exact']).mean()
+    print(f"등장횟수 >= 정확값 비율 (Count-Min 보장): {overestimated:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+analyze_tags 벡터화 파이프라인 벤치마크 (합성 태그 컬럼 최대 100만 행).
+
+사용법:
+    python -m benchmarks.tag_analysis
+    python -m benchmarks.tag_analysis --rows 1000000 --legacy-max 200000
+
+행 수를 2배씩 늘리면서 벡터화 파이프라인(explode_tags + tag_frequency)과
+기존 행 단위 Python 루프의 행당 처리 시간을 비교함. 행당 시간이 일정하면 선형 확장.
+"""
+import argparse
+import time
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from src.analyzer.tag_analysis import explode_tags, tag_frequency
+
+
+def make_tag_column(rows: int, vocab_size: int = 5000, seed: int = 0) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    vocab = np.array([f"#태그{i}" for i in range(vocab_size)], dtype=object)
+    # 태그 수: 0~10개, 태그 분포: Zipf (실제 판매자 태그처럼 소수 태그에 쏠림)
+    counts = rng.integers(0, 11, size=rows)
+    ids = np.minimum(rng.zipf(1.3, size=counts.sum()) - 1, vocab_size - 1)
+    words = vocab[ids]
+    bounds = np.concatenate([[0], np.cumsum(counts)])
+    return pd.Series([" ".join(words[bounds[i]:bounds[i + 1]]) for i in range(rows)])
+
+
+def legacy_count(tags: pd.Series):
+    """
+    기존 analyze_tags의 행 단위 루프 (+ 비교용 상품 수 집계)
+    """
+    tag_counts = Counter()
+    product_counts = Counter()
+    for tags_str in tags.dropna().astype(str):
+        if not tags_str.strip():
+            continue
+        row_tags = set()
+        for tag in tags_str.split():
+            clean_tag = tag.strip()
+            if clean_tag.startswith("#"):
+                tag_counts[clean_tag] += 1
+                row_tags.add(clean_tag)
+        product_counts.update(row_tags)
+    return tag_counts, product_counts
+
+
+def vectorized_count(tags: pd.Series) -> pd.DataFrame:
+    return tag_frequency(explode_tags(tags))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--legacy-max", type=int, default=250_000, help="기존 루프는 이 행 수까지만 측정")
+    args = parser.parse_args()
+
+    print(f"Generating synthetic tag column ({args.rows:,} rows)...")
+    full = make_tag_column(args.rows)
+
+    sizes = []
+    n = max(args.rows // 8, 1)
+    while n < args.rows:
+        sizes.append(n)
+        n *= 2
+    sizes.append(args.rows)
+
+    print(f"{'rows':>10} | {'vectorized(s)':>13} | {'us/row':>7} | {'legacy(s)':>9} | {'us/row':>7}")
+    print("-" * 60)
+    for size in sizes:
+        tags = full.iloc[:size].reset_index(drop=True)
+        vec_time, table = timed(vectorized_count, tags)
+        legacy_cell = f"{'-':>9} | {'-':>7}"
+        if size <= args.legacy_max:
+            legacy_time, (counter, product_counter) = timed(legacy_count, tags)
+            legacy_cell = f"{legacy_time:9.3f} | {legacy_time / size * 1e6:7.2f}"
+            # 결과 일치 확인
+            assert dict(zip(table['태그명'], table['사용_빈도'])) == dict(counter)
+            assert dict(zip(table['태그명'], table['관련_상품수'])) == dict(product_counter)
+        print(f"{size:>10,} | {vec_time:13.3f} | {vec_time / size * 1e6:7.2f} | {legacy_cell}")
+
+
+if __name__ == "__main__":
+    main()
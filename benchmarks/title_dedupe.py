@@ -0,0 +1,105 @@
+"""
+MinHash/LSH 상품명 중복 제거 벤치마크 (합성 상품명 최대 20만 개).
+
+사용법:
+    python -m benchmarks.title_dedupe
+    python -m benchmarks.title_dedupe --titles 200000 --threshold 0.8
+
+원본 상품명마다 0~3개의 변형(띄어쓰기 변경, 수식어 추가, 단어 교체)을 심은 코퍼스에서
+제목 수를 2배씩 늘리며 처리 시간(선형에 가까운지)과 클러스터링 정확도를 측정함.
+- 재현율: 심어 둔 변형 중 원본과 같은 클러스터로 묶인 비율 (변형 종류별)
+- 오병합: 서로 다른 원본이 같은 클러스터로 묶인 원본 비율
+"""
+import argparse
+import time
+
+import numpy as np
+
+from src.analyzer.dedupe import TitleDeduper
+
+WORDS = (
+    "겨울 여름 봄 가을 기모 린넨 니트 울 캐시미어 면 데님 부츠컷 와이드 스트레이트 슬림 "
+    "오버핏 크롭 롱 미디 미니 슬랙스 팬츠 원피스 셔츠 블라우스 가디건 자켓 코트 스커트 "
+    "밴딩 하이웨스트 루즈핏 세미 정장 데일리 오피스 베이직 플리츠 체크 스트라이프 "
+    "블랙 아이보리 베이지 네이비 그레이 차콜 브라운 카키"
+).split()
+MODIFIERS = ["빅사이즈", "당일발송", "신상", "1+1", "무료배송", "특가"]
+# 변형 종류: 띄어쓰기 제거 / 수식어 추가는 같은 상품, 단어 교체는 (임계값에 따라) 다른 상품일 수 있음
+VARIANT_KINDS = ["spacing", "modifier", "swap"]
+
+
+def make_titles(n_titles: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    titles, origins, kinds = [], [], []
+    origin = 0
+    while len(titles) < n_titles:
+        base = list(rng.choice(WORDS, size=rng.integers(5, 9), replace=False)) + [f"{rng.integers(1000, 9999)}"]
+        titles.append(" ".join(base))
+        origins.append(origin)
+        kinds.append(-1)
+        for _ in range(rng.integers(0, 4)):
+            variant = list(base)
+            kind = rng.integers(0, 3)
+            if kind == 0:
+                # 띄어쓰기 한 곳 제거
+                i = rng.integers(0, len(variant) - 1)
+                variant[i:i + 2] = [variant[i] + variant[i + 1]]
+            elif kind == 1:
+                variant.append(str(rng.choice(MODIFIERS)))
+            else:
+                variant[rng.integers(0, len(variant))] = str(rng.choice(WORDS))
+            titles.append(" ".join(variant))
+            origins.append(origin)
+            kinds.append(kind)
+        origin += 1
+    return titles[:n_titles], np.asarray(origins[:n_titles]), np.asarray(kinds[:n_titles])
+
+
+def accuracy(labels: np.ndarray, origins: np.ndarray, kinds: np.ndarray):
+    # 각 원본의 첫 상품명 클러스터와 변형의 클러스터가 같으면 재현 (변형 종류별)
+    _, first = np.unique(origins, return_index=True)
+    origin_label = np.empty(origins.max() + 1, dtype=np.int64)
+    origin_label[origins[first]] = labels[first]
+    same = labels == origin_label[origins]
+    recalls = [float(same[kinds == kind].mean()) if (kinds == kind).any() else 1.0 for kind in range(len(VARIANT_KINDS))]
+    # 원본 대표 상품명끼리 같은 클러스터면 오병합
+    merged = len(first) - len(np.unique(labels[first]))
+    return recalls, merged / len(first)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--titles", type=int, default=200_000)
+    parser.add_argument("--threshold", type=float, default=None)
+    args = parser.parse_args()
+
+    print(f"Generating synthetic titles ({args.titles:,})...")
+    all_titles, all_origins, all_kinds = make_titles(args.titles)
+    deduper = TitleDeduper(threshold=args.threshold)
+    print(f"threshold={deduper.threshold}, num_perm={deduper.num_perm}, bands={deduper.bands} x rows={deduper.rows}")
+
+    sizes = []
+    n = max(args.titles // 8, 1)
+    while n < args.titles:
+        sizes.append(n)
+        n *= 2
+    sizes.append(args.titles)
+
+    recall_header = " | ".join(f"{kind:>8}" for kind in VARIANT_KINDS)
+    print(f"{'titles':>9} | {'seconds':>8} | {'us/title':>8} | {'clusters':>9} | {recall_header} | {'false merge':>11}")
+    print("-" * (58 + 11 * len(VARIANT_KINDS)))
+    for size in sizes:
+        titles, origins, kinds = all_titles[:size], all_origins[:size], all_kinds[:size]
+        start = time.perf_counter()
+        labels = deduper.cluster(titles)
+        elapsed = time.perf_counter() - start
+        recalls, false_merge = accuracy(labels, origins, kinds)
+        recall_cells = " | ".join(f"{recall:8.3f}" for recall in recalls)
+        print(
+            f"{size:>9,} | {elapsed:8.2f} | {elapsed / size * 1e6:8.1f} | {len(np.unique(labels)):>9,} | "
+            f"{recall_cells} | {false_merge:11.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Tokenizer 상품명당 처리 비용 마이크로벤치마크.
+
+사용법:
+    python -m benchmarks.tokenizer
+    python -m benchmarks.tokenizer --titles 20000 --preset analyzer --batch-size 256
+
+같은 합성 상품명에 대해 상품명당 시간(us/title)을 비교함.
+- legacy: 기존 KeywordAnalyzer._extract_keywords (kiwi.analyze + 튜플 언패킹 + 조건 분기)
+- tokenize: Tokenizer.tokenize를 상품명마다 호출
+- iter_tokenize: 스트리밍 API (Kiwi 배치 분석, 캐시 없음)
+- cached: 임시 토큰 캐시를 채운 뒤 다시 iter_tokenize (모두 캐시 히트)
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from src.extractor.token_cache import TokenCache
+from src.extractor.tokenizer import Tokenizer, shared_kiwi
+
+from benchmarks.sharded_analysis import make_titles
+
+
+def legacy_extract(kiwi, pos_tags, min_length, stopwords, text):
+    keywords = []
+    for tokens in kiwi.analyze(text):
+        for token, tag, _, _ in tokens[0]:
+            if tag in pos_tags:
+                if len(token) >= min_length and token not in stopwords:
+                    keywords.append(token)
+    return keywords
+
+
+def timed(label, n, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:>14} | {elapsed:7.2f}s | {elapsed / n * 1e6:8.1f} us/title")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--titles", type=int, default=10000)
+    parser.add_argument("--preset", default="analyzer")
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    titles = make_titles(args.titles)
+    kiwi = shared_kiwi()
+    tokenizer = Tokenizer.from_preset(args.preset, kiwi=kiwi, use_cache=False)
+    # 워밍업 (Kiwi 내부 초기화 비용 제외)
+    tokenizer.tokenize_many(titles[:100])
+    print(f"{len(titles):,} titles, preset={args.preset}, pos={sorted(tokenizer.pos_tags)}")
+
+    pos_tags = tuple(tokenizer.pos_tags)
+    stopwords = set(tokenizer.stopwords)
+    legacy = timed("legacy", len(titles), lambda: [
+        legacy_extract(kiwi, pos_tags, tokenizer.min_length, stopwords, t) for t in titles
+    ])
+    single = timed("tokenize", len(titles), lambda: [tokenizer.tokenize(t) for t in titles])
+    streamed = timed("iter_tokenize", len(titles), lambda: list(tokenizer.iter_tokenize(titles, args.batch_size)))
+    assert legacy == single == streamed
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tokenizer.cache = TokenCache(tokenizer.fingerprint, db_path=Path(tmp) / "bench_cache.sqlite3")
+        tokenizer.tokenize_many(titles, args.batch_size)
+        cached = timed("cached", len(titles), lambda: list(tokenizer.iter_tokenize(titles, args.batch_size)))
+        print(f"cache: {tokenizer.cache.stats()}")
+        tokenizer.cache.close()
+    assert cached == legacy
+
+
+if __name__ == "__main__":
+    main()
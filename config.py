@@ -5,10 +5,12 @@ BASE_DIR = Path(__file__).parent
 DATA_DIR = BASE_DIR / "data"
 RAW_DATA_DIR = DATA_DIR / "raw"
 REPORTS_DIR = DATA_DIR / "reports"
+CACHE_DIR = DATA_DIR / "cache"
 
 # Ensure directories exist
 RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
 REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 # URLs
 URLS = {
@@ -60,4 +62,168 @@ SETTINGS = {
 GENAI_CONFIG = {
     "MODEL_NAME": "gemini-2.5-flash",
     "API_KEY_ENV": "GOOGLE_API_KEY",
+    # LLM 백엔드: "gemini" (실제 API) / "local" (오프라인 대역, LOCAL_LLM_CONFIG). 환경변수로 덮어쓸 수 있음
+    "BACKEND": "gemini",
+    "BACKEND_ENV": "JOPS_LLM_BACKEND",
+    # 배치 생성 동시 요청 수 상한
+    "MAX_CONCURRENCY": 4,
+    # 클라이언트 측 속도 제한 (API 할당량에 맞춤: 분당 요청 수, 순간 허용량)
+    "RATE_LIMIT_RPM": 10,
+    "RATE_LIMIT_BURST": 2,
+    # 일시적 오류(429/503/timeout) 재시도: 지터 지수 백오프 (초)
+    "MAX_RETRIES": 4,
+    "BACKOFF_BASE": 1.0,
+    "BACKOFF_MAX": 30.0,
+    # 응답 JSON 스키마 강제 (response_mime_type + response_schema)
+    "STRUCTURED_OUTPUT": True,
+    # 빠지거나 깨진 필드만 다시 요청하는 횟수
+    "FIELD_RETRIES": 1,
+    # 페르소나(system_instruction)를 서버 측 컨텍스트 캐시로 재사용 (모델별 최소 토큰 수 이상이어야 생성됨)
+    "CONTEXT_CACHE": False,
+    "CONTEXT_CACHE_TTL": 3600,
+}
+
+# Local LLM Config (Gemini 로컬 대역, src/writer/local_model.py)
+LOCAL_LLM_CONFIG = {
+    # 첫 응답까지 지연 (초) 및 ± 편차
+    "LATENCY_SECONDS": 1.5,
+    "LATENCY_JITTER": 0.3,
+    # 출력 생성 속도 (스트리밍 청크 도착 간격에 반영)
+    "TOKENS_PER_SECOND": 150,
+    # 일시적 오류(503) / 잘린 JSON 응답 비율
+    "ERROR_RATE": 0.0,
+    "MALFORMED_RATE": 0.0,
+    "STREAM_CHUNK_CHARS": 32,
+    "SEED": 0,
+}
+
+# Title Scorer Config (상품명 후보 로컬 SEO 점수, src/writer/title_scorer.py)
+TITLE_SCORER_CONFIG = {
+    # 한 번의 요청으로 받을 상품명 후보 수 (1이면 후보를 요청하지 않음)
+    "CANDIDATES": 5,
+    # 키워드 리포트 상위 N개를 가중점수로 사용
+    "TOP_KEYWORDS": 30,
+    # 네이버 스마트스토어 권장 상품명 길이 (자)
+    "MAX_LENGTH": 50,
+    "MIN_LENGTH": 15,
+    # SEO점수 = COVERAGE x 커버리지 - LENGTH x 길이 감점 - STOPWORD x 불용어 수 - DUPLICATE x 반복 수
+    "WEIGHTS": {"COVERAGE": 1.0, "LENGTH": 0.5, "STOPWORD": 0.1, "DUPLICATE": 0.05},
+}
+
+# Image Prep Config (Gemini 멀티모달 요청 이미지 전처리, src/writer/image_prep.py)
+IMAGE_PREP_CONFIG = {
+    "ENABLED": True,
+    # 요청당 첨부 이미지 수
+    "MAX_IMAGES": 5,
+    # 모델 유효 입력 해상도: 긴 변 / 총 픽셀 수 상한 (768x768 타일 4장 분량)
+    "MAX_SIDE": 3072,
+    "MAX_PIXELS": 768 * 768 * 4,
+    "JPEG_QUALITY": 85,
+    # 축소가 필요 없고 이 크기 이하인 지원 형식 이미지는 재인코딩하지 않음 (bytes)
+    "PASSTHROUGH_BYTES": 300 * 1024,
+    # "first": 앞에서부터 MAX_IMAGES장 / "informative": 정보량(밝기 엔트로피)이 큰 순으로 선택
+    "SELECT": "informative",
+}
+
+# Tokenizer Config (상품명 형태소 분석 공통 엔진, src/extractor/tokenizer.py)
+TOKENIZER_CONFIG = {
+    # 불용어 목록 (판매 유도 문구, 배송 관련 등). preset이 이름으로 골라 씀
+    "STOPWORDS": {
+        # 키워드 분석 / 상품명 SEO 점수
+        "analyzer": [
+            '무료배송', '할인', '특가', '당일발송', '당일', '출고', '기획', '세일',
+            '공구', '이벤트', '증정', '사은품', '프로모션', '쿠폰', '혜택',
+            '한정수량', '신상', '국내생산', '자체제작', '빅사이즈',
+            '여성', '여자', '남자', '남성', '무료', '배송', '도착', '보장',
+            '추천', '인기', '공식', '정품', '세트', '1+1', '2+1',
+        ],
+        # 키워드 빈도 추출기 (분석기보다 좁은 목록: '추천', '정품' 등은 빈도에 남김)
+        "extractor": [
+            '무료배송', '할인', '특가', '당일발송', '기획', '세일',
+            '공구', '이벤트', '증정', '사은품', '프로모션',
+            '한정수량', '신상', '국내생산', '자체제작', '빅사이즈',
+            '여성', '여자', '남자', '남성', '무료', '배송',
+        ],
+    },
+    # 호출부별 필터 (품사, 최소 길이, 불용어 목록 이름(None이면 사용 안 함), 받침 정규화)
+    "PRESETS": {
+        # 키워드 분석: 명사 + 외국어(브랜드/영문 키워드)
+        "analyzer": {"POS_TAGS": ["NNG", "NNP", "SL"], "MIN_LENGTH": 2, "STOPWORDS": "analyzer", "NORMALIZE_CODA": False},
+        # 키워드 빈도 추출기: 명사만
+        "extractor": {"POS_TAGS": ["NNG", "NNP"], "MIN_LENGTH": 2, "STOPWORDS": "extractor", "NORMALIZE_CODA": False},
+        # 스크래퍼 태그 Fallback: 어근(XR)까지 포함, 불용어는 분석 단계에서 처리
+        "scraper_tags": {"POS_TAGS": ["NNG", "NNP", "SL", "XR"], "MIN_LENGTH": 2, "STOPWORDS": None, "NORMALIZE_CODA": True},
+    },
+}
+
+# AI Copy Response Cache Config (같은 입력이면 Gemini를 다시 호출하지 않음)
+COPY_CACHE_CONFIG = {
+    "ENABLED": True,
+    "PATH": CACHE_DIR / "copy_cache.sqlite3",
+    # 7일이 지난 응답은 다시 생성
+    "TTL_SECONDS": 7 * 24 * 3600,
+    "MAX_ENTRIES": 2000,
+}
+
+# Token Cache Config (상품명 형태소 분석 결과 캐시)
+TOKEN_CACHE_CONFIG = {
+    "ENABLED": True,
+    "PATH": CACHE_DIR / "token_cache.sqlite3",
+    "MAX_ENTRIES": 200000,
+}
+
+# Analytics Store Config (전체 수집 이력 누적 저장소)
+STORE_CONFIG = {
+    "ENABLED": True,
+    "PATH": DATA_DIR / "jops_store.sqlite3",
+    # 상품명 키워드 -> 상품 posting 역색인을 수집마다 증분 갱신 (src/storage/inverted_index.py)
+    "INDEX_ENABLED": True,
+}
+
+# Keyword Scoring Config (순위/가격/쇼핑몰 다양성 가중 점수)
+SCORING_CONFIG = {
+    # 순위 가중치: 1 / log2(순위 + 1) (1위 = 1.0, 20위 ≈ 0.23)
+    "RANK_DECAY": "log",
+    # 가격 분위 구간 수와 구간별 가중치 (저가 -> 고가). 쥴리씨는 고단가 포지션이라 고가 구간을 우대
+    "PRICE_BANDS": 4,
+    "PRICE_BAND_WEIGHTS": [0.9, 1.0, 1.1, 1.2],
+    # (쇼핑몰수 / 관련_상품수) ** power : 한 쇼핑몰이 도배한 키워드는 감점
+    "STORE_DIVERSITY_POWER": 0.5,
+}
+
+# Approximate Keyword Counting Config (고정 메모리 heavy-hitter 집계, KeywordAnalyzer mode="approx")
+SKETCH_CONFIG = {
+    # 기본 집계 모드: "exact" (희소 행렬 전체 집계) / "approx" (스케치 근사)
+    "MODE": "exact",
+    # SpaceSaving이 추적하는 상위 키워드 후보 수
+    "CAPACITY": 2000,
+    # Count-Min: 등장횟수 오차 <= EPSILON x 전체 토큰 수 (확률 1 - DELTA)
+    "EPSILON": 0.0005,
+    "DELTA": 0.01,
+    # HyperLogLog 레지스터 2^p개: 관련 상품수/쇼핑몰수 상대 오차 ≈ 1.04 / sqrt(2^p)
+    "HLL_PRECISION": 10,
+    # 근사 모드에서 한 번에 토큰화해 스케치에 반영하는 상품 수 (토큰 메모리 상한)
+    "BATCH_SIZE": 2000,
+}
+
+# Near-duplicate Title Dedupe Config (MinHash + LSH, 같은 상품을 거의 같은 상품명으로 여러 번 올린 경우 1회만 집계)
+DEDUPE_CONFIG = {
+    "ENABLED": True,
+    # 문자 n-gram Jaccard 유사도 기준 (이상이면 같은 상품으로 봄)
+    "THRESHOLD": 0.8,
+    "NUM_PERM": 128,
+    "SHINGLE_SIZE": 3,
+}
+
+# Reels Config (src/video/reels_maker.py)
+REELS_CONFIG = {
+    # "ffmpeg": 프레임을 ffmpeg stdin 파이프로 직접 인코딩 / "moviepy": VideoClip + write_videofile
+    "BACKEND": "ffmpeg",
+    # libx264 인코딩 속도/화질 타협, 인코더 스레드 수
+    "PRESET": "medium",
+    "THREADS": 4,
+    # ffmpeg 백엔드에서 이미지 단위 구간을 나눠 인코딩할 프로세스 수 (None: CPU 코어 수, 1: 한 프로세스에서 순서대로)
+    "WORKERS": None,
+    # 소스 이미지 1장 디코딩 버퍼 상한 (MB). JPEG는 축소 디코딩으로 맞추고, 그래도 넘으면 해당 이미지를 건너뜀
+    "MAX_DECODE_MB": 128,
 }
@@ -8,14 +8,33 @@ from pathlib import Path
 from datetime import datetime
 from bs4 import BeautifulSoup 
 from src.scraper.naver_shopping_scraper import NaverShoppingScraper
-from src.analyzer.keyword_analyzer import KeywordAnalyzer
+from src.analyzer.keyword_analyzer import KeywordAnalyzer, products_to_frame, phrase_report_path
+from src.storage.artifact_writer import ArtifactWriter
+from src.storage.scrape_store import ScrapeStore
+from src.storage.inverted_index import KeywordIndex
 from src.writer.ai_copywriter import AICopywriter
+from src.writer.title_scorer import TitleScorer
 import config
 import json
 from src.scraper.product_fetcher import ProductDataFetcher
 from src.video.reels_maker import ReelsMaker
 
 
+def persist_snapshot(keyword, df, captured_at, source, keyword_report, tag_report, analyzer):
+    """
+    저장소 스냅샷 추가 + 키워드 역색인 증분 갱신 (ArtifactWriter 스레드에서 실행).
+    저장소 연결을 이 작업 안에서 열고 닫아 메인 스레드와 같은 연결을 동시에 쓰지 않음
+    """
+    store = ScrapeStore()
+    try:
+        store.append_snapshot(keyword, df, captured_at, source, keyword_report, tag_report)
+        # 토큰은 캐시에서 재사용하므로 방금 분석한 상품명은 Kiwi를 다시 돌리지 않음
+        if config.STORE_CONFIG["INDEX_ENABLED"]:
+            KeywordIndex(store, analyzer).update(keyword)
+    finally:
+        store.close()
+
+
 async def main():
     print("=== J-Ops SEO Sniper ===")
     print("1. 검색 키워드 직접 입력")
@@ -75,37 +94,21 @@ async def main():
     scraper = NaverShoppingScraper(headless=False) # Headless False to avoid blocking
     products = await scraper.search(keyword)
     
-    result_filename = ""
-    
-    if products:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        result_filename = config.RAW_DATA_DIR / f"results_{timestamp}.csv"
-        
-        # 상품 리스트 데이터 구성
-        data = []
-        for idx, product in enumerate(products, 1):
-            data.append({
-                '순위': idx,
-                '상품명': product.title,
-                '가격': product.price,
-                '쇼핑몰명': product.store_name,
-                'URL': product.url,
-                'is_ad': product.is_ad,
-                '판매자_설정_태그': product.tags
-            })
-        
-        df = pd.DataFrame(data)
-        columns = ['순위', '상품명', '가격', '쇼핑몰명', '판매자_설정_태그', 'URL', 'is_ad']
-        df = df[columns]
-        df.to_csv(result_filename, index=False, encoding="utf-8-sig")
-        print(f"\n[Step 1 완료] 수집된 데이터: {len(products)}건 -> {result_filename}")
-    else:
+    if not products:
         print("상품을 찾을 수 없습니다.")
         return
 
-    # -------------------------------------------------------------
-    # Step 2: Keyword Analysis
-    # -------------------------------------------------------------
+    # 산출물(CSV/JSON)은 백그라운드에서 저장하고, 단계 간에는 메모리 객체를 그대로 넘김
+    artifact_writer = ArtifactWriter()
+    captured_at = datetime.now()
+    timestamp = captured_at.strftime("%Y%m%d_%H%M%S")
+    result_filename = config.RAW_DATA_DIR / f"results_{timestamp}.csv"
+
+    # 상품 리스트 데이터 구성
+    df = products_to_frame(products)
+    artifact_writer.write_csv(df, result_filename)
+    print(f"\n[Step 1 완료] 수집된 데이터: {len(products)}건 -> {result_filename}")
+
     # -------------------------------------------------------------
     # Step 2: Keyword Analysis
     # -------------------------------------------------------------
@@ -113,57 +116,61 @@ async def main():
     
     analyzer = KeywordAnalyzer()
     
-    # Generate timestamped report filename to avoid Permission denied errors
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S") # Re-generate or reuse? 
-    # Better to match the result filename if possible, but simpler to just generate new one or extract from filename
-    # Let's extract from result_filename to keep them paired: results_2025... -> keyword_report_2025...
-    
-    
-    report_filename = "keyword_report.csv" # default fallback
-    
-    # We work with Path objects now
-    result_path_obj = result_filename if isinstance(result_filename, Path) else Path(result_filename)
-    base_name = result_path_obj.name
+    # 보고서 파일명은 results 파일과 같은 timestamp를 사용해 짝을 맞춤 (results_... -> keyword_report_...)
+    report_path = config.REPORTS_DIR / f"keyword_report_{timestamp}.csv"
     
-    if base_name.startswith("results_"):
-        report_base = base_name.replace("results_", "keyword_report_")
-    else:
-        report_base = f"keyword_report_{timestamp}.csv"
-        
-    report_filename = config.REPORTS_DIR / report_base
-
-    report_path = analyzer.analyze_file(str(result_filename), output_path=str(report_filename))
+    try:
+        keyword_report = analyzer.build_keyword_report(df)
+    except Exception as e:
+        print(f"Error during analysis: {e}")
+        keyword_report = None
     
-    if report_path:
+    if keyword_report is not None:
+        artifact_writer.write_csv(keyword_report.table, report_path)
+        if not keyword_report.phrases.empty:
+            artifact_writer.write_csv(keyword_report.phrases, phrase_report_path(report_path))
         print(f"[Step 2 완료] 분석 리포트: {report_path}")
         
         # -------------------------------------------------------------
         # Step 3: Tag Analysis
         # -------------------------------------------------------------
         print("\n[Step 3 시작] 태그 분석 중...")
-        tag_report_base = "tag_report.csv"
-        if base_name.startswith("results_"):
-             tag_report_base = base_name.replace("results_", "tag_report_")
+        tag_report_path = config.REPORTS_DIR / f"tag_report_{timestamp}.csv"
+        
+        try:
+            tag_report = analyzer.build_tag_report(df, keyword_report)
+        except Exception as e:
+            print(f"Error during tag analysis: {e}")
+            tag_report = None
+        
+        if tag_report is not None:
+            artifact_writer.write_csv(tag_report.table, tag_report_path)
+            print(f"[Step 3 완료] 태그 리포트: {tag_report_path}")
         else:
-             tag_report_base = f"tag_report_{timestamp}.csv"
-             
-        tag_report_filename = config.REPORTS_DIR / tag_report_base
+            tag_report_path = ""
         
-        tag_report_path = analyzer.analyze_tags(str(result_filename), output_path=str(tag_report_filename))
-        if tag_report_path:
-             print(f"[Step 3 완료] 태그 리포트: {tag_report_path}")
+        # 수집 결과 + 리포트를 누적 분석 저장소에 스냅샷으로 추가 (백그라운드)
+        if config.STORE_CONFIG["ENABLED"]:
+            artifact_writer.submit(
+                persist_snapshot, keyword, df, captured_at, f"run:{timestamp}", keyword_report, tag_report, analyzer
+            )
         
         # Final Output: Top 10 Keywords + Mention Tags
         try:
-            report_df = pd.read_csv(report_path)
             print("\n" + "="*40)
             print(f"📢 '{keyword}' 관련 추천 황금 키워드 TOP 10")
             print("="*40)
             
-            top_10 = report_df.head(10)
+            top_10 = keyword_report.head(10)
             for idx, row in top_10.iterrows():
-                print(f"{row['순위']}. {row['키워드']} (등장: {row['등장횟수']}회, 관련상품: {row['관련_상품수']}개)")
+                print(f"{row['순위']}. {row['키워드']} (등장: {row['등장횟수']}회, 관련상품: {row['관련_상품수']}개, 쇼핑몰: {row['쇼핑몰수']}곳, 점수: {row['가중점수']:.2f})")
             print("="*40)
+            
+            if not keyword_report.phrases.empty:
+                print(f"🔗 복합 키워드 TOP 5")
+                for _, row in keyword_report.phrases.head(5).iterrows():
+                    print(f"{row['순위']}. {row['복합키워드']} (관련상품: {row['관련_상품수']}개, PMI: {row['PMI']:.2f})")
+                print("="*40)
             print(f"※ 상세 데이터: {result_filename}")
             print(f"※ 키워드 보고서: {report_path}")
             print(f"※ 태그 보고서: {tag_report_path}")
@@ -172,15 +179,26 @@ async def main():
             # Step 4: AI Copywriting
             # -------------------------------------------------------------
             print("\n[Step 4 시작] AI 상품 원고 생성 중...")
+            copy_result = None
+            reels_task = None
+
+            def render_reels(subtitle_text):
+                # 너무 길면 자막이 잘릴 수 있으므로 20자 내외로 자르거나, ReelsMaker가 처리하게 둠.
+                # SubtitleRenderer가 화면 너비에 맞춰 자동 줄바꿈함.
+                maker = ReelsMaker()
+
+                # 저장 경로
+                reels_filename = config.DATA_DIR / "reels" / f"reels_{timestamp}.mp4"
+
+                # 이미지 갯수 제한 (너무 길어지지 않게 상위 8장)
+                start_imgs = product_image_paths[:8]
+
+                return maker.make_reels(start_imgs, subtitle_text, str(reels_filename))
+
             try:
                 # Prepare data for AI
-                top_10 = report_df.head(10)
-                extracted_keywords = top_10['키워드'].tolist()
-                
-                extracted_tags = []
-                if tag_report_path and os.path.exists(tag_report_path):
-                    tag_df = pd.read_csv(tag_report_path)
-                    extracted_tags = tag_df.head(10)['태그명'].tolist()
+                extracted_keywords = keyword_report.top_keywords(10)
+                extracted_tags = tag_report.top_tags(10) if tag_report is not None else []
                 
                 # Initialize Writer
                 writer = AICopywriter()
@@ -191,19 +209,32 @@ async def main():
                 
                 my_product_name = locals().get('product_title', keyword)
                 #print(f"※ 이미지 갯수: {len(product_image_paths)}")
-                copy_result = writer.generate_copy(
+                # 스트리밍: 필드가 완성되는 대로 받고, catch_phrase가 나오면 원고 나머지를 기다리지 않고 릴스 렌더링 시작
+                copy_result = {}
+                async for field, value in writer.stream_copy_async(
                     product_name=my_product_name, # My actual product name
                     keywords=extracted_keywords,
                     tags=extracted_tags,
                     image_paths=product_image_paths, # Pass the full list of downloaded images
-                    target_keyword=keyword # The keyword I want to rank for
-                )
+                    target_keyword=keyword, # The keyword I want to rank for
+                    keyword_weights=TitleScorer.weights_from_report(keyword_report) # 상품명 후보 SEO 점수 기준
+                ):
+                    copy_result[field] = value
+                    if field == 'catch_phrase' and value and product_image_paths and reels_task is None:
+                        print(f"※ 헤드라인 수신 ({value}) -> 릴스 렌더링 먼저 시작")
+                        reels_task = asyncio.create_task(asyncio.to_thread(render_reels, value))
+
+                first_field = writer.last_stream_stats.get('first_field_seconds')
+                if first_field is not None:
+                    print(f"※ 첫 필드 수신까지 {first_field:.2f}초 / 전체 {writer.last_stream_stats['total_seconds']:.2f}초")
                 
                 if copy_result:
                     print("\n" + "="*40)
                     print("✨ J-Ops AI 팀장 (6인의 전문가) 제안")
                     print("="*40)
                     print(f"🔹 [SEO] 최적화 상품명: {copy_result.get('optimized_title')}")
+                    for candidate in copy_result.get('title_scores', [])[1:3]:
+                        print(f"    - 후보: {candidate['title']} (SEO {candidate['score']:.3f})")
                     print(f"🔹 [Keyword] 핵심 키워드: {', '.join(copy_result.get('main_keywords', []))}")
                     print("-" * 20)
                     print(f"🔹 [Ogilvy] 헤드라인: {copy_result.get('catch_phrase')}")
@@ -214,13 +245,10 @@ async def main():
                     print("="*40)
                     
                     # Save AI Result to File
-                    ai_report_base = f"ai_report_{timestamp}.json"
-                    ai_report_filename = config.REPORTS_DIR / ai_report_base
-                    
-                    with open(ai_report_filename, 'w', encoding='utf-8') as f:
-                        json.dump(copy_result, f, ensure_ascii=False, indent=2)
+                    ai_report_filename = config.REPORTS_DIR / f"ai_report_{timestamp}.json"
+                    artifact_writer.write_json(copy_result, ai_report_filename)
                     
-                    print(f"※ AI 원고 저장 완료: {ai_report_filename}")
+                    print(f"※ AI 원고 저장 예약: {ai_report_filename}")
                 else:
                     print("AI 원고 생성에 실패했습니다 (설정 또는 키 확인 필요).")
                     
@@ -233,21 +261,13 @@ async def main():
             print("\n[Step 5 시작] 숏폼 영상(릴스) 생성 중...")
             try:
                 if product_image_paths:
-                    # AI 결과가 있으면 'catch_phrase', 없으면 키워드 사용
-                    subtitle_text = copy_result.get('catch_phrase') if (copy_result and copy_result.get('catch_phrase')) else keyword
-                    
-                    # 너무 길면 자막이 잘릴 수 있으므로 20자 내외로 자르거나, ReelsMaker가 처리하게 둠.
-                    # ReelsMaker에서 method='caption'을 쓰므로 자동 줄바꿈 됨.
-                    
-                    maker = ReelsMaker()
-                    
-                    # 저장 경로
-                    reels_filename = config.DATA_DIR / "reels" / f"reels_{timestamp}.mp4"
-                    
-                    # 이미지 갯수 제한 (너무 길어지지 않게 상위 8장)
-                    start_imgs = product_image_paths[:8]
-                    
-                    final_video_path = maker.make_reels(start_imgs, subtitle_text, str(reels_filename))
+                    if reels_task is not None:
+                        # Step 4에서 헤드라인 수신 직후 시작한 렌더링 대기
+                        final_video_path = await reels_task
+                    else:
+                        # AI 결과가 있으면 'catch_phrase', 없으면 키워드 사용
+                        subtitle_text = copy_result.get('catch_phrase') if (copy_result and copy_result.get('catch_phrase')) else keyword
+                        final_video_path = await asyncio.to_thread(render_reels, subtitle_text)
                     
                     if final_video_path:
                         print(f"✨ 릴스 영상 생성 완료: {final_video_path}")
@@ -258,13 +278,16 @@ async def main():
                     
             except Exception as e:
                 print(f"영상 생성 중 오류: {e}")
-                print("Tip: Windows에서 MoviePy 사용 시 ImageMagick 설치가 필요할 수 있습니다.")
 
         except Exception as e:
             print(f"결과 출력 중 오류: {e}")
     else:
         print("키워드 분석에 실패했습니다.")
 
+    # 백그라운드 저장 작업 완료 대기
+    saved_paths = await asyncio.to_thread(artifact_writer.close)
+    print(f"※ 저장 완료된 산출물: {len(saved_paths)}개")
+
 if __name__ == "__main__":
     try:
         # if sys.platform == 'win32':
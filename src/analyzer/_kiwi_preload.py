@@ -0,0 +1,11 @@
+"""
+병렬 분석 워커용 사전 로딩 모듈.
+forkserver 시작 시 preload되어 Kiwi 모델을 한 번만 로드하고, 워커는 fork로 이를 물려받음.
+(spawn 방식에서는 워커마다 한 번 import되어 로드됨) 메인 프로세스에서는 import하지 않음.
+"""
+from kiwipiepy import Kiwi
+
+from src.analyzer.keyword_analyzer import KeywordAnalyzer
+
+# 워커는 SQLite 토큰 캐시를 직접 쓰지 않음 (캐시 조회/저장은 메인 프로세스에서 처리)
+ANALYZER = KeywordAnalyzer(use_cache=False, phrase_top_n=0, kiwi=Kiwi())
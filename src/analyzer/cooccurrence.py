@@ -0,0 +1,148 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+PHRASE_REPORT_COLUMNS = ['순위', '복합키워드', '단어수', '등장횟수', '관련_상품수', '상품_커버리지', 'PMI']
+
+
+def build_vocabulary(token_lists: Sequence[Sequence[str]]) -> Tuple[List[str], Dict[str, int], List[np.ndarray]]:
+    """
+    상품별 토큰 리스트를 정수 id 배열로 변환함
+    Returns: (vocab, token->id, 상품별 id 배열)
+    """
+    vocab_index: Dict[str, int] = {}
+    id_lists = []
+    for tokens in token_lists:
+        id_lists.append(np.fromiter(
+            (vocab_index.setdefault(token, len(vocab_index)) for token in tokens),
+            dtype=np.int64,
+            count=len(tokens),
+        ))
+    vocab = [None] * len(vocab_index)
+    for token, idx in vocab_index.items():
+        vocab[idx] = token
+    return vocab, vocab_index, id_lists
+
+
+def flatten_ids(id_lists: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    상품별 id 배열을 (상품 인덱스, 토큰 id) 평탄화 배열로 변환
+    """
+    lengths = np.fromiter((len(ids) for ids in id_lists), dtype=np.int64, count=len(id_lists))
+    docs = np.repeat(np.arange(len(id_lists), dtype=np.int64), lengths)
+    flat = np.concatenate(id_lists) if id_lists else np.empty(0, dtype=np.int64)
+    return docs, flat
+
+
+def incidence_matrix(docs: np.ndarray, cols: np.ndarray, n_products: int, n_cols: int) -> sparse.csr_matrix:
+    """
+    상품 x 항목 등장횟수 희소 행렬 (중복 (상품, 항목) 쌍은 합산됨)
+    """
+    data = np.ones(len(docs), dtype=np.int32)
+    return sparse.csr_matrix((data, (docs, cols)), shape=(n_products, n_cols))
+
+
+class CompoundKeywordMiner:
+    """
+    상품명 토큰 시퀀스에서 연속 n-gram(복합 키워드)을 희소 행렬로 집계하는 클래스.
+    - 상품 x 키워드 incidence 행렬을 한 번 만들고, bigram/trigram은 정수 코드로 인코딩해 벡터화 집계
+    - 상품 단위 PMI: log2( P(n-gram) / Π P(token) ), P는 해당 항목을 포함한 상품 비율
+    - 상위 복합 키워드는 관련 상품수(커버리지) → PMI 순으로 정렬
+    """
+
+    def __init__(self, max_n: int = 3, min_count: int = 2, min_pmi: float = 0.0):
+        if max_n < 2:
+            raise ValueError("max_n은 2 이상이어야 합니다.")
+        self.max_n = max_n
+        self.min_count = min_count
+        self.min_pmi = min_pmi
+
+    def keyword_incidence(self, token_lists: Sequence[Sequence[str]]) -> Tuple[sparse.csr_matrix, List[str]]:
+        """
+        상품 x 키워드 등장횟수 행렬과 키워드 목록을 반환함
+        """
+        vocab, _, id_lists = build_vocabulary(token_lists)
+        docs, flat = flatten_ids(id_lists)
+        return incidence_matrix(docs, flat, len(id_lists), len(vocab)), vocab
+
+    def cooccurrence(self, token_lists: Sequence[Sequence[str]]) -> Tuple[sparse.csr_matrix, List[str]]:
+        """
+        키워드 x 키워드 상품 단위 공동 출현 행렬 (X^T X, X는 이진 incidence)
+        """
+        matrix, vocab = self.keyword_incidence(token_lists)
+        binary = (matrix > 0).astype(np.int32)
+        return (binary.T @ binary).tocsr(), vocab
+
+    def mine(self, token_lists: Sequence[Sequence[str]], top_n: int = 20) -> pd.DataFrame:
+        """
+        bigram ~ max_n-gram 복합 키워드의 등장횟수, 관련 상품수, 커버리지, PMI를 계산해 상위 top_n을 반환함
+        """
+        n_products = len(token_lists)
+        vocab, _, id_lists = build_vocabulary(token_lists)
+        n_vocab = len(vocab)
+        if n_products == 0 or n_vocab == 0:
+            return pd.DataFrame(columns=PHRASE_REPORT_COLUMNS)
+
+        docs, flat = flatten_ids(id_lists)
+        unigram = incidence_matrix(docs, flat, n_products, n_vocab)
+        # 상품 단위 등장 확률 P(token)
+        token_prob = np.asarray((unigram > 0).sum(axis=0)).ravel() / n_products
+
+        frames = []
+        for n in range(2, self.max_n + 1):
+            if len(flat) < n:
+                break
+            # 같은 상품 안에서 연속된 n개 토큰만 n-gram으로 인정
+            same_doc = np.ones(len(flat) - n + 1, dtype=bool)
+            for offset in range(1, n):
+                same_doc &= docs[:len(flat) - n + 1] == docs[offset:len(flat) - n + 1 + offset]
+            starts = np.nonzero(same_doc)[0]
+            if len(starts) == 0:
+                continue
+
+            # n-gram을 (id0 * V + id1) * V + ... 정수 코드로 인코딩
+            codes = flat[starts].copy()
+            for offset in range(1, n):
+                codes = codes * n_vocab + flat[starts + offset]
+            unique_codes, ngram_ids = np.unique(codes, return_inverse=True)
+
+            ngram_matrix = incidence_matrix(docs[starts], ngram_ids, n_products, len(unique_codes))
+            counts = np.asarray(ngram_matrix.sum(axis=0)).ravel()
+            product_counts = np.diff(ngram_matrix.tocsc().indptr)
+
+            keep = counts >= self.min_count
+            if not keep.any():
+                continue
+
+            # 코드 -> 구성 토큰 id 복원 (n x K)
+            component_ids = np.empty((n, keep.sum()), dtype=np.int64)
+            remaining = unique_codes[keep]
+            for pos in range(n - 1, -1, -1):
+                component_ids[pos] = remaining % n_vocab
+                remaining = remaining // n_vocab
+
+            coverage = product_counts[keep] / n_products
+            expected = np.prod(token_prob[component_ids], axis=0)
+            pmi = np.log2(coverage / expected)
+
+            frames.append(pd.DataFrame({
+                '복합키워드': [" ".join(vocab[i] for i in col) for col in component_ids.T],
+                '단어수': n,
+                '등장횟수': counts[keep],
+                '관련_상품수': product_counts[keep],
+                '상품_커버리지': np.round(coverage, 4),
+                'PMI': np.round(pmi, 4),
+            }))
+
+        if not frames:
+            return pd.DataFrame(columns=PHRASE_REPORT_COLUMNS)
+
+        phrases = pd.concat(frames, ignore_index=True)
+        phrases = phrases[phrases['PMI'] > self.min_pmi]
+        phrases = phrases.sort_values(
+            ['관련_상품수', 'PMI', '단어수'], ascending=[False, False, False], kind='mergesort'
+        ).head(top_n)
+        phrases.insert(0, '순위', np.arange(1, len(phrases) + 1))
+        return phrases.reset_index(drop=True)[PHRASE_REPORT_COLUMNS]
@@ -0,0 +1,136 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+import config
+from src.analyzer.sketches import hash64
+from src.extractor.token_cache import normalize_title
+
+# MinHash 해시 공간: Mersenne 소수 2^31 - 1 (a * x + b가 uint64 범위에서 넘치지 않음)
+_PRIME = np.uint64((1 << 31) - 1)
+
+
+def title_shingles(title: str, size: int) -> List[str]:
+    """
+    정규화된 상품명의 문자 n-gram (한글 상품명은 띄어쓰기가 들쭉날쭉하므로 공백을 지우고 자름)
+    """
+    text = normalize_title(title).lower().replace(" ", "")
+    if len(text) <= size:
+        return [text]
+    return [text[i:i + size] for i in range(len(text) - size + 1)]
+
+
+def lsh_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    (밴드 수 b, 밴드당 행 수 r) 선택. 후보 쌍이 되는 유사도 (1/b)^(1/r)가 threshold 이하인 것 중 가장 큰 조합
+    (후보는 서명으로 다시 검증하므로 재현율 쪽으로 기울임)
+    """
+    best = (num_perm, 1)
+    best_point = 0.0
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        point = (1.0 / bands) ** (1.0 / rows)
+        if best_point < point <= threshold:
+            best, best_point = (bands, rows), point
+    return best
+
+
+class TitleDeduper:
+    """
+    MinHash + LSH로 거의 같은 상품명(문자 n-gram Jaccard >= threshold)을 묶는 클래스.
+    - MinHash: 상품명 청크 단위로 (num_perm x shingle) 해시 행렬을 만들고 reduceat으로 상품별 최솟값
+    - LSH: 서명을 b개 밴드로 나눠 같은 버킷에 들어간 상품만 후보 쌍으로 비교 (전체 쌍 비교 없음)
+    - 후보 쌍은 서명 일치율(추정 Jaccard)로 검증 후 연결 요소(connected components)로 클러스터링
+    """
+
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        num_perm: Optional[int] = None,
+        shingle_size: Optional[int] = None,
+        seed: int = 0,
+        chunk_size: int = 1000,
+    ):
+        dedupe = config.DEDUPE_CONFIG
+        self.threshold = threshold if threshold is not None else dedupe["THRESHOLD"]
+        self.num_perm = num_perm or dedupe["NUM_PERM"]
+        self.shingle_size = shingle_size or dedupe["SHINGLE_SIZE"]
+        self.chunk_size = chunk_size
+        self.bands, self.rows = lsh_bands(self.num_perm, self.threshold)
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_PRIME), size=(self.num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, int(_PRIME), size=(self.num_perm, 1), dtype=np.uint64)
+        # 밴드 서명(r개 값)을 하나의 64비트 버킷 키로 접는 홀수 승수
+        self._band_mix = rng.integers(1, 1 << 62, size=self.rows, dtype=np.uint64) | np.uint64(1)
+
+    def signatures(self, titles: Sequence[str]) -> np.ndarray:
+        """
+        상품명별 MinHash 서명 (상품 수 x num_perm, uint64)
+        """
+        result = np.empty((len(titles), self.num_perm), dtype=np.uint64)
+        for start in range(0, len(titles), self.chunk_size):
+            chunk = titles[start:start + self.chunk_size]
+            shingle_lists = [title_shingles(str(title), self.shingle_size) for title in chunk]
+            lengths = np.fromiter((len(s) for s in shingle_lists), dtype=np.int64, count=len(shingle_lists))
+            flat = [shingle for shingles in shingle_lists for shingle in shingles]
+            # 내장 hash()는 PYTHONHASHSEED마다 달라 실행마다 클러스터가 바뀌므로 blake2b 기반 hash64 사용
+            values = np.fromiter((hash64(s) for s in flat), dtype=np.uint64, count=len(flat)) % _PRIME
+            hashed = (self._a * values[None, :] + self._b) % _PRIME
+            offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+            result[start:start + len(chunk)] = np.minimum.reduceat(hashed, offsets, axis=1).T
+        return result
+
+    def candidate_pairs(self, signatures: np.ndarray) -> np.ndarray:
+        """
+        LSH 버킷을 공유하는 (대표, 구성원) 후보 쌍 (K x 2)
+        """
+        pairs = []
+        for band in range(self.bands):
+            block = signatures[:, band * self.rows:(band + 1) * self.rows]
+            keys = block @ self._band_mix
+            codes, _ = pd.factorize(keys)
+            order = np.argsort(codes, kind='stable')
+            sorted_codes = codes[order]
+            starts = np.r_[True, sorted_codes[1:] != sorted_codes[:-1]]
+            # 각 버킷의 첫 상품을 대표로, 나머지를 대표와 짝지음
+            leaders = order[starts][np.cumsum(starts) - 1]
+            member = ~starts
+            if member.any():
+                pairs.append(np.column_stack([leaders[member], order[member]]))
+        if not pairs:
+            return np.empty((0, 2), dtype=np.int64)
+        return np.unique(np.concatenate(pairs), axis=0)
+
+    def cluster(self, titles: Sequence[str]) -> np.ndarray:
+        """
+        상품명별 클러스터 번호 (같은 번호 = 거의 같은 상품명)
+        """
+        n = len(titles)
+        if n == 0:
+            return np.empty(0, dtype=np.int64)
+        signatures = self.signatures(titles)
+        pairs = self.candidate_pairs(signatures)
+        if len(pairs):
+            similarity = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+            pairs = pairs[similarity >= self.threshold]
+        graph = sparse.csr_matrix((np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])), shape=(n, n))
+        _, labels = connected_components(graph, directed=False)
+        return labels.astype(np.int64)
+
+    def representatives(self, titles: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (클러스터별 첫 상품만 True인 마스크, 클러스터 번호)
+        results는 순위 순서이므로 클러스터에서 가장 상위 노출 상품이 대표가 됨
+        """
+        labels = self.cluster(titles)
+        keep = np.zeros(len(labels), dtype=bool)
+        if len(labels):
+            _, first = np.unique(labels, return_index=True)
+            keep[first] = True
+        return keep, labels
@@ -1,85 +1,126 @@
 import pandas as pd
 from kiwipiepy import Kiwi
-from collections import Counter
-from typing import List, Dict, Set
+from typing import List, Optional, Union
 import os
 import config
+from src.extractor.tokenizer import Tokenizer
+from src.analyzer.cooccurrence import CompoundKeywordMiner
+from src.analyzer.dedupe import TitleDeduper
+from src.analyzer.keyword_scoring import KeywordScorer
+from src.analyzer.sketches import ApproxKeywordCounter
+from src.analyzer.tag_analysis import analyze_tag_column
+from src.models.product import Product
+from src.models.report import KeywordReport, TagReport
+
+RESULT_COLUMNS = ['순위', '상품명', '가격', '쇼핑몰명', '판매자_설정_태그', 'URL', 'is_ad']
+KEYWORD_REPORT_COLUMNS = ['순위', '키워드', '등장횟수', '관련_상품수', '쇼핑몰수', '가중점수']
+TAG_REPORT_COLUMNS = ['순위', '태그명', '사용_빈도', '관련_상품수', '상품_커버리지']
+TAG_COUSAGE_COLUMNS = ['상품명_일치율', '주요_동시키워드']
+COUNT_MODES = ('exact', 'approx')
+
+ProductData = Union[pd.DataFrame, List[Product]]
+
+
+def products_to_frame(products: List[Product]) -> pd.DataFrame:
+    """
+    스크래퍼가 반환한 Product 리스트를 results CSV와 같은 컬럼 구성의 DataFrame으로 변환함
+    """
+    data = []
+    for idx, product in enumerate(products, 1):
+        data.append({
+            '순위': idx,
+            '상품명': product.title,
+            '가격': product.price,
+            '쇼핑몰명': product.store_name,
+            '판매자_설정_태그': product.tags,
+            'URL': str(product.url),
+            'is_ad': product.is_ad,
+        })
+    return pd.DataFrame(data, columns=RESULT_COLUMNS)
+
+
+def to_product_frame(data: ProductData) -> pd.DataFrame:
+    if isinstance(data, pd.DataFrame):
+        return data
+    return products_to_frame(list(data))
+
+
+def phrase_report_path(keyword_report_path: str) -> str:
+    """
+    keyword_report_*.csv 경로에 대응하는 복합 키워드 리포트 경로 (phrase_report_*.csv)
+    """
+    head, name = os.path.split(str(keyword_report_path))
+    if name.startswith("keyword_report"):
+        name = name.replace("keyword_report", "phrase_report", 1)
+    else:
+        name = f"phrase_{name}"
+    return os.path.join(head, name)
+
+
+def filter_ads(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    광고 상품 제외 (CSV에서 읽으면 is_ad가 문자열 'True'일 수 있으므로 함께 처리)
+    """
+    if 'is_ad' not in df.columns:
+        return df
+    is_ad = df['is_ad'].astype(str).str.strip().str.lower() == 'true'
+    return df[~is_ad]
+
+
+def organic_ranks(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    광고를 뺀 상품들의 '순위'를 1부터 다시 매김 (원래 순위는 광고 포함 목록 위치라서
+    광고 아래에 있던 상품이 순위 가중치에서 불이익을 받지 않도록). 순위가 없는 행은 그대로 둠
+    """
+    if '순위' not in df.columns:
+        return df
+    ranks = pd.to_numeric(df['순위'], errors='coerce')
+    return df.assign(순위=ranks.rank(method='first'))
 
 class KeywordAnalyzer:
     """
-    수집된 상품 데이터(CSV)를 분석하여 '황금 키워드'를 추출하는 클래스
+    수집된 상품 데이터(CSV, DataFrame 또는 Product 리스트)를 분석하여 '황금 키워드'를 추출하는 클래스
     """
-    def __init__(self):
-        self.kiwi = Kiwi()
-        # 불용어 리스트 (판매 유도 문구, 배송 관련 등)
-        self.stopwords = {
-            '무료배송', '할인', '특가', '당일발송', '당일', '출고', '기획', '세일', 
-            '공구', '이벤트', '증정', '사은품', '프로모션', '쿠폰', '혜택',
-            '한정수량', '신상', '국내생산', '자체제작', '빅사이즈',
-            '여성', '여자', '남자', '남성', '무료', '배송', '도착', '보장',
-            '추천', '인기', '공식', '정품', '세트', '1+1', '2+1'
-        }
+    def __init__(
+        self,
+        use_cache: bool = True,
+        phrase_top_n: int = 20,
+        kiwi: Optional[Kiwi] = None,
+        count_mode: Optional[str] = None,
+        dedupe: Optional[bool] = None,
+    ):
+        # 명사(NNG, NNP) + 외국어(SL), 불용어/1글자 제외 (config.TOKENIZER_CONFIG["PRESETS"]["analyzer"])
+        # 이미 로드된 Kiwi를 넘기면 모델 로딩을 건너뜀 (워커 프로세스 등). 같은 상품명 분석 결과는 토큰 캐시에 저장됨
+        self.tokenizer = Tokenizer.from_preset("analyzer", kiwi=kiwi, use_cache=use_cache)
+        self.kiwi = self.tokenizer.kiwi
+        self.stopwords = self.tokenizer.stopwords
+        self.token_cache = self.tokenizer.cache
+        # 복합 키워드(bigram/trigram) 마이닝 (0이면 비활성화)
+        self.phrase_top_n = phrase_top_n
+        self.phrase_miner = CompoundKeywordMiner()
+        self.scorer = KeywordScorer()
+        # 키워드 집계 모드 기본값 ("exact" / "approx"), build_keyword_report(mode=...)로 분석마다 바꿀 수 있음
+        self.count_mode = self._check_mode(count_mode or config.SKETCH_CONFIG["MODE"])
+        # 거의 같은 상품명(같은 상품 중복 등록) 클러스터를 1회만 집계 (build_keyword_report(dedupe=...)로 분석마다 바꿀 수 있음)
+        self.dedupe = config.DEDUPE_CONFIG["ENABLED"] if dedupe is None else dedupe
+        self.deduper = TitleDeduper()
 
     def analyze_file(self, csv_path: str, output_path: str = None) -> str:
-        if output_path is None:
-            output_path = str(config.REPORTS_DIR / "keyword_report.csv")
         """
         CSV 파일을 읽어서 키워드 분석을 수행하고 보고서를 저장함.
         Returns: 저장된 보고서 파일 경로
         """
+        if output_path is None:
+            output_path = str(config.REPORTS_DIR / "keyword_report.csv")
         print(f"Analyzing file: {csv_path}")
-        
+
         try:
-            df = pd.read_csv(csv_path)
-            
-            if '상품명' not in df.columns or 'is_ad' not in df.columns:
-                raise ValueError("CSV 파일에 '상품명' 또는 'is_ad' 컬럼이 없습니다.")
-            
-            # 0. 광고 상품 제외 (is_ad == True 필터링)
-            # CSV reads boolean as string sometimes, so handle that carefully
-            # Usually pandas handles 'True'/'False' string to bool automatically if properly formatted, 
-            # but let's be safe.
-            original_count = len(df)
-            df = df[df['is_ad'] != True]
-            # Also handle string 'True' just in case
-            # df = df[df['is_ad'].astype(str) != 'True'] 
-            
-            filtered_count = len(df)
-            print(f"Ad filtering: {original_count} -> {filtered_count} (Excluded {original_count - filtered_count} ads)")
-
-            titles = df['상품명'].dropna().tolist()
-            
-            # 1. 키워드 추출 & 빈도 계산
-            keyword_counts = Counter()
-            keyword_to_titles_map: Dict[str, Set[int]] = {} # 키워드가 포함된 상품 인덱스 추적
-            
-            for idx, title in enumerate(titles):
-                extracted = self._extract_keywords(title)
-                for word in extracted:
-                    keyword_counts[word] += 1
-                    
-                    if word not in keyword_to_titles_map:
-                        keyword_to_titles_map[word] = set()
-                    keyword_to_titles_map[word].add(idx)
-            
-            # 2. Top 30 선정
-            top_30 = keyword_counts.most_common(30)
-            
-            # 3. 보고서 데이터 생성
-            report_data = []
-            for rank, (word, freq) in enumerate(top_30, 1):
-                related_product_count = len(keyword_to_titles_map.get(word, []))
-                report_data.append({
-                    '순위': rank,
-                    '키워드': word,
-                    '등장횟수': freq,
-                    '관련_상품수': related_product_count
-                })
-            
-            # 4. CSV 저장
-            report_df = pd.DataFrame(report_data)
-            report_df.to_csv(output_path, index=False, encoding="utf-8-sig")
-            
+            report = self.build_keyword_report(pd.read_csv(csv_path))
+            report.table.to_csv(output_path, index=False, encoding="utf-8-sig")
+            if not report.phrases.empty:
+                phrase_path = phrase_report_path(output_path)
+                report.phrases.to_csv(phrase_path, index=False, encoding="utf-8-sig")
+                print(f"Compound keyword report saved to: {phrase_path}")
             print(f"Keyword analysis complete. Report saved to: {output_path}")
             return output_path
 
@@ -87,6 +128,113 @@ class KeywordAnalyzer:
             print(f"Error during analysis: {e}")
             return ""
 
+    @staticmethod
+    def _check_mode(mode: str) -> str:
+        if mode not in COUNT_MODES:
+            raise ValueError(f"지원하지 않는 집계 모드: {mode} (가능: {', '.join(COUNT_MODES)})")
+        return mode
+
+    def build_keyword_report(
+        self,
+        data: ProductData,
+        mode: Optional[str] = None,
+        dedupe: Optional[bool] = None,
+        **sketch_options,
+    ) -> KeywordReport:
+        """
+        상품 DataFrame(또는 Product 리스트)을 받아 키워드 분석 리포트 객체를 반환함.
+        파일 I/O 없이 메모리에서 바로 다음 단계로 넘길 수 있음.
+        mode="approx"이면 고정 메모리 스케치(SpaceSaving + Count-Min + HyperLogLog)로 집계하며
+        sketch_options(capacity, epsilon, delta, hll_precision)로 오차 한도를 조정할 수 있음
+        (근사 모드는 상품명을 배치 단위로 흘려보내므로 중복 제거/복합 키워드/상품별 토큰은 만들지 않음).
+        dedupe=True이면 MinHash/LSH로 묶인 거의 같은 상품명은 클러스터당 1개(최상위 순위)만 집계함.
+        """
+        mode = self._check_mode(mode or self.count_mode)
+        dedupe = self.dedupe if dedupe is None else dedupe
+        df = to_product_frame(data)
+
+        if '상품명' not in df.columns or 'is_ad' not in df.columns:
+            raise ValueError("데이터에 '상품명' 또는 'is_ad' 컬럼이 없습니다.")
+
+        # 0. 광고 상품 제외 (is_ad == True 필터링)
+        original_count = len(df)
+        df = organic_ranks(filter_ads(df))
+
+        filtered_count = len(df)
+        print(f"Ad filtering: {original_count} -> {filtered_count} (Excluded {original_count - filtered_count} ads)")
+
+        df = df[df['상품명'].notna()]
+
+        # 1~2. 키워드 추출 + 점수 계산 (등장횟수, 관련_상품수, 쇼핑몰수, 순위/가격 가중점수)
+        columns = KEYWORD_REPORT_COLUMNS
+        duplicate_titles = 0
+        phrases = pd.DataFrame()
+        tokens = None
+        if mode == 'approx':
+            # 상품명을 배치 단위로 토큰화해 바로 스케치에 반영 (전체 토큰 리스트를 만들지 않음).
+            # 중복 제거/복합 키워드는 전체 상품의 토큰이 필요하므로 근사 모드에서는 건너뜀
+            if dedupe or self.phrase_top_n:
+                print("Approx mode: near-duplicate merging and compound keyword mining are skipped")
+            scores = self._approx_scores(df, **sketch_options)
+            columns = KEYWORD_REPORT_COLUMNS + ['점수_오차상한']
+        else:
+            titles = df['상품명'].astype(str).tolist()
+            extracted_lists = self._extract_keywords_many(titles)
+
+            # 거의 같은 상품명 중복 제거 (토큰은 전체 상품 기준으로 유지하고 집계에서만 제외)
+            count_df, count_lists = df, extracted_lists
+            if dedupe and titles:
+                keep, _ = self.deduper.representatives(titles)
+                duplicate_titles = int((~keep).sum())
+                if duplicate_titles:
+                    count_df = df[keep]
+                    count_lists = [tokens for tokens, kept in zip(extracted_lists, keep) if kept]
+                print(f"Near-duplicate titles: {len(titles)} -> {len(count_lists)} (Merged {duplicate_titles} duplicates)")
+
+            # 키워드 x 상품 행렬 기반 정확 집계
+            scores = self.scorer.score_frame(count_df, count_lists)
+
+            # 복합 키워드 (예: "기모 부츠컷 슬랙스")
+            if self.phrase_top_n:
+                phrases = self.phrase_miner.mine(count_lists, top_n=self.phrase_top_n)
+            tokens = pd.Series(extracted_lists, index=df.index, dtype=object)
+
+        # 3. 가중점수 기준 Top 30 선정 및 보고서 데이터 생성
+        report_df = scores.head(30).reset_index(drop=True)
+        report_df.insert(0, '순위', range(1, len(report_df) + 1))
+
+        if self.token_cache:
+            print(f"Token cache: {self.token_cache.stats()}")
+
+        return KeywordReport(
+            table=report_df[columns],
+            product_count=filtered_count,
+            excluded_ads=original_count - filtered_count,
+            duplicate_titles=duplicate_titles,
+            phrases=phrases,
+            tokens=tokens,
+        )
+
+    def _approx_scores(self, df: pd.DataFrame, **sketch_options) -> pd.DataFrame:
+        """
+        스케치 기반 근사 점수표. 상품명을 BATCH_SIZE개씩 토큰화해 바로 반영하므로
+        토큰 메모리는 배치 크기, 집계 메모리는 스케치 크기로 고정됨 (키워드 수와 무관)
+        """
+        ranks, prices, stores = self.scorer.frame_inputs(df)
+        weights = self.scorer.product_weights(len(df), ranks, prices)
+        counter = ApproxKeywordCounter(store_diversity_power=self.scorer.store_diversity_power, **sketch_options)
+        batch_size = config.SKETCH_CONFIG["BATCH_SIZE"]
+        for start in range(0, len(df), batch_size):
+            stop = min(start + batch_size, len(df))
+            titles = df['상품명'].iloc[start:stop].astype(str).tolist()
+            counter.update(
+                self._extract_keywords_many(titles),
+                weights[start:stop],
+                stores[start:stop] if stores is not None else None,
+                product_ids=df.index[start:stop].tolist(),
+            )
+        print(f"Approx keyword counting: {counter.error_bounds()}")
+        return counter.top(30)
 
     def verify_tag_report(self, report_path: str):
         """
@@ -98,55 +246,19 @@ class KeywordAnalyzer:
             print(f"Tag report NOT found at: {report_path}")
 
     def analyze_tags(self, csv_path: str, output_path: str = None) -> str:
-        if output_path is None:
-            output_path = str(config.REPORTS_DIR / "tag_report.csv")
         """
         '판매자_설정_태그' 컬럼을 분석하여 태그 빈도 리포트를 생성함.
         """
+        if output_path is None:
+            output_path = str(config.REPORTS_DIR / "tag_report.csv")
         print(f"Analyzing tags from: {csv_path}")
         try:
-            df = pd.read_csv(csv_path)
-            
-            if '판매자_설정_태그' not in df.columns:
-                print("CSV 파일에 '판매자_설정_태그' 컬럼이 없습니다. 태그 분석을 건너뜁니다.")
+            report = self.build_tag_report(pd.read_csv(csv_path))
+            if report is None:
                 return ""
 
-            # Filter ads first (consistent with keyword analysis)
-            if 'is_ad' in df.columns:
-                 df = df[df['is_ad'] != True]
-
-            tag_counts = Counter()
-            
-            # Extract tags
-            tags_series = df['판매자_설정_태그'].dropna().astype(str)
-            for tags_str in tags_series:
-                if not tags_str.strip():
-                    continue
-                
-                # Split by space (since we joined with " ") or find all #... matches
-                # Our format is "#Tag1 #Tag2"
-                # Simple split/strip
-                for tag in tags_str.split():
-                    clean_tag = tag.strip()
-                    if clean_tag.startswith("#"):
-                        # Remove # for counting, or keep it? User asked for "태그명". 
-                        # Keeping # makes it clear it's a tag. Let's keep it.
-                        tag_counts[clean_tag] += 1
-            
-            # Data for report
-            report_data = []
-            # Rank by frequency
-            for rank, (tag, freq) in enumerate(tag_counts.most_common(), 1):
-                report_data.append({
-                    '순위': rank,
-                    '태그명': tag,
-                    '사용_빈도': freq
-                })
-            
-            # Save CSV
-            report_df = pd.DataFrame(report_data)
-            report_df.to_csv(output_path, index=False, encoding="utf-8-sig")
-            
+            report.table.to_csv(output_path, index=False, encoding="utf-8-sig")
+
             print(f"Tag analysis complete. Report saved to: {output_path}")
             return output_path
 
@@ -154,19 +266,45 @@ class KeywordAnalyzer:
             print(f"Error during tag analysis: {e}")
             return ""
 
+    def build_tag_report(self, data: ProductData, keyword_report: Optional[KeywordReport] = None) -> Optional[TagReport]:
+        """
+        상품 DataFrame(또는 Product 리스트)의 '판매자_설정_태그'를 분석해 태그 리포트 객체를 반환함.
+        태그 컬럼이 없으면 None.
+        keyword_report를 주면 이미 추출한 상품명 키워드를 재사용해 태그-키워드 공동 사용 지표를 계산함.
+        """
+        df = to_product_frame(data)
+
+        if '판매자_설정_태그' not in df.columns:
+            print("데이터에 '판매자_설정_태그' 컬럼이 없습니다. 태그 분석을 건너뜁니다.")
+            return None
+
+        # Filter ads first (consistent with keyword analysis)
+        df = filter_ads(df)
+
+        # 상품명 키워드 (태그와 같은 행 순서)
+        token_lists = None
+        if keyword_report is not None and keyword_report.tokens is not None:
+            token_lists = [
+                tokens if isinstance(tokens, list) else []
+                for tokens in keyword_report.tokens.reindex(df.index)
+            ]
+        elif '상품명' in df.columns:
+            titles = df['상품명'].fillna("").astype(str).tolist()
+            token_lists = self._extract_keywords_many(titles)
+
+        # split -> explode -> '#' 필터 -> value_counts (행 단위 Python 루프 없음)
+        table = analyze_tag_column(df['판매자_설정_태그'], token_lists)
+        columns = TAG_REPORT_COLUMNS + [c for c in TAG_COUSAGE_COLUMNS if c in table.columns]
+        return TagReport(table=table[columns])
+
+    def _extract_keywords_many(self, titles: List[str]) -> List[List[str]]:
+        """
+        상품명 리스트의 키워드를 추출함 (토큰 캐시가 있으면 캐시 미스만 Kiwi 배치 분석)
+        """
+        return self.tokenizer.tokenize_many(titles)
+
     def _extract_keywords(self, text: str) -> List[str]:
         """
         텍스트에서 명사(NNG, NNP)와 외국어(SL)만 추출하고 불용어를 제거함
         """
-        keywords = []
-        token_results = self.kiwi.analyze(text)
-        
-        for tokens in token_results:
-            for token, tag, _, _ in tokens[0]:
-                if tag in ['NNG', 'NNP', 'SL']:
-                    word = token
-                    # 1글자 제외 (선택사항, 보통 1글자는 의미가 적음) 및 불용어 필터
-                    if len(word) > 1 and word not in self.stopwords:
-                        keywords.append(word)
-        
-        return keywords
+        return self.tokenizer.tokenize(text)
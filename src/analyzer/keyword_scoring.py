@@ -0,0 +1,145 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+import config
+from src.analyzer.cooccurrence import build_vocabulary, flatten_ids, incidence_matrix
+
+SCORE_COLUMNS = ['키워드', '등장횟수', '관련_상품수', '쇼핑몰수', '가중점수']
+
+
+class KeywordScorer:
+    """
+    키워드 x 상품 행렬을 한 번 만들고 NumPy/희소 행렬 연산으로 키워드 점수를 계산하는 클래스.
+    - 순위 가중치: 상위 노출 상품에 쓰인 키워드일수록 높게 (1 / log2(순위 + 1))
+    - 가격 구간 가중치: 가격 분위 구간별 가중치 (config.SCORING_CONFIG["PRICE_BAND_WEIGHTS"])
+    - 쇼핑몰 다양성: 키워드를 쓰는 서로 다른 '쇼핑몰명' 수
+    가중점수 = Σ(상품별 순위 가중치 x 가격 가중치) x (쇼핑몰수 / 관련_상품수) ** STORE_DIVERSITY_POWER
+    """
+
+    def __init__(
+        self,
+        rank_decay: Optional[str] = None,
+        price_band_weights: Optional[Sequence[float]] = None,
+        store_diversity_power: Optional[float] = None,
+    ):
+        scoring = config.SCORING_CONFIG
+        self.rank_decay = rank_decay or scoring["RANK_DECAY"]
+        self.price_band_weights = np.asarray(
+            price_band_weights if price_band_weights is not None else scoring["PRICE_BAND_WEIGHTS"], dtype=np.float64
+        )
+        self.store_diversity_power = (
+            store_diversity_power if store_diversity_power is not None else scoring["STORE_DIVERSITY_POWER"]
+        )
+
+    def rank_weights(self, ranks: np.ndarray) -> np.ndarray:
+        ranks = np.maximum(ranks.astype(np.float64), 1.0)
+        if self.rank_decay == "log":
+            return 1.0 / np.log2(ranks + 1.0)
+        if self.rank_decay == "linear":
+            return 1.0 / ranks
+        if self.rank_decay == "none":
+            return np.ones_like(ranks)
+        raise ValueError(f"지원하지 않는 RANK_DECAY: {self.rank_decay}")
+
+    def price_weights(self, prices: np.ndarray) -> np.ndarray:
+        """
+        가격 분위 구간별 가중치 (가격이 없는 상품은 1.0)
+        """
+        weights = np.ones(len(prices), dtype=np.float64)
+        valid = np.isfinite(prices) & (prices > 0)
+        n_bands = len(self.price_band_weights)
+        if n_bands == 0 or not valid.any():
+            return weights
+        edges = np.quantile(prices[valid], np.linspace(0, 1, n_bands + 1)[1:-1])
+        bands = np.searchsorted(edges, prices[valid], side='right')
+        weights[valid] = self.price_band_weights[bands]
+        return weights
+
+    def score(
+        self,
+        token_lists: Sequence[Sequence[str]],
+        ranks: Optional[np.ndarray] = None,
+        prices: Optional[np.ndarray] = None,
+        stores: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        상품별 토큰 리스트와 순위/가격/쇼핑몰명 배열로 키워드별 점수표를 계산함 (가중점수 내림차순)
+        """
+        n_products = len(token_lists)
+        vocab, _, id_lists = build_vocabulary(token_lists)
+        if n_products == 0 or not vocab:
+            return pd.DataFrame(columns=SCORE_COLUMNS)
+
+        docs, flat = flatten_ids(id_lists)
+        counts_matrix = incidence_matrix(docs, flat, n_products, len(vocab))
+        # 키워드 x 상품 이진 행렬
+        presence = (counts_matrix > 0).astype(np.float64).T.tocsr()
+
+        counts = np.asarray(counts_matrix.sum(axis=0)).ravel()
+        product_counts = np.diff(presence.indptr)
+
+        product_weights = self.product_weights(n_products, ranks, prices)
+        weighted = presence @ product_weights
+
+        store_counts = self.store_counts(presence, stores, n_products)
+        diversity = np.divide(
+            store_counts, product_counts, out=np.ones(len(vocab)), where=product_counts > 0
+        ) ** self.store_diversity_power
+
+        table = pd.DataFrame({
+            '키워드': vocab,
+            '등장횟수': counts,
+            '관련_상품수': product_counts,
+            '쇼핑몰수': store_counts,
+            '가중점수': np.round(weighted * diversity, 4),
+        })
+        return table.sort_values(['가중점수', '등장횟수'], ascending=[False, False], kind='mergesort').reset_index(drop=True)
+
+    def product_weights(self, n_products: int, ranks: Optional[np.ndarray] = None, prices: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        상품별 가중치 = 순위 가중치 x 가격 구간 가중치
+        """
+        ranks = np.arange(1, n_products + 1) if ranks is None else np.asarray(ranks, dtype=np.float64)
+        prices = np.full(n_products, np.nan) if prices is None else np.asarray(prices, dtype=np.float64)
+        return self.rank_weights(ranks) * self.price_weights(prices)
+
+    @staticmethod
+    def store_counts(presence: sparse.csr_matrix, stores: Optional[Sequence[str]], n_products: int) -> np.ndarray:
+        """
+        키워드별 서로 다른 쇼핑몰 수 = nnz(키워드 x 상품 @ 상품 x 쇼핑몰 one-hot)
+        쇼핑몰명이 없는 상품은 각각 별개의 쇼핑몰로 취급
+        """
+        if stores is None:
+            return np.diff(presence.indptr)
+        store_series = pd.Series(list(stores), dtype=object)
+        missing = store_series.isna()
+        store_series[missing] = [f"__unknown_{i}" for i in np.nonzero(missing.to_numpy())[0]]
+        store_codes, _ = pd.factorize(store_series)
+        one_hot = sparse.csr_matrix(
+            (np.ones(n_products), (np.arange(n_products), store_codes)),
+            shape=(n_products, store_codes.max() + 1),
+        )
+        keyword_store = presence @ one_hot
+        return np.diff(keyword_store.tocsr().indptr)
+
+    @staticmethod
+    def frame_inputs(df: pd.DataFrame) -> Tuple[Optional[np.ndarray], Optional[np.ndarray], Optional[List[str]]]:
+        """
+        results DataFrame에서 (순위, 가격, 쇼핑몰명) 배열을 꺼냄 (컬럼이 없으면 None)
+        """
+        ranks = pd.to_numeric(df['순위'], errors='coerce').to_numpy() if '순위' in df.columns else None
+        if ranks is not None and np.isnan(ranks).any():
+            fallback = np.arange(1, len(df) + 1, dtype=np.float64)
+            ranks = np.where(np.isnan(ranks), fallback, ranks)
+        prices = pd.to_numeric(df['가격'], errors='coerce').to_numpy() if '가격' in df.columns else None
+        stores = df['쇼핑몰명'].tolist() if '쇼핑몰명' in df.columns else None
+        return ranks, prices, stores
+
+    def score_frame(self, df: pd.DataFrame, token_lists: List[List[str]]) -> pd.DataFrame:
+        """
+        results DataFrame (상품명 순서와 token_lists 순서가 같아야 함)의 순위/가격/쇼핑몰명 컬럼을 사용해 점수 계산
+        """
+        return self.score(token_lists, *self.frame_inputs(df))
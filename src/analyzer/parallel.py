@@ -0,0 +1,135 @@
+import logging
+import multiprocessing as mp
+import os
+import time
+from collections import Counter
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from src.analyzer.keyword_analyzer import KeywordAnalyzer
+from src.extractor.token_cache import normalize_title, resolve_tokens
+
+logger = logging.getLogger(__name__)
+
+PRELOAD_MODULE = "src.analyzer._kiwi_preload"
+
+
+def _worker_analyzer() -> KeywordAnalyzer:
+    # forkserver: preload된 모듈을 fork로 물려받아 즉시 반환 / spawn: 워커당 최초 1회만 로드
+    from src.analyzer import _kiwi_preload
+    return _kiwi_preload.ANALYZER
+
+
+def _init_worker():
+    _worker_analyzer()
+
+
+def _init_worker_probe(_) -> int:
+    _worker_analyzer()
+    return os.getpid()
+
+
+def _extract_shard(shard: Tuple[int, List[str]]) -> Tuple[int, List[List[str]]]:
+    index, titles = shard
+    analyzer = _worker_analyzer()
+    return index, analyzer.tokenizer.tokenize_many(titles)
+
+
+def _count_shard(titles: List[str]) -> Tuple[Counter, Counter, int]:
+    analyzer = _worker_analyzer()
+    counts = Counter()
+    product_counts = Counter()
+    for extracted in analyzer.tokenizer.iter_tokenize(titles):
+        counts.update(extracted)
+        product_counts.update(set(extracted))
+    return counts, product_counts, len(titles)
+
+
+class ShardedKeywordExecutor:
+    """
+    대량 과거 재분석용 샤딩 병렬 키워드 추출기.
+    - POSIX: forkserver가 Kiwi를 미리 로드(preload)하고 워커는 fork로 물려받아 모델 로딩 비용을 1회로 줄임
+    - Windows 등 forkserver 미지원 환경: spawn + initializer로 워커당 1회 로드 (풀을 재사용)
+    - 상품명을 shard_size 단위로 나눠 KeywordAnalyzer와 같은 Tokenizer 설정으로 병렬 실행하고 카운터를 병합
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        shard_size: int = 2000,
+        start_method: Optional[str] = None,
+        analyzer: Optional[KeywordAnalyzer] = None,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        # 캐시 조회/저장용 (메인 프로세스). 토큰화 규칙은 워커의 KeywordAnalyzer와 동일해야 함
+        self.analyzer = analyzer
+
+        if start_method is None:
+            start_method = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+        self.start_method = start_method
+        self._pool = None
+        self.startup_seconds = 0.0
+
+    def _ensure_pool(self):
+        if self._pool is not None:
+            return self._pool
+        started = time.perf_counter()
+        ctx = mp.get_context(self.start_method)
+        if self.start_method == "forkserver":
+            ctx.set_forkserver_preload([PRELOAD_MODULE])
+        self._pool = ctx.Pool(processes=self.workers, initializer=_init_worker)
+        # 모든 워커가 Kiwi 로딩을 마칠 때까지 대기해 측정값에 시작 비용을 분리함
+        self._pool.map(_init_worker_probe, range(self.workers))
+        self.startup_seconds = time.perf_counter() - started
+        logger.info(f"Sharded executor: {self.workers} workers ({self.start_method}) ready in {self.startup_seconds:.2f}s")
+        return self._pool
+
+    def _shards(self, titles: Sequence[str]) -> Iterator[List[str]]:
+        for start in range(0, len(titles), self.shard_size):
+            yield list(titles[start:start + self.shard_size])
+
+    def extract(self, titles: Sequence[str]) -> List[List[str]]:
+        """
+        상품명별 키워드 리스트를 입력 순서대로 반환함.
+        analyzer에 토큰 캐시가 있으면 캐시 미스만 워커로 보내고 결과를 캐시에 저장함.
+        """
+        normalized = [normalize_title(t) for t in titles]
+        cache = self.analyzer.token_cache if self.analyzer is not None else None
+        return resolve_tokens(normalized, self._extract_sharded, cache)
+
+    def _extract_sharded(self, titles: List[str]) -> List[List[str]]:
+        """
+        (캐시 미스) 상품명들을 샤드로 나눠 워커에서 토큰화하고 입력 순서대로 돌려줌
+        """
+        pool = self._ensure_pool()
+        shards = list(enumerate(self._shards(titles)))
+        results: List[List[List[str]]] = [[] for _ in shards]
+        for index, tokens in pool.imap_unordered(_extract_shard, shards):
+            results[index] = tokens
+        return [tokens for shard in results for tokens in shard]
+
+    def count_keywords(self, titles: Sequence[str]) -> Tuple[Counter, Counter]:
+        """
+        샤드별로 (등장횟수, 관련 상품수) 카운터를 계산하고 병합함
+        """
+        counts = Counter()
+        product_counts = Counter()
+        if not titles:
+            return counts, product_counts
+        pool = self._ensure_pool()
+        for shard_counts, shard_products, _ in pool.imap_unordered(_count_shard, self._shards(titles)):
+            counts.update(shard_counts)
+            product_counts.update(shard_products)
+        return counts, product_counts
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,295 @@
+import hashlib
+import heapq
+import math
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+import config
+
+_MASK64 = (1 << 64) - 1
+
+
+def hash64(value: Hashable) -> int:
+    """
+    프로세스와 무관하게 안정적인 64비트 해시 (Python hash()는 실행마다 달라서 사용하지 않음)
+    """
+    data = value.encode("utf-8") if isinstance(value, str) else repr(value).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+class CountMinSketch:
+    """
+    Count-Min Sketch: 고정 메모리(width x depth)로 항목별 빈도를 과대추정 방향으로 근사.
+    추정 오차 <= epsilon * 전체 합 (확률 1 - delta 이상)
+    """
+
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01):
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = int(math.ceil(math.e / epsilon))
+        self.depth = int(math.ceil(math.log(1.0 / delta)))
+        self.table = np.zeros((self.depth, self.width), dtype=np.int64)
+        self.total = 0
+        self._rows = np.arange(self.depth)
+
+    def _columns(self, item: Hashable) -> np.ndarray:
+        # Kirsch-Mitzenmacher: 해시 2개로 depth개 해시를 생성
+        h = hash64(item)
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return (h1 + self._rows * h2) % self.width
+
+    def add(self, item: Hashable, count: int = 1):
+        self.table[self._rows, self._columns(item)] += count
+        self.total += count
+
+    def add_many(self, items: Sequence[Hashable]):
+        """
+        항목들을 1씩 한 번에 반영함 (해시 → 열 계산과 누적을 배열 연산으로 처리)
+        """
+        if not items:
+            return
+        hashes = np.fromiter((hash64(item) for item in items), dtype=np.uint64, count=len(items))
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        columns = (h1[None, :] + self._rows.astype(np.uint64)[:, None] * h2[None, :]) % np.uint64(self.width)
+        rows = np.broadcast_to(self._rows[:, None], columns.shape)
+        np.add.at(self.table, (rows.ravel(), columns.ravel().astype(np.int64)), 1)
+        self.total += len(items)
+
+    def estimate(self, item: Hashable) -> int:
+        return int(self.table[self._rows, self._columns(item)].min())
+
+    @property
+    def error_bound(self) -> float:
+        return self.epsilon * self.total
+
+    @property
+    def nbytes(self) -> int:
+        return self.table.nbytes
+
+
+class HyperLogLog:
+    """
+    HyperLogLog: 2^precision 바이트로 서로 다른 원소 수를 근사 (표준 오차 ≈ 1.04 / sqrt(2^precision))
+    """
+
+    def __init__(self, precision: int = 10):
+        if not 4 <= precision <= 16:
+            raise ValueError("HLL precision은 4~16 사이여야 합니다.")
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+        if self.m >= 128:
+            self._alpha = 0.7213 / (1 + 1.079 / self.m)
+        else:
+            self._alpha = {16: 0.673, 32: 0.697, 64: 0.709}[self.m]
+
+    def add(self, value: Hashable):
+        self.add_hash(hash64(value))
+
+    def add_hash(self, h: int):
+        index = h >> (64 - self.precision)
+        rest = (h << self.precision) & _MASK64
+        # 남은 비트에서 첫 번째 1의 위치 (1부터)
+        rank = (64 - self.precision + 1) if rest == 0 else (64 - rest.bit_length() + 1)
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self) -> int:
+        estimate = self._alpha * self.m * self.m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * self.m and zeros:
+            # small range correction (linear counting)
+            estimate = self.m * math.log(self.m / zeros)
+        return int(round(estimate))
+
+    def reset(self):
+        self.registers[:] = 0
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(self.m)
+
+    @property
+    def nbytes(self) -> int:
+        return self.registers.nbytes
+
+
+class SpaceSaving:
+    """
+    SpaceSaving heavy-hitter: capacity개의 카운터만 유지하며 상위 항목을 추적.
+    모니터링 중인 항목의 추정값 count는 과대추정이며 count - error <= 실제값 <= count.
+    가중치(실수) 증가도 지원.
+    """
+
+    def __init__(self, capacity: int = 2000):
+        self.capacity = capacity
+        self.counts: Dict[Hashable, float] = {}
+        self.errors: Dict[Hashable, float] = {}
+        # (count, seq, item) lazy min-heap. 값이 바뀐 항목은 새 엔트리를 넣고 오래된 엔트리는 꺼낼 때 버림
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._seq = 0
+
+    def _push(self, item: Hashable):
+        self._seq += 1
+        heapq.heappush(self._heap, (self.counts[item], self._seq, item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, i, key) for i, (key, c) in enumerate(self.counts.items())]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[Hashable, float]:
+        while True:
+            count, _, item = heapq.heappop(self._heap)
+            if item in self.counts and self.counts[item] == count:
+                return item, count
+
+    def add(self, item: Hashable, weight: float = 1.0) -> Optional[Hashable]:
+        """
+        항목을 weight만큼 증가시킴. 최소 카운터를 교체했으면 밀려난 항목을 반환.
+        """
+        evicted = None
+        if item in self.counts:
+            self.counts[item] += weight
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = weight
+            self.errors[item] = 0.0
+        else:
+            evicted, min_count = self._pop_min()
+            del self.counts[evicted]
+            del self.errors[evicted]
+            self.counts[item] = min_count + weight
+            self.errors[item] = min_count
+        self._push(item)
+        return evicted
+
+    def top(self, k: int) -> List[Tuple[Hashable, float, float]]:
+        ranked = sorted(self.counts.items(), key=lambda kv: kv[1], reverse=True)[:k]
+        return [(item, count, self.errors[item]) for item, count in ranked]
+
+
+class ApproxKeywordCounter:
+    """
+    고정 메모리 근사 키워드 집계 (KeywordScorer의 근사 버전).
+    - SpaceSaving: 순위/가격 가중점수 기준 상위 키워드 추적 (capacity개)
+    - Count-Min Sketch: 키워드별 등장횟수 (epsilon, delta)
+    - HyperLogLog: 모니터링 중인 키워드별 관련 상품수 / 쇼핑몰수 (precision)
+    메모리 = CMS(width x depth x 8B) + capacity x 2 x 2^precision B, 입력 크기와 무관.
+
+    점수_오차상한: SpaceSaving이 키워드를 (다시) 추적하기 시작할 때 물려받은 최소 카운터 값.
+    (쇼핑몰 다양성 보정 전 기준) 점수 - 점수_오차상한 <= 실제 점수 <= 점수.
+    HLL은 추적 중인 키워드에만 있으므로, 카운터가 가득 찬 뒤 들어왔거나 밀려났다가 다시 들어온
+    키워드(점수_오차상한 > 0)의 관련_상품수/쇼핑몰수는 추적 시작 이후 상품만 센 하한값임
+    (점수는 물려받은 값만큼 과대, 상품수는 그 이전 상품만큼 과소)
+    """
+    FLUSH_SIZE = 8192
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        epsilon: Optional[float] = None,
+        delta: Optional[float] = None,
+        hll_precision: Optional[int] = None,
+        store_diversity_power: Optional[float] = None,
+    ):
+        sketch = config.SKETCH_CONFIG
+        self.capacity = capacity or sketch["CAPACITY"]
+        self.hll_precision = hll_precision or sketch["HLL_PRECISION"]
+        self.store_diversity_power = (
+            store_diversity_power if store_diversity_power is not None
+            else config.SCORING_CONFIG["STORE_DIVERSITY_POWER"]
+        )
+        self.heavy = SpaceSaving(self.capacity)
+        self.cms = CountMinSketch(epsilon or sketch["EPSILON"], delta or sketch["DELTA"])
+        self._product_hll: Dict[Hashable, HyperLogLog] = {}
+        self._store_hll: Dict[Hashable, HyperLogLog] = {}
+        self._free: List[Tuple[HyperLogLog, HyperLogLog]] = []
+        # Count-Min 갱신은 고정 크기 버퍼에 모아서 배열 연산으로 반영
+        self._pending: List[str] = []
+        self.products = 0
+
+    def _flush(self):
+        self.cms.add_many(self._pending)
+        self._pending = []
+
+    def _sketches_for(self, keyword: Hashable) -> Tuple[HyperLogLog, HyperLogLog]:
+        if keyword not in self._product_hll:
+            pair = self._free.pop() if self._free else (HyperLogLog(self.hll_precision), HyperLogLog(self.hll_precision))
+            self._product_hll[keyword], self._store_hll[keyword] = pair
+        return self._product_hll[keyword], self._store_hll[keyword]
+
+    def add_product(self, product_id: Hashable, tokens: Sequence[str], weight: float = 1.0, store: Optional[str] = None):
+        """
+        상품 1개의 키워드를 반영함 (weight: 순위 x 가격 가중치)
+        """
+        self.products += 1
+        product_hash = hash64(product_id)
+        store_hash = hash64(store if store is not None else ("__product__", product_id))
+        self._pending.extend(tokens)
+        if len(self._pending) >= self.FLUSH_SIZE:
+            self._flush()
+        for token in dict.fromkeys(tokens):
+            evicted = self.heavy.add(token, weight)
+            if evicted is not None:
+                # 밀려난 키워드의 HLL은 초기화해서 재사용 (메모리 고정). 다시 들어오면 상품수는 0부터 다시 셈
+                pair = (self._product_hll.pop(evicted), self._store_hll.pop(evicted))
+                pair[0].reset()
+                pair[1].reset()
+                self._free.append(pair)
+            product_hll, store_hll = self._sketches_for(token)
+            product_hll.add_hash(product_hash)
+            store_hll.add_hash(store_hash)
+
+    def update(
+        self,
+        token_lists: Iterable[Sequence[str]],
+        weights: Optional[Sequence[float]] = None,
+        stores: Optional[Sequence[Optional[str]]] = None,
+        product_ids: Optional[Sequence[Hashable]] = None,
+    ):
+        """
+        상품별 토큰 리스트를 순서대로 반영함 (weights/stores/product_ids는 token_lists와 같은 순서)
+        """
+        for i, tokens in enumerate(token_lists):
+            store = stores[i] if stores is not None else None
+            if store is not None and pd.isna(store):
+                store = None
+            self.add_product(
+                product_ids[i] if product_ids is not None else self.products,
+                tokens,
+                float(weights[i]) if weights is not None else 1.0,
+                store,
+            )
+
+    def top(self, k: int = 30) -> pd.DataFrame:
+        self._flush()
+        rows = []
+        for keyword, score, error in self.heavy.top(k):
+            product_count = self._product_hll[keyword].count()
+            store_count = min(self._store_hll[keyword].count(), product_count)
+            diversity = (store_count / product_count) ** self.store_diversity_power if product_count else 1.0
+            rows.append({
+                '키워드': keyword,
+                '등장횟수': self.cms.estimate(keyword),
+                '관련_상품수': product_count,
+                '쇼핑몰수': store_count,
+                '가중점수': round(score * diversity, 4),
+                '점수_오차상한': round(error, 4),
+            })
+        table = pd.DataFrame(rows, columns=['키워드', '등장횟수', '관련_상품수', '쇼핑몰수', '가중점수', '점수_오차상한'])
+        return table.sort_values(['가중점수', '등장횟수'], ascending=[False, False], kind='mergesort').reset_index(drop=True)
+
+    @property
+    def nbytes(self) -> int:
+        hll_bytes = 2 * self.capacity * (1 << self.hll_precision)
+        return self.cms.nbytes + hll_bytes
+
+    def error_bounds(self) -> Dict[str, float]:
+        self._flush()
+        return {
+            "등장횟수_절대오차": round(self.cms.error_bound, 2),
+            "상품수_상대오차": round(HyperLogLog(self.hll_precision).relative_error, 4),
+            "추적_키워드수": self.capacity,
+            "메모리_bytes": self.nbytes,
+        }
@@ -0,0 +1,140 @@
+import unicodedata
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from src.analyzer.cooccurrence import build_vocabulary, flatten_ids, incidence_matrix
+
+# 행 경계를 표시하는 구분 토큰 (태그 문자열에 나오지 않고 str.split의 공백 문자도 아닌 SOH 제어 문자)
+_ROW_SEPARATOR = "\x01"
+
+
+class TagPairs:
+    """
+    (상품 행, 태그 코드) 평탄화 배열. 태그명은 tag_names[code].
+    """
+
+    def __init__(self, rows: np.ndarray, codes: np.ndarray, tag_names: np.ndarray, n_products: int):
+        self.rows = rows
+        self.codes = codes
+        self.tag_names = tag_names
+        self.n_products = n_products
+
+    def presence_matrix(self) -> sparse.csr_matrix:
+        """
+        상품 x 태그 이진 행렬 (같은 상품에 같은 태그가 여러 번 있어도 1)
+        """
+        matrix = sparse.csr_matrix(
+            (np.ones(len(self.rows), dtype=np.float64), (self.rows, self.codes)),
+            shape=(self.n_products, len(self.tag_names)),
+        )
+        matrix.sum_duplicates()
+        matrix.data[:] = 1.0
+        return matrix
+
+
+def explode_tags(tags: pd.Series) -> TagPairs:
+    """
+    '#Tag1 #Tag2' 형식의 태그 컬럼 전체를 한 번에 펼침.
+    - split: 전체 컬럼을 구분 토큰으로 이어 붙여 한 번의 str.split으로 분리 (행마다 split 호출하지 않음)
+    - explode: 구분 토큰의 누적합으로 각 토큰의 상품 행 번호를 계산
+    - normalize: 고유 토큰에 대해서만 NFKC 정규화 및 '#' 필터 적용 후 같은 태그끼리 코드 병합
+    """
+    values = tags.fillna("").astype(str).to_numpy(dtype=object)
+    n_products = len(values)
+    if n_products == 0:
+        return TagPairs(np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0, dtype=object), 0)
+
+    flat = f" {_ROW_SEPARATOR} ".join(values).split()
+    token_codes, uniques = pd.factorize(np.array(flat, dtype=object))
+
+    is_separator = np.zeros(len(uniques), dtype=bool)
+    is_separator[uniques == _ROW_SEPARATOR] = True
+    rows = np.cumsum(is_separator[token_codes])
+
+    normalized = pd.Series(uniques, dtype=object).map(lambda t: unicodedata.normalize("NFKC", t).strip())
+    is_tag = normalized.str.startswith("#").to_numpy(dtype=bool) & ~is_separator
+    tag_codes, tag_names = pd.factorize(normalized.where(is_tag))
+    # 태그가 아닌 토큰은 -1
+    tag_codes = np.where(is_tag, tag_codes, -1)
+
+    codes = tag_codes[token_codes]
+    keep = codes >= 0
+    return TagPairs(rows[keep], codes[keep], np.asarray(tag_names, dtype=object), n_products)
+
+
+def tag_frequency(pairs: TagPairs) -> pd.DataFrame:
+    """
+    태그별 사용 빈도(value counts)와 상품 커버리지(태그를 쓴 상품 비율)
+    """
+    n_tags = len(pairs.tag_names)
+    freq = np.bincount(pairs.codes, minlength=n_tags)
+    product_counts = np.bincount(pairs.presence_matrix().indices, minlength=n_tags)
+    table = pd.DataFrame({
+        '태그명': pairs.tag_names,
+        '사용_빈도': freq,
+        '관련_상품수': product_counts,
+        '상품_커버리지': np.round(product_counts / pairs.n_products, 4) if pairs.n_products else 0.0,
+    })
+    table = table.sort_values(['사용_빈도', '관련_상품수'], ascending=[False, False], kind='mergesort')
+    table.insert(0, '순위', np.arange(1, len(table) + 1))
+    return table.reset_index(drop=True)
+
+
+def tag_keyword_cousage(pairs: TagPairs, token_lists) -> pd.DataFrame:
+    """
+    태그 x 상품명 키워드 공동 사용 분석 (희소 행렬 T^T K).
+    - 상품명_일치율: 태그를 쓴 상품 중 상품명에도 같은 단어가 들어간 비율
+    - 주요_동시키워드: 태그를 쓴 상품의 상품명에 가장 많이 함께 등장한 (태그 자신 제외) 키워드
+    """
+    vocab, vocab_index, id_lists = build_vocabulary(token_lists)
+    tag_names = pairs.tag_names
+    n_products = pairs.n_products
+    if len(tag_names) == 0 or not vocab:
+        return pd.DataFrame({'태그명': list(tag_names), '상품명_일치율': 0.0, '주요_동시키워드': ""})
+
+    tags_matrix = pairs.presence_matrix()
+    docs, flat = flatten_ids(id_lists)
+    keywords_matrix = (incidence_matrix(docs, flat, n_products, len(vocab)) > 0).astype(np.float64)
+
+    # 태그 x 키워드: 태그를 쓴 상품 중 키워드를 상품명에 포함한 상품 수
+    cousage = (tags_matrix.T @ keywords_matrix).tocsr()
+    tag_product_counts = np.asarray(tags_matrix.sum(axis=0)).ravel()
+
+    # 태그명('#' 제외)과 같은 키워드 위치
+    self_ids = np.array([vocab_index.get(str(name).lstrip('#'), -1) for name in tag_names], dtype=np.int64)
+    has_self = self_ids >= 0
+    self_counts = np.zeros(len(tag_names))
+    if has_self.any():
+        rows = np.nonzero(has_self)[0]
+        self_counts[rows] = np.asarray(cousage[rows, self_ids[rows]]).ravel()
+        self_mask = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, self_ids[rows])), shape=cousage.shape
+        )
+        cousage = cousage - cousage.multiply(self_mask)
+        cousage.eliminate_zeros()
+
+    best = np.asarray(cousage.argmax(axis=1)).ravel()
+    best_counts = np.asarray(cousage.max(axis=1).todense()).ravel()
+    top_keyword = np.where(best_counts > 0, np.asarray(vocab, dtype=object)[best], "")
+
+    return pd.DataFrame({
+        '태그명': list(tag_names),
+        '상품명_일치율': np.round(np.divide(self_counts, tag_product_counts, out=np.zeros(len(tag_names)), where=tag_product_counts > 0), 4),
+        '주요_동시키워드': top_keyword,
+    })
+
+
+def analyze_tag_column(tags: pd.Series, token_lists: Optional[list] = None) -> pd.DataFrame:
+    """
+    태그 컬럼 전체를 벡터화 파이프라인으로 분석함.
+    token_lists(상품명 키워드, tags와 같은 순서)를 주면 상품명 키워드와의 공동 사용 지표도 추가함.
+    """
+    pairs = explode_tags(tags)
+    table = tag_frequency(pairs)
+    if token_lists is not None and not table.empty:
+        cousage = tag_keyword_cousage(pairs, token_lists)
+        table = table.merge(cousage, on='태그명', how='left')
+    return table
@@ -0,0 +1,298 @@
+import logging
+import re
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+import pandas as pd
+
+import config
+from src.analyzer.keyword_analyzer import KeywordAnalyzer, filter_ads
+from src.storage.scrape_store import DateLike, ScrapeStore, to_date_str
+
+if TYPE_CHECKING:
+    from src.analyzer.parallel import ShardedKeywordExecutor
+
+logger = logging.getLogger(__name__)
+
+RESULT_FILE_RE = re.compile(r"^results_(\d{8}_\d{6})\.csv$")
+CSV_SOURCE_RE = re.compile(r"^csv:results_(\d{8}_\d{6})\.csv$")
+
+
+def run_source(source: str) -> str:
+    """
+    집계 기록용 source 이름. 같은 실행의 저장소 스냅샷(run:{timestamp})과 results CSV(csv:results_{timestamp}.csv)는
+    모두 run:{timestamp}로 맞춰서, 두 경로로 들어와도 한 번만 집계되도록 함
+    """
+    match = CSV_SOURCE_RE.match(source)
+    return f"run:{match.group(1)}" if match else source
+
+
+class KeywordTrendAggregator:
+    """
+    수집 스냅샷을 하나씩 증분 집계해서 (검색어, 날짜, 키워드)별 카운터를 누적하는 클래스.
+    - 스냅샷은 chunk 단위로 읽어 메모리 사용량이 파일 크기와 무관하게 유지됨
+    - 이미 집계한 스냅샷은 source 이름으로 기록해 두고 다시 읽지 않음
+    - 추이 조회는 누적 카운터 테이블만 읽으므로 과거 데이터를 재스캔하지 않음
+    """
+
+    def __init__(
+        self,
+        analyzer: Optional[KeywordAnalyzer] = None,
+        db_path: Optional[Path] = None,
+        chunksize: int = 5000,
+        executor: Optional["ShardedKeywordExecutor"] = None,
+    ):
+        self.analyzer = analyzer or KeywordAnalyzer()
+        # 대량 재집계 시 병렬 워커 풀 (없으면 현재 프로세스에서 분석)
+        self.executor = executor
+        self.chunksize = chunksize
+        self.db_path = Path(db_path or config.STORE_CONFIG["PATH"])
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._init_db()
+
+    def _init_db(self):
+        with self._lock, self._conn:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS trend_sources (
+                    source TEXT PRIMARY KEY,
+                    keyword TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    ingested_at TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS trend_daily_totals (
+                    keyword TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    snapshots INTEGER NOT NULL,
+                    products INTEGER NOT NULL,
+                    PRIMARY KEY (keyword, day)
+                );
+                CREATE TABLE IF NOT EXISTS trend_daily_counts (
+                    keyword TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    token TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    product_count INTEGER NOT NULL,
+                    PRIMARY KEY (keyword, day, token)
+                ) WITHOUT ROWID;
+                """
+            )
+
+    def is_ingested(self, source: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM trend_sources WHERE source = ?", (run_source(source),)).fetchone()
+        return row is not None
+
+    # ------------------------------------------------------------------
+    # Ingest
+    # ------------------------------------------------------------------
+    def _count_chunks(self, title_chunks: Iterable[List[str]]):
+        counts = Counter()
+        product_counts = Counter()
+        products = 0
+        for titles in title_chunks:
+            if self.executor is not None:
+                extracted_lists = self.executor.extract(titles)
+            else:
+                extracted_lists = self.analyzer._extract_keywords_many(titles)
+            for extracted in extracted_lists:
+                counts.update(extracted)
+                product_counts.update(set(extracted))
+            products += len(titles)
+        return counts, product_counts, products
+
+    def _commit(self, source: str, keyword: str, day: str, counts: Counter, product_counts: Counter, products: int):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO trend_sources (source, keyword, day, ingested_at) VALUES (?, ?, ?, ?)",
+                (source, keyword, day, datetime.now().isoformat(timespec="seconds")),
+            )
+            self._conn.execute(
+                "INSERT INTO trend_daily_totals (keyword, day, snapshots, products) VALUES (?, ?, 1, ?) "
+                "ON CONFLICT (keyword, day) DO UPDATE SET snapshots = snapshots + 1, products = products + excluded.products",
+                (keyword, day, products),
+            )
+            self._conn.executemany(
+                "INSERT INTO trend_daily_counts (keyword, day, token, count, product_count) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (keyword, day, token) DO UPDATE SET "
+                "count = count + excluded.count, product_count = product_count + excluded.product_count",
+                [(keyword, day, token, freq, product_counts[token]) for token, freq in counts.items()],
+            )
+
+    def ingest_csv(self, csv_path: Path, keyword: str) -> bool:
+        """
+        results_YYYYMMDD_HHMMSS.csv 하나를 chunk 단위로 집계함. 이미 집계한 파일이면 False.
+        """
+        csv_path = Path(csv_path)
+        match = RESULT_FILE_RE.match(csv_path.name)
+        if not match:
+            logger.warning(f"Trend: 파일명에서 수집일을 알 수 없어 건너뜀 - {csv_path.name}")
+            return False
+
+        # main.py가 저장소에 남기는 스냅샷과 같은 source 이름(run:{timestamp})을 사용해 중복 집계를 막음
+        source = run_source(f"csv:{csv_path.name}")
+        if self.is_ingested(source):
+            return False
+
+        day = datetime.strptime(match.group(1), "%Y%m%d_%H%M%S").date().isoformat()
+
+        def title_chunks():
+            for chunk in pd.read_csv(csv_path, chunksize=self.chunksize):
+                if '상품명' not in chunk.columns:
+                    raise ValueError(f"{csv_path.name}에 '상품명' 컬럼이 없습니다.")
+                yield filter_ads(chunk)['상품명'].dropna().astype(str).tolist()
+
+        counts, product_counts, products = self._count_chunks(title_chunks())
+        self._commit(source, keyword, day, counts, product_counts, products)
+        logger.info(f"Trend: {csv_path.name} 집계 완료 ({products} products, {len(counts)} keywords)")
+        return True
+
+    def ingest_directory(self, raw_dir: Optional[Path] = None, keyword: str = "(unknown)") -> int:
+        """
+        폴더의 results_*.csv 중 아직 집계하지 않은 파일만 증분 집계함
+        """
+        raw_dir = Path(raw_dir or config.RAW_DATA_DIR)
+        ingested = 0
+        for csv_path in sorted(raw_dir.glob("results_*.csv")):
+            if self.ingest_csv(csv_path, keyword):
+                ingested += 1
+        return ingested
+
+    def ingest_store(self, store: ScrapeStore, keyword: Optional[str] = None) -> int:
+        """
+        ScrapeStore의 스냅샷 중 아직 집계하지 않은 것만 증분 집계함
+        """
+        ingested = 0
+        for snap in store.snapshots(keyword).to_dict('records'):
+            source = run_source(snap['source']) if snap['source'] else f"snapshot:{snap['snapshot_id']}"
+            if self.is_ingested(source):
+                continue
+            counts, product_counts, products = self._count_chunks(
+                store.iter_snapshot_titles(snap['snapshot_id'], chunksize=self.chunksize)
+            )
+            self._commit(source, snap['keyword'], snap['snapshot_date'], counts, product_counts, products)
+            ingested += 1
+        if ingested:
+            logger.info(f"Trend: ScrapeStore 스냅샷 {ingested}개 집계 완료")
+        return ingested
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+    def daily_counts(
+        self,
+        keyword: str,
+        tokens: Optional[List[str]] = None,
+        since: Optional[DateLike] = None,
+        until: Optional[DateLike] = None,
+    ) -> pd.DataFrame:
+        """
+        (날짜, 키워드)별 누적 카운터를 long 형식으로 반환함 (상품 1개당 평균 등장 비율 포함)
+        """
+        clauses, params = ["c.keyword = ?"], [keyword]
+        if tokens:
+            clauses.append(f"c.token IN ({','.join('?' * len(tokens))})")
+            params.extend(tokens)
+        if since is not None:
+            clauses.append("c.day >= ?")
+            params.append(to_date_str(since))
+        if until is not None:
+            clauses.append("c.day <= ?")
+            params.append(to_date_str(until))
+
+        sql = (
+            "SELECT c.day AS 날짜, c.token AS 키워드, c.count AS 등장횟수, c.product_count AS 관련_상품수, "
+            "t.products AS 전체_상품수 FROM trend_daily_counts c "
+            "JOIN trend_daily_totals t ON t.keyword = c.keyword AND t.day = c.day "
+            f"WHERE {' AND '.join(clauses)} ORDER BY c.day, c.count DESC"
+        )
+        with self._lock:
+            df = pd.read_sql_query(sql, self._conn, params=params)
+        df['상품_비율'] = (df['관련_상품수'] / df['전체_상품수'].where(df['전체_상품수'] > 0)).fillna(0.0)
+        return df
+
+    def trend(
+        self,
+        keyword: str,
+        tokens: Optional[List[str]] = None,
+        top_n: int = 10,
+        freq: str = "W",
+        since: Optional[DateLike] = None,
+        until: Optional[DateLike] = None,
+        value: str = "상품_비율",
+    ) -> pd.DataFrame:
+        """
+        검색어의 키워드 추이를 (기간 x 키워드) 표로 반환함.
+        tokens를 주지 않으면 전체 기간 등장횟수 상위 top_n 키워드를 사용.
+        freq: 'D'(일별), 'W'(주별), 'MS'(월별) 등 pandas resample 규칙
+        value: '등장횟수' | '관련_상품수' | '상품_비율'
+        """
+        df = self.daily_counts(keyword, tokens, since, until)
+        if df.empty:
+            return pd.DataFrame()
+
+        if not tokens:
+            tokens = df.groupby('키워드')['등장횟수'].sum().nlargest(top_n).index.tolist()
+            df = df[df['키워드'].isin(tokens)]
+
+        df = df.assign(날짜=pd.to_datetime(df['날짜']))
+        if value == '상품_비율':
+            # 비율은 기간별로 합계를 다시 나눠서 계산 (일별 비율의 평균이 아님)
+            grouped = df.groupby([pd.Grouper(key='날짜', freq=freq), '키워드'])[['관련_상품수']].sum()
+            totals = self._period_totals(keyword, freq, since, until)
+            table = grouped['관련_상품수'].unstack('키워드').div(totals, axis=0)
+        else:
+            table = df.groupby([pd.Grouper(key='날짜', freq=freq), '키워드'])[value].sum().unstack('키워드')
+
+        return table.reindex(columns=tokens).fillna(0)
+
+    def _period_totals(self, keyword: str, freq: str, since: Optional[DateLike], until: Optional[DateLike]) -> pd.Series:
+        clauses, params = ["keyword = ?"], [keyword]
+        if since is not None:
+            clauses.append("day >= ?")
+            params.append(to_date_str(since))
+        if until is not None:
+            clauses.append("day <= ?")
+            params.append(to_date_str(until))
+        with self._lock:
+            totals = pd.read_sql_query(
+                f"SELECT day, products FROM trend_daily_totals WHERE {' AND '.join(clauses)}", self._conn, params=params
+            )
+        totals['day'] = pd.to_datetime(totals['day'])
+        return totals.groupby(pd.Grouper(key='day', freq=freq))['products'].sum().rename_axis('날짜')
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="키워드 추이 증분 집계 및 조회")
+    parser.add_argument("keyword", help="검색어 (스냅샷 키워드)")
+    parser.add_argument("--raw-dir", type=Path, default=None, help="results_*.csv 폴더도 함께 집계")
+    parser.add_argument("--freq", default="W")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=0, help="0이면 단일 프로세스, N이면 N개 워커로 병렬 분석")
+    args = parser.parse_args()
+
+    executor = None
+    analyzer = KeywordAnalyzer()
+    if args.workers:
+        from src.analyzer.parallel import ShardedKeywordExecutor
+        executor = ShardedKeywordExecutor(workers=args.workers, analyzer=analyzer)
+
+    aggregator = KeywordTrendAggregator(analyzer=analyzer, executor=executor)
+    aggregator.ingest_store(ScrapeStore(), args.keyword)
+    if args.raw_dir:
+        aggregator.ingest_directory(args.raw_dir, args.keyword)
+    print(aggregator.trend(args.keyword, top_n=args.top, freq=args.freq))
+    if executor is not None:
+        executor.close()
@@ -1,20 +1,17 @@
 from typing import List, Dict
-from kiwipiepy import Kiwi
 from collections import Counter
+from src.extractor.tokenizer import Tokenizer
 
 class KeywordExtractor:
     """
     상품명에서 유의미한 키워드(명사)를 추출하고 빈도를 분석하는 클래스
     """
-    def __init__(self):
-        self.kiwi = Kiwi()
-        # 불용어 리스트 (판매 유도 문구 등)
-        self.stopwords = {
-            '무료배송', '할인', '특가', '당일발송', '기획', '세일', 
-            '공구', '이벤트', '증정', '사은품', '프로모션', 
-            '한정수량', '신상', '국내생산', '자체제작', '빅사이즈',
-            '여성', '여자', '남자', '남성', '무료', '배송'
-        }
+    def __init__(self, use_cache: bool = True):
+        # 명사(NNG, NNP)만, 불용어(판매 유도 문구 등)/1글자 제외 (config.TOKENIZER_CONFIG["PRESETS"]["extractor"])
+        self.tokenizer = Tokenizer.from_preset("extractor", use_cache=use_cache)
+        self.kiwi = self.tokenizer.kiwi
+        self.stopwords = self.tokenizer.stopwords
+        self.token_cache = self.tokenizer.cache
 
     def extract_keywords(self, titles: List[str]) -> Dict[str, int]:
         """
@@ -22,18 +19,8 @@ class KeywordExtractor:
         """
         all_keywords = []
 
-        for title in titles:
-            # 형태소 분석
-            # NNG(일반명사), NNP(고유명사) 만 추출
-            tokens = self.kiwi.analyze(title)
-            
-            for token_results in tokens:
-                for token, tag, _, _ in token_results[0]: # top 1 result
-                    if tag in ['NNG', 'NNP']:
-                        word = token
-                        # 불용어 필터링 및 1글자 제외 (옵션)
-                        if word not in self.stopwords and len(word) > 1:
-                            all_keywords.append(word)
+        for words in self.tokenizer.iter_tokenize(titles):
+            all_keywords.extend(words)
 
         # 빈도수 계산
         counter = Counter(all_keywords)
@@ -0,0 +1,199 @@
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_title(title: str) -> str:
+    """
+    캐시 키로 사용할 상품명 정규화 (NFKC + 공백 정리)
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", title)).strip()
+
+
+def kiwi_version() -> str:
+    try:
+        import kiwipiepy
+        return getattr(kiwipiepy, "__version__", "unknown")
+    except ImportError:
+        return "unavailable"
+
+
+def resolve_tokens(
+    normalized: List[str],
+    compute_misses: Callable[[List[str]], List[List[str]]],
+    cache: Optional["TokenCache"] = None,
+) -> List[List[str]]:
+    """
+    정규화된 상품명들의 토큰 리스트 (입력 순서). 캐시에 없는 상품명만 중복 없이 모아 compute_misses로
+    한 번에 계산하고 캐시에 저장함 (cache가 None이면 전부 계산). 히트/미스 집계도 여기서만 함
+    """
+    cached: Dict[str, List[str]] = cache.get_many(normalized) if cache is not None else {}
+    misses = [t for t in dict.fromkeys(normalized) if t not in cached]
+    computed = dict(zip(misses, compute_misses(misses))) if misses else {}
+    if cache is not None:
+        miss_count = sum(1 for t in normalized if t not in cached)
+        cache.hits += len(normalized) - miss_count
+        cache.misses += miss_count
+        cache.put_many(computed)
+    return [cached[t] if t in cached else computed[t] for t in normalized]
+
+
+class TokenCache:
+    """
+    정규화된 상품명 -> 추출 토큰 결과를 SQLite에 영구 저장하는 메모이제이션 캐시.
+    KeywordAnalyzer / KeywordExtractor / 스크래퍼 태그 Fallback이 같은 DB 파일을 공유하며,
+    각 호출부는 자신의 필터 설정(품사, 불용어, 최소 길이)으로 만든 fingerprint로 구분됨.
+    - Kiwi 버전이 바뀌면 기존 엔트리는 모두 무효화(삭제)
+    - 불용어/품사 설정이 바뀌면 fingerprint가 달라져 기존 엔트리는 더 이상 조회되지 않고 LRU로 밀려남
+    """
+
+    def __init__(
+        self,
+        fingerprint: str,
+        db_path: Optional[Path] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.fingerprint = fingerprint
+        self.db_path = Path(db_path or config.TOKEN_CACHE_CONFIG["PATH"])
+        self.max_entries = max_entries or config.TOKEN_CACHE_CONFIG["MAX_ENTRIES"]
+        self.kiwi_version = kiwi_version()
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._init_db()
+
+    @staticmethod
+    def make_fingerprint(stopwords: Iterable[str], pos_tags: Iterable[str], min_length: int, extra: str = "") -> str:
+        """
+        Kiwi 버전 + 불용어 + 품사 필터 + 최소 길이로 캐시 fingerprint 생성
+        """
+        payload = "|".join([
+            kiwi_version(),
+            ",".join(sorted(stopwords)),
+            ",".join(sorted(pos_tags)),
+            str(min_length),
+            extra,
+        ])
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+    def _init_db(self):
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS token_cache (
+                    fingerprint TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    tokens TEXT NOT NULL,
+                    kiwi_version TEXT NOT NULL,
+                    last_used INTEGER NOT NULL,
+                    PRIMARY KEY (fingerprint, title)
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_token_cache_lru ON token_cache (last_used)")
+            # Kiwi 버전이 바뀐 엔트리는 형태소 분석 결과가 달라질 수 있으므로 일괄 삭제
+            deleted = self._conn.execute(
+                "DELETE FROM token_cache WHERE kiwi_version != ?", (self.kiwi_version,)
+            ).rowcount
+            if deleted:
+                logger.info(f"Token cache: Kiwi 버전 변경으로 {deleted}개 엔트리 무효화")
+            row = self._conn.execute("SELECT COALESCE(MAX(last_used), 0) FROM token_cache").fetchone()
+            self._clock = row[0]
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def get_many(self, titles: List[str]) -> Dict[str, List[str]]:
+        """
+        정규화된 상품명 리스트에 대해 캐시된 토큰을 조회함 (없는 키는 결과에서 빠짐)
+        """
+        found: Dict[str, List[str]] = {}
+        if not titles:
+            return found
+
+        unique_titles = list(dict.fromkeys(titles))
+        with self._lock, self._conn:
+            # SQLite 변수 개수 제한(999)을 넘지 않도록 나눠서 조회
+            for start in range(0, len(unique_titles), 500):
+                chunk = unique_titles[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT title, tokens FROM token_cache WHERE fingerprint = ? AND title IN ({placeholders})",
+                    [self.fingerprint, *chunk],
+                ).fetchall()
+                for title, tokens in rows:
+                    found[title] = tokens.split("\t") if tokens else []
+
+            if found:
+                tick = self._tick()
+                self._conn.executemany(
+                    "UPDATE token_cache SET last_used = ? WHERE fingerprint = ? AND title = ?",
+                    [(tick, self.fingerprint, title) for title in found],
+                )
+        return found
+
+    def put_many(self, entries: Dict[str, List[str]]):
+        """
+        정규화된 상품명 -> 토큰 리스트를 저장하고 필요 시 LRU 정리
+        """
+        if not entries:
+            return
+        with self._lock, self._conn:
+            tick = self._tick()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO token_cache (fingerprint, title, tokens, kiwi_version, last_used) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (self.fingerprint, title, "\t".join(tokens), self.kiwi_version, tick)
+                    for title, tokens in entries.items()
+                ],
+            )
+            self._evict()
+
+    def _evict(self):
+        count = self._conn.execute("SELECT COUNT(*) FROM token_cache").fetchone()[0]
+        if count <= self.max_entries:
+            return
+        # 한 번에 10% 여유를 두고 정리해서 매 put마다 삭제가 일어나지 않도록 함
+        target = int(self.max_entries * 0.9)
+        self._conn.execute(
+            "DELETE FROM token_cache WHERE rowid IN (SELECT rowid FROM token_cache ORDER BY last_used ASC LIMIT ?)",
+            (count - target,),
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            entries = self._conn.execute(
+                "SELECT COUNT(*) FROM token_cache WHERE fingerprint = ?", (self.fingerprint,)
+            ).fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "entries": entries,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,110 @@
+import threading
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+from kiwipiepy import Kiwi
+
+import config
+from src.extractor.token_cache import TokenCache, normalize_title, resolve_tokens
+
+_shared_kiwi: Optional[Kiwi] = None
+_shared_kiwi_lock = threading.Lock()
+
+
+def shared_kiwi() -> Kiwi:
+    """
+    프로세스당 하나의 Kiwi 인스턴스 (모델 로딩은 최초 1회)
+    """
+    global _shared_kiwi
+    with _shared_kiwi_lock:
+        if _shared_kiwi is None:
+            _shared_kiwi = Kiwi()
+        return _shared_kiwi
+
+
+class Tokenizer:
+    """
+    상품명 형태소 분석 공통 엔진 (KeywordAnalyzer / KeywordExtractor / 스크래퍼 태그 Fallback이 공유).
+    - 품사/불용어/최소 길이 필터는 생성 시 frozenset으로 한 번만 만들고 토큰마다 집합 조회만 함
+    - iter_tokenize: 상품명 스트림을 batch_size 단위로 읽어 캐시 조회 후, 미스만 Kiwi 배치 분석으로 처리
+    - 같은 필터 설정이면 같은 토큰 캐시 fingerprint를 사용
+    """
+
+    def __init__(
+        self,
+        pos_tags: Iterable[str],
+        stopwords: Iterable[str] = (),
+        min_length: int = 2,
+        normalize_coda: bool = False,
+        name: str = "",
+        kiwi: Optional[Kiwi] = None,
+        use_cache: bool = True,
+    ):
+        self.pos_tags = frozenset(pos_tags)
+        self.stopwords = frozenset(stopwords)
+        self.min_length = min_length
+        self.normalize_coda = normalize_coda
+        self.name = name
+        self.kiwi = kiwi or shared_kiwi()
+
+        extra = f"{name}:normalize_coda" if normalize_coda else name
+        self.fingerprint = TokenCache.make_fingerprint(self.stopwords, self.pos_tags, self.min_length, extra)
+        self.cache = None
+        if use_cache and config.TOKEN_CACHE_CONFIG["ENABLED"]:
+            self.cache = TokenCache(self.fingerprint)
+
+    @classmethod
+    def from_preset(cls, name: str, kiwi: Optional[Kiwi] = None, use_cache: bool = True) -> "Tokenizer":
+        """
+        config.TOKENIZER_CONFIG["PRESETS"]의 설정으로 생성 (analyzer / extractor / scraper_tags)
+        """
+        presets = config.TOKENIZER_CONFIG["PRESETS"]
+        if name not in presets:
+            raise ValueError(f"알 수 없는 토크나이저 preset: {name} (가능: {', '.join(presets)})")
+        preset = presets[name]
+        # 불용어 목록은 preset마다 따로 둠 (목록이 다르면 fingerprint도 달라 캐시를 공유하지 않음)
+        stopwords = config.TOKENIZER_CONFIG["STOPWORDS"][preset["STOPWORDS"]] if preset["STOPWORDS"] else ()
+        return cls(
+            pos_tags=preset["POS_TAGS"],
+            stopwords=stopwords,
+            min_length=preset["MIN_LENGTH"],
+            normalize_coda=preset["NORMALIZE_CODA"],
+            name=name,
+            kiwi=kiwi,
+            use_cache=use_cache,
+        )
+
+    def _filter(self, tokens) -> List[str]:
+        pos_tags, stopwords, min_length = self.pos_tags, self.stopwords, self.min_length
+        return [
+            t.form for t in tokens
+            if t.tag in pos_tags and len(t.form) >= min_length and t.form not in stopwords
+        ]
+
+    def tokenize(self, title: str) -> List[str]:
+        """
+        상품명 하나를 분석함 (캐시 사용 안 함)
+        """
+        return self._filter(self.kiwi.tokenize(title, normalize_coda=self.normalize_coda))
+
+    def _tokenize_batch(self, titles: List[str]) -> List[List[str]]:
+        if not titles:
+            return []
+        return [self._filter(tokens) for tokens in self.kiwi.tokenize(titles, normalize_coda=self.normalize_coda)]
+
+    def iter_tokenize(self, titles: Iterable[str], batch_size: int = 256) -> Iterator[List[str]]:
+        """
+        상품명 스트림의 토큰 리스트를 입력 순서대로 하나씩 돌려줌 (메모리에는 batch_size개만 유지)
+        """
+        iterator = iter(titles)
+        while True:
+            batch = [normalize_title(str(t)) for t in islice(iterator, batch_size)]
+            if not batch:
+                return
+            yield from self._resolve_batch(batch)
+
+    def _resolve_batch(self, normalized: List[str]) -> List[List[str]]:
+        return resolve_tokens(normalized, self._tokenize_batch, self.cache)
+
+    def tokenize_many(self, titles: Iterable[str], batch_size: int = 256) -> List[List[str]]:
+        return list(self.iter_tokenize(titles, batch_size))
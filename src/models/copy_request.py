@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class CopyRequest:
+    """
+    AICopywriter 원고 생성 요청 1건 (배치 생성 시 사용)
+    """
+    product_name: str
+    keywords: List[str] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+    image_paths: Optional[List[str]] = None
+    target_keyword: Optional[str] = None
+    # 상품명 후보 순위용 {키워드: 가중치} (키워드 리포트, TitleScorer.weights_from_report)
+    keyword_weights: Optional[Dict[str, float]] = None
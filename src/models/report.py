@@ -0,0 +1,54 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pandas as pd
+
+
+@dataclass
+class KeywordReport:
+    """
+    키워드 분석 결과 (순위, 키워드, 등장횟수, 관련_상품수, 쇼핑몰수, 가중점수), 가중점수 순 정렬
+    phrases: 상위 복합 키워드 (순위, 복합키워드, 단어수, 등장횟수, 관련_상품수, 상품_커버리지, PMI)
+    """
+    table: pd.DataFrame
+    product_count: int = 0
+    excluded_ads: int = 0
+    # 거의 같은 상품명으로 묶여 집계에서 제외된 상품 수
+    duplicate_titles: int = 0
+    phrases: pd.DataFrame = field(default_factory=pd.DataFrame)
+    # 상품별 추출 키워드 (결과 DataFrame의 index 기준, 다음 단계에서 재사용)
+    tokens: Optional[pd.Series] = field(default=None, repr=False)
+
+    def top_keywords(self, n: int = 10) -> List[str]:
+        if self.table.empty:
+            return []
+        return self.table.head(n)['키워드'].tolist()
+
+    def head(self, n: int = 10) -> pd.DataFrame:
+        return self.table.head(n)
+
+    def top_phrases(self, n: int = 10) -> List[str]:
+        if self.phrases.empty:
+            return []
+        return self.phrases.head(n)['복합키워드'].tolist()
+
+    @property
+    def empty(self) -> bool:
+        return self.table.empty
+
+
+@dataclass
+class TagReport:
+    """
+    판매자 설정 태그 분석 결과 (순위, 태그명, 사용_빈도, 관련_상품수, 상품_커버리지[, 상품명_일치율, 주요_동시키워드])
+    """
+    table: pd.DataFrame = field(default_factory=lambda: pd.DataFrame(columns=['순위', '태그명', '사용_빈도']))
+
+    def top_tags(self, n: int = 10) -> List[str]:
+        if self.table.empty:
+            return []
+        return self.table.head(n)['태그명'].tolist()
+
+    @property
+    def empty(self) -> bool:
+        return self.table.empty
@@ -8,7 +8,7 @@ from playwright.async_api import async_playwright, Browser, Page
 from bs4 import BeautifulSoup
 from src.models.product import Product
 
-from kiwipiepy import Kiwi
+from src.extractor.tokenizer import Tokenizer
 
 # 로깅 설정
 logging.basicConfig(
@@ -26,9 +26,19 @@ class NaverShoppingScraper:
     """
     BASE_URL = config.URLS["NAVER_SHOPPING_MOBILE"]
 
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, use_cache: bool = True):
         self.headless = headless
-        self.kiwi = Kiwi() # Initialize Kiwi for NLP fallback
+        # NLP Fallback용 토크나이저: 명사/외국어/어근(XR), 받침 정규화 (config.TOKENIZER_CONFIG["PRESETS"]["scraper_tags"])
+        self.tokenizer = Tokenizer.from_preset("scraper_tags", use_cache=use_cache)
+        self.kiwi = self.tokenizer.kiwi
+        self.token_cache = self.tokenizer.cache
+
+    def _nlp_tags(self, title: str) -> List[str]:
+        """
+        상품명에서 태그 후보 명사를 추출함 (판매자 태그가 없을 때의 Fallback)
+        """
+        # 불용어는 downstream analyzer에서 처리. 같은 상품명은 토큰 캐시에서 꺼냄
+        return self.tokenizer.tokenize_many([title])[0]
 
     async def search(self, keyword: str) -> List[Product]:
         """
@@ -228,12 +238,7 @@ class NaverShoppingScraper:
                                     # For performance, maybe we initialize it once in __init__ but we are in async method...
                                     # Let's rely on the instance's Kiwi initialized in __init__
                                     try:
-                                        keywords = self.kiwi.tokenize(title, normalize_coda=True)
-                                        # Filter Noun-like tags
-                                        for token in keywords:
-                                            if token.tag in ['NNG', 'NNP', 'SL', 'XR'] and len(token.form) > 1:
-                                                # Manually filter stopwords if needed, or rely on downstream analyzer
-                                                clean_tags.append(token.form)
+                                        clean_tags.extend(self._nlp_tags(title))
                                     except Exception as e:
                                         logger.warning(f"Kiwi NLP Fallback Error: {e}")
 
@@ -0,0 +1,79 @@
+import json
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, List, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+
+class ArtifactWriter:
+    """
+    CSV/JSON 산출물을 백그라운드 스레드에서 저장하는 클래스.
+    파이프라인의 각 단계는 메모리상의 DataFrame/리포트 객체를 바로 다음 단계로 넘기고,
+    파일 저장은 여기에 맡겨서 크리티컬 패스에서 디스크 I/O를 제거함 (산출물당 1회 쓰기, 재읽기 없음).
+    """
+
+    def __init__(self, max_workers: int = 1):
+        # 단일 워커: 제출 순서대로 저장되도록 보장
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="artifact-writer")
+        self._futures: List[Future] = []
+
+    def write_csv(self, df: pd.DataFrame, path: PathLike) -> Future:
+        # 호출부에서 DataFrame을 이어서 수정해도 안전하도록 복사본을 저장
+        snapshot = df.copy()
+        return self.submit(self._save_csv, snapshot, Path(path))
+
+    def write_json(self, data: Any, path: PathLike) -> Future:
+        return self.submit(self._save_json, data, Path(path))
+
+    def submit(self, fn, *args) -> Future:
+        """
+        임의의 저장 작업(예: ScrapeStore.append_snapshot)을 백그라운드 큐에 추가함
+        """
+        future = self._executor.submit(fn, *args)
+        self._futures.append(future)
+        return future
+
+    @staticmethod
+    def _save_csv(df: pd.DataFrame, path: Path) -> str:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(path, index=False, encoding="utf-8-sig")
+        return str(path)
+
+    @staticmethod
+    def _save_json(data: Any, path: Path) -> str:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return str(path)
+
+    def flush(self) -> List[str]:
+        """
+        제출된 모든 저장 작업이 끝날 때까지 기다리고 저장된 경로 목록을 반환함
+        """
+        saved = []
+        for future in self._futures:
+            try:
+                result = future.result()
+                if isinstance(result, str):
+                    saved.append(result)
+            except Exception as e:
+                logger.error(f"Artifact write failed: {e}")
+        self._futures.clear()
+        return saved
+
+    def close(self) -> List[str]:
+        saved = self.flush()
+        self._executor.shutdown(wait=True)
+        return saved
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
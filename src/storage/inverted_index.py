@@ -0,0 +1,374 @@
+import logging
+import zlib
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.storage.scrape_store import DateLike, ScrapeStore, to_date_str
+
+if TYPE_CHECKING:
+    from src.analyzer.keyword_analyzer import KeywordAnalyzer
+
+logger = logging.getLogger(__name__)
+
+POSTING_COLUMNS = ['snapshot_id', 'product_id', 'rank', 'tf']
+
+
+def encode_varints(values: np.ndarray) -> bytes:
+    """
+    음이 아닌 정수 배열을 LEB128 varint 바이트열로 인코딩 (7비트 그룹 단위 벡터 연산)
+    """
+    values = np.asarray(values, dtype=np.uint64)
+    if len(values) == 0:
+        return b""
+    lengths = np.ones(len(values), dtype=np.int64)
+    rest = values >> np.uint64(7)
+    while rest.any():
+        lengths += rest > 0
+        rest >>= np.uint64(7)
+    offsets = np.cumsum(lengths) - lengths
+    out = np.empty(int(lengths.sum()), dtype=np.uint8)
+    for k in range(int(lengths.max())):
+        sel = lengths > k
+        group = (values[sel] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        more = (lengths[sel] > k + 1).astype(np.uint64) << np.uint64(7)
+        out[offsets[sel] + k] = (group | more).astype(np.uint8)
+    return out.tobytes()
+
+
+def decode_varints(data: bytes) -> np.ndarray:
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if len(raw) == 0:
+        return np.empty(0, dtype=np.uint64)
+    ends = (raw & 0x80) == 0
+    starts = np.r_[0, np.nonzero(ends)[0][:-1] + 1]
+    value_index = np.cumsum(np.r_[0, ends[:-1].astype(np.int64)])
+    shifts = (np.arange(len(raw)) - starts[value_index]) * 7
+    parts = (raw & 0x7F).astype(np.uint64) << shifts.astype(np.uint64)
+    return np.bitwise_or.reduceat(parts, starts)
+
+
+def encode_postings(postings: np.ndarray) -> bytes:
+    """
+    (snapshot_id, product_id, rank, tf) 정렬 배열 -> zlib(varint(Δsnapshot | Δproduct | rank | tf))
+    product_id는 저장소 전체에서 증가하는 정수 기본키이므로 정렬 후 차분이 작고 varint 1~2바이트로 줄어듦
+    """
+    deltas = np.diff(postings[:, :2], axis=0, prepend=0)
+    streams = np.concatenate([deltas[:, 0], deltas[:, 1], postings[:, 2], postings[:, 3]])
+    return zlib.compress(encode_varints(streams))
+
+
+def decode_postings(blob: bytes, n_postings: int) -> np.ndarray:
+    streams = decode_varints(zlib.decompress(blob)).astype(np.int64).reshape(4, n_postings)
+    postings = streams.T.copy()
+    postings[:, :2] = np.cumsum(postings[:, :2], axis=0)
+    return postings
+
+
+class KeywordIndex:
+    """
+    상품명 키워드 -> (snapshot_id, product_id, 순위, 상품명 내 등장횟수) 영구 역색인 (ScrapeStore와 같은 SQLite 파일).
+    - 증분 갱신: 아직 색인하지 않은 스냅샷만 토큰화해서 키워드별 posting 블록을 추가 (기존 블록은 다시 쓰지 않음)
+    - posting 블록은 (snapshot_id, product_id) 정렬 + 차분 varint + zlib으로 압축 저장
+    - 블록마다 수집일 범위를 기록해 기간 조건에 맞지 않는 블록은 읽지 않음
+    - 조회(AND/OR/NOT, 빈도)는 posting만 읽으므로 과거 상품명을 다시 토큰화하지 않음
+    광고 상품은 키워드 분석과 같이 색인하지 않음.
+    """
+
+    def __init__(
+        self,
+        store: Optional[ScrapeStore] = None,
+        analyzer: Optional["KeywordAnalyzer"] = None,
+        db_path: Optional[Path] = None,
+    ):
+        # 저장소와 같은 SQLite 파일이므로 연결/잠금을 새로 만들지 않고 저장소 것을 함께 씀
+        self._owns_store = store is None
+        self.store = store or ScrapeStore(db_path)
+        self._analyzer = analyzer
+        self.db_path = self.store.db_path
+        self._init_db()
+
+    @property
+    def analyzer(self) -> "KeywordAnalyzer":
+        # 조회만 할 때는 Kiwi를 로드하지 않음
+        if self._analyzer is None:
+            from src.analyzer.keyword_analyzer import KeywordAnalyzer
+            self._analyzer = KeywordAnalyzer()
+        return self._analyzer
+
+    def _init_db(self):
+        with self.store.transaction() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS index_snapshots (
+                    snapshot_id INTEGER PRIMARY KEY,
+                    keyword TEXT NOT NULL,
+                    snapshot_date TEXT NOT NULL,
+                    products INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS index_postings (
+                    token TEXT NOT NULL,
+                    block INTEGER NOT NULL,
+                    date_min TEXT NOT NULL,
+                    date_max TEXT NOT NULL,
+                    n_postings INTEGER NOT NULL,
+                    occurrences INTEGER NOT NULL,
+                    data BLOB NOT NULL,
+                    PRIMARY KEY (token, block)
+                ) WITHOUT ROWID;
+                """
+            )
+
+    # ------------------------------------------------------------------
+    # Incremental update
+    # ------------------------------------------------------------------
+    def pending_snapshots(self, keyword: Optional[str] = None) -> pd.DataFrame:
+        snapshots = self.store.snapshots(keyword)
+        with self.store.connection() as conn:
+            indexed = {r[0] for r in conn.execute("SELECT snapshot_id FROM index_snapshots")}
+        return snapshots[~snapshots['snapshot_id'].isin(indexed)]
+
+    def update(self, keyword: Optional[str] = None, batch_snapshots: int = 50) -> int:
+        """
+        아직 색인하지 않은 스냅샷을 batch_snapshots개씩 묶어 색인함 (묶음마다 키워드당 블록 1개 추가)
+        Returns: 새로 색인한 스냅샷 수
+        """
+        pending = self.pending_snapshots(keyword).to_dict('records')
+        for start in range(0, len(pending), batch_snapshots):
+            self._index_batch(pending[start:start + batch_snapshots])
+        if pending:
+            logger.info(f"Index: 스냅샷 {len(pending)}개 색인 완료")
+        return len(pending)
+
+    def _index_batch(self, snapshots: List[dict]):
+        token_postings: Dict[str, List[tuple]] = defaultdict(list)
+        token_dates: Dict[str, List[str]] = defaultdict(list)
+        snapshot_rows = []
+        for snap in snapshots:
+            products = self.store.snapshot_products(snap['snapshot_id'])
+            titles = products['상품명'].astype(str).tolist()
+            # 토큰 캐시를 거치므로 방금 분석한 스냅샷은 Kiwi를 다시 돌리지 않음
+            token_lists = self.analyzer._extract_keywords_many(titles)
+            ranks = pd.to_numeric(products['순위'], errors='coerce').fillna(0).astype(int).tolist()
+            for product_id, rank, tokens in zip(products['product_id'].tolist(), ranks, token_lists):
+                for token, tf in Counter(tokens).items():
+                    token_postings[token].append((snap['snapshot_id'], product_id, rank, tf))
+                    token_dates[token].append(snap['snapshot_date'])
+            snapshot_rows.append((snap['snapshot_id'], snap['keyword'], snap['snapshot_date'], len(products)))
+
+        with self.store.transaction() as conn:
+            next_blocks = dict(conn.execute("SELECT token, MAX(block) + 1 FROM index_postings GROUP BY token"))
+            rows = []
+            for token, postings in token_postings.items():
+                array = np.array(sorted(postings), dtype=np.int64)
+                dates = token_dates[token]
+                rows.append((
+                    token, next_blocks.get(token, 0), min(dates), max(dates),
+                    len(array), int(array[:, 3].sum()), encode_postings(array),
+                ))
+            conn.executemany(
+                "INSERT INTO index_postings (token, block, date_min, date_max, n_postings, occurrences, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany(
+                "INSERT INTO index_snapshots (snapshot_id, keyword, snapshot_date, products) VALUES (?, ?, ?, ?)",
+                snapshot_rows,
+            )
+
+    def compact(self) -> int:
+        """
+        키워드별 posting 블록을 하나로 병합함 (증분 갱신이 많이 쌓였을 때). Returns: 병합한 키워드 수
+        """
+        with self.store.transaction() as conn:
+            tokens = [r[0] for r in conn.execute(
+                "SELECT token FROM index_postings GROUP BY token HAVING COUNT(*) > 1"
+            )]
+            for token in tokens:
+                blocks = conn.execute(
+                    "SELECT date_min, date_max, n_postings, data FROM index_postings WHERE token = ?", (token,)
+                ).fetchall()
+                merged = np.concatenate([decode_postings(data, n) for _, _, n, data in blocks])
+                merged = merged[np.lexsort((merged[:, 1], merged[:, 0]))]
+                conn.execute("DELETE FROM index_postings WHERE token = ?", (token,))
+                conn.execute(
+                    "INSERT INTO index_postings (token, block, date_min, date_max, n_postings, occurrences, data) "
+                    "VALUES (?, 0, ?, ?, ?, ?, ?)",
+                    (
+                        token, min(b[0] for b in blocks), max(b[1] for b in blocks),
+                        len(merged), int(merged[:, 3].sum()), encode_postings(merged),
+                    ),
+                )
+        return len(tokens)
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+    def _snapshot_filter(self, keyword: Optional[str], since: Optional[DateLike], until: Optional[DateLike]) -> pd.DataFrame:
+        clauses, params = ScrapeStore._partition_filter(keyword, since, until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self.store.connection() as conn:
+            return pd.read_sql_query(f"SELECT * FROM index_snapshots {where}", conn, params=params)
+
+    def postings(
+        self,
+        token: str,
+        keyword: Optional[str] = None,
+        since: Optional[DateLike] = None,
+        until: Optional[DateLike] = None,
+    ) -> pd.DataFrame:
+        """
+        키워드의 posting (snapshot_id, product_id, rank, tf, 수집일). 기간 밖 블록은 읽지 않음
+        """
+        clauses, params = ["token = ?"], [token]
+        if since is not None:
+            clauses.append("date_max >= ?")
+            params.append(to_date_str(since))
+        if until is not None:
+            clauses.append("date_min <= ?")
+            params.append(to_date_str(until))
+        with self.store.connection() as conn:
+            blocks = conn.execute(
+                f"SELECT n_postings, data FROM index_postings WHERE {' AND '.join(clauses)} ORDER BY block", params
+            ).fetchall()
+        if not blocks:
+            return pd.DataFrame(columns=POSTING_COLUMNS + ['수집일'])
+
+        postings = pd.DataFrame(np.concatenate([decode_postings(data, n) for n, data in blocks]), columns=POSTING_COLUMNS)
+        snapshots = self._snapshot_filter(keyword, since, until)
+        postings = postings.merge(
+            snapshots[['snapshot_id', 'snapshot_date']].rename(columns={'snapshot_date': '수집일'}), on='snapshot_id'
+        )
+        return postings.sort_values(['snapshot_id', 'product_id'], kind='mergesort').reset_index(drop=True)
+
+    def match_ids(
+        self,
+        all_of: Sequence[str] = (),
+        any_of: Sequence[str] = (),
+        none_of: Sequence[str] = (),
+        keyword: Optional[str] = None,
+        since: Optional[DateLike] = None,
+        until: Optional[DateLike] = None,
+    ) -> np.ndarray:
+        """
+        상품명이 all_of를 모두 포함(AND)하고, any_of 중 하나 이상 포함(OR)하며, none_of는 포함하지 않는(NOT) product_id
+        """
+        if not all_of and not any_of:
+            raise ValueError("all_of 또는 any_of 중 하나는 지정해야 합니다.")
+
+        def ids(token):
+            return self.postings(token, keyword, since, until)['product_id'].to_numpy(dtype=np.int64)
+
+        result = None
+        # posting이 짧은 키워드부터 교집합 (중간 결과를 작게 유지)
+        for posting_ids in sorted((ids(t) for t in all_of), key=len):
+            result = posting_ids if result is None else np.intersect1d(result, posting_ids, assume_unique=True)
+            if len(result) == 0:
+                return result
+        if any_of:
+            union = np.unique(np.concatenate([ids(t) for t in any_of]))
+            result = union if result is None else np.intersect1d(result, union, assume_unique=True)
+        for token in none_of:
+            result = np.setdiff1d(result, ids(token), assume_unique=True)
+        return result
+
+    def query(
+        self,
+        all_of: Sequence[str] = (),
+        any_of: Sequence[str] = (),
+        none_of: Sequence[str] = (),
+        keyword: Optional[str] = None,
+        since: Optional[DateLike] = None,
+        until: Optional[DateLike] = None,
+        days: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        예: index.query(["기모", "슬랙스"], days=7) -> 최근 1주일간 상품명에 '기모'와 '슬랙스'가 모두 들어간 상품
+        """
+        if days is not None:
+            since = date.today() - timedelta(days=days)
+        product_ids = self.match_ids(all_of, any_of, none_of, keyword, since, until)
+        return self.store.products_by_id(
+            product_ids, columns=['keyword', 'snapshot_date', 'snapshot_id', 'rank', 'title', 'price', 'store_name', 'url']
+        )
+
+    def frequency(
+        self,
+        token: str,
+        keyword: Optional[str] = None,
+        since: Optional[DateLike] = None,
+        until: Optional[DateLike] = None,
+        freq: str = 'D',
+    ) -> pd.DataFrame:
+        """
+        기간(freq)별 등장횟수, 관련_상품수, 상품_비율 (색인된 광고 제외 상품 기준)
+        """
+        postings = self.postings(token, keyword, since, until)
+        snapshots = self._snapshot_filter(keyword, since, until)
+        if snapshots.empty:
+            return pd.DataFrame(columns=['등장횟수', '관련_상품수', '전체_상품수', '상품_비율'])
+
+        totals = snapshots.assign(날짜=pd.to_datetime(snapshots['snapshot_date'])) \
+            .groupby(pd.Grouper(key='날짜', freq=freq))['products'].sum()
+        postings['날짜'] = pd.to_datetime(postings['수집일'])
+        grouped = postings.groupby(pd.Grouper(key='날짜', freq=freq))
+        table = pd.DataFrame({
+            '등장횟수': grouped['tf'].sum(),
+            '관련_상품수': grouped['product_id'].count(),
+        }).reindex(totals.index, fill_value=0)
+        table['전체_상품수'] = totals
+        table['상품_비율'] = np.round(table['관련_상품수'] / table['전체_상품수'].where(table['전체_상품수'] > 0), 4)
+        return table
+
+    def stats(self) -> dict:
+        with self.store.connection() as conn:
+            tokens, blocks, postings, size = conn.execute(
+                "SELECT COUNT(DISTINCT token), COUNT(*), COALESCE(SUM(n_postings), 0), COALESCE(SUM(LENGTH(data)), 0) "
+                "FROM index_postings"
+            ).fetchone()
+            snapshots = conn.execute("SELECT COUNT(*) FROM index_snapshots").fetchone()[0]
+        return {
+            "snapshots": snapshots,
+            "tokens": tokens,
+            "blocks": blocks,
+            "postings": postings,
+            "bytes_per_posting": round(size / postings, 2) if postings else 0.0,
+        }
+
+    def close(self):
+        """
+        직접 연 저장소만 닫음 (넘겨받은 저장소는 호출한 쪽에서 닫음)
+        """
+        if self._owns_store:
+            self.store.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="상품명 키워드 역색인 갱신 및 조회")
+    parser.add_argument("tokens", nargs="*", help="AND 조건 키워드 (예: 기모 슬랙스)")
+    parser.add_argument("--keyword", default=None, help="검색어(스냅샷 키워드)로 범위 제한")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--exclude", nargs="*", default=[], help="NOT 조건 키워드")
+    parser.add_argument("--freq", action="store_true", help="첫 번째 키워드의 일별 빈도 출력")
+    parser.add_argument("--compact", action="store_true")
+    args = parser.parse_args()
+
+    index = KeywordIndex()
+    index.update()
+    if args.compact:
+        index.compact()
+    print(f"Index: {index.stats()}")
+    if args.tokens and args.freq:
+        since = date.today() - timedelta(days=args.days)
+        print(index.frequency(args.tokens[0], keyword=args.keyword, since=since))
+    elif args.tokens:
+        matches = index.query(args.tokens, none_of=args.exclude, keyword=args.keyword, days=args.days)
+        print(f"{len(matches)} products")
+        print(matches.head(20).to_string(index=False))
+    index.close()
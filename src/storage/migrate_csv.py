@@ -0,0 +1,127 @@
+"""
+기존 data/raw/results_*.csv 와 data/reports/*_report_*.csv 를 ScrapeStore로 가져오는 마이그레이션 도구.
+
+사용법:
+    python -m src.storage.migrate_csv --keyword-map keywords.json
+    python -m src.storage.migrate_csv --keyword "기모 슬랙스" --raw-dir data/raw --reports-dir data/reports --dry-run
+
+results CSV와 보고서 CSV에는 검색 키워드가 저장되어 있지 않으므로 파일마다 키워드를 알려줘야 함.
+--keyword-map은 results 파일명 또는 timestamp를 키워드에 대응시킨 JSON 객체이고
+(예: {"results_20240105_093000.csv": "기모 슬랙스", "20240106_101500": "와이드 팬츠"}),
+여기에 없는 파일은 --keyword 값을 쓰며, 둘 다 없으면 가져오지 않고 건너뜀.
+같은 파일은 source 이름으로 중복 체크하므로 여러 번 실행해도 안전함.
+"""
+import argparse
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+import pandas as pd
+
+import config
+from src.models.report import KeywordReport, TagReport
+from src.storage.scrape_store import ScrapeStore
+
+RESULT_FILE_RE = re.compile(r"^results_(\d{8}_\d{6})\.csv$")
+
+
+def _read_optional_csv(path: Path) -> Optional[pd.DataFrame]:
+    if not path.exists():
+        return None
+    try:
+        return pd.read_csv(path)
+    except Exception as e:
+        print(f"  [skip] {path.name}: {e}")
+        return None
+
+
+def load_keyword_map(path: Path) -> Dict[str, str]:
+    """
+    {results 파일명 또는 timestamp: 검색 키워드} JSON을 읽음
+    """
+    with open(path, encoding="utf-8") as f:
+        mapping = json.load(f)
+    if not isinstance(mapping, dict) or not all(isinstance(k, str) and isinstance(v, str) for k, v in mapping.items()):
+        raise ValueError(f"{path}: {{파일명: 키워드}} 형식의 JSON 객체여야 합니다.")
+    return {name: keyword.strip() for name, keyword in mapping.items() if keyword.strip()}
+
+
+def migrate(
+    store: ScrapeStore,
+    raw_dir: Path,
+    reports_dir: Path,
+    keyword_map: Dict[str, str],
+    default_keyword: Optional[str] = None,
+    dry_run: bool = False,
+) -> int:
+    imported = 0
+    for csv_path in sorted(raw_dir.glob("results_*.csv")):
+        match = RESULT_FILE_RE.match(csv_path.name)
+        if not match:
+            print(f"  [skip] 파일명에서 수집 시각을 알 수 없음: {csv_path.name}")
+            continue
+
+        source = f"csv:{csv_path.name}"
+        if store.has_source(source):
+            continue
+
+        timestamp = match.group(1)
+        keyword = keyword_map.get(csv_path.name) or keyword_map.get(timestamp) or default_keyword
+        if not keyword:
+            # 키워드를 모르는 스냅샷은 키워드별 집계에 섞이지 않도록 아예 가져오지 않음
+            print(f"  [skip] 검색 키워드를 알 수 없음 (--keyword-map에 추가): {csv_path.name}")
+            continue
+
+        captured_at = datetime.strptime(timestamp, "%Y%m%d_%H%M%S")
+        products = _read_optional_csv(csv_path)
+        if products is None:
+            continue
+
+        keyword_df = _read_optional_csv(reports_dir / f"keyword_report_{timestamp}.csv")
+        tag_df = _read_optional_csv(reports_dir / f"tag_report_{timestamp}.csv")
+
+        print(
+            f"  {csv_path.name} [{keyword}]: {len(products)} products"
+            f"{', keyword report' if keyword_df is not None else ''}"
+            f"{', tag report' if tag_df is not None else ''}"
+        )
+        if dry_run:
+            continue
+
+        store.append_snapshot(
+            keyword,
+            products,
+            captured_at=captured_at,
+            source=source,
+            keyword_report=KeywordReport(table=keyword_df) if keyword_df is not None else None,
+            tag_report=TagReport(table=tag_df) if tag_df is not None else None,
+        )
+        imported += 1
+    return imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV 수집 결과를 ScrapeStore로 가져오기")
+    parser.add_argument("--raw-dir", type=Path, default=config.RAW_DATA_DIR)
+    parser.add_argument("--reports-dir", type=Path, default=config.REPORTS_DIR)
+    parser.add_argument("--db", type=Path, default=config.STORE_CONFIG["PATH"])
+    parser.add_argument("--keyword-map", type=Path, help="{results 파일명 또는 timestamp: 검색 키워드} JSON 파일")
+    parser.add_argument("--keyword", help="--keyword-map에 없는 파일에 쓸 검색 키워드")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    keyword_map = load_keyword_map(args.keyword_map) if args.keyword_map else {}
+    default_keyword = (args.keyword or "").strip() or None
+    if not keyword_map and default_keyword is None:
+        parser.error("--keyword-map 또는 --keyword 중 하나는 지정해야 합니다.")
+
+    store = ScrapeStore(args.db)
+    print(f"Migrating CSVs from {args.raw_dir} -> {args.db}")
+    imported = migrate(store, args.raw_dir, args.reports_dir, keyword_map, default_keyword, dry_run=args.dry_run)
+    print(f"Done. Imported {imported} snapshot(s).")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
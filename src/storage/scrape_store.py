@@ -0,0 +1,399 @@
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Union
+
+import pandas as pd
+
+import config
+from src.models.report import KeywordReport, TagReport
+
+logger = logging.getLogger(__name__)
+
+DateLike = Union[str, date, datetime]
+
+# 상품 테이블에서 조회 가능한 컬럼 (CSV 컬럼명과 동일한 한글 이름으로 돌려줌)
+PRODUCT_COLUMNS = {
+    'keyword': '키워드',
+    'snapshot_date': '수집일',
+    'snapshot_id': 'snapshot_id',
+    'rank': '순위',
+    'title': '상품명',
+    'price': '가격',
+    'store_name': '쇼핑몰명',
+    'tags': '판매자_설정_태그',
+    'url': 'URL',
+    'is_ad': 'is_ad',
+}
+
+
+def to_date_str(value: DateLike) -> str:
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+class ScrapeStore:
+    """
+    모든 수집 결과와 분석 리포트를 누적 저장하는 append-only 분석 저장소 (SQLite).
+    상품/리포트 행마다 (키워드, 수집일)을 함께 저장하고 복합 인덱스를 걸어
+    키워드·기간 조건이 파일 glob 없이 인덱스 범위 스캔으로 처리되도록 함.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path or config.STORE_CONFIG["PATH"])
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._init_db()
+
+    def _init_db(self):
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    snapshot_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    keyword TEXT NOT NULL,
+                    snapshot_date TEXT NOT NULL,
+                    captured_at TEXT NOT NULL,
+                    source TEXT UNIQUE
+                );
+                CREATE INDEX IF NOT EXISTS idx_snapshots_partition ON snapshots (keyword, snapshot_date);
+
+                CREATE TABLE IF NOT EXISTS products (
+                    product_id INTEGER PRIMARY KEY,
+                    snapshot_id INTEGER NOT NULL REFERENCES snapshots (snapshot_id),
+                    keyword TEXT NOT NULL,
+                    snapshot_date TEXT NOT NULL,
+                    rank INTEGER,
+                    title TEXT,
+                    price INTEGER,
+                    store_name TEXT,
+                    tags TEXT,
+                    url TEXT,
+                    is_ad INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_products_partition ON products (keyword, snapshot_date, is_ad);
+
+                CREATE TABLE IF NOT EXISTS keyword_reports (
+                    snapshot_id INTEGER NOT NULL REFERENCES snapshots (snapshot_id),
+                    keyword TEXT NOT NULL,
+                    snapshot_date TEXT NOT NULL,
+                    rank INTEGER,
+                    token TEXT,
+                    count INTEGER,
+                    product_count INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS idx_keyword_reports_partition ON keyword_reports (keyword, snapshot_date);
+
+                CREATE TABLE IF NOT EXISTS tag_reports (
+                    snapshot_id INTEGER NOT NULL REFERENCES snapshots (snapshot_id),
+                    keyword TEXT NOT NULL,
+                    snapshot_date TEXT NOT NULL,
+                    rank INTEGER,
+                    tag TEXT,
+                    count INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS idx_tag_reports_partition ON tag_reports (keyword, snapshot_date);
+                """
+            )
+            self._add_product_id()
+
+    def _add_product_id(self):
+        """
+        product_id 컬럼이 없는 예전 products 테이블을 다시 만듦. 기존 rowid를 product_id로 옮겨
+        이미 색인된 posting이 그대로 맞고, 이후 VACUUM이 rowid를 다시 매겨도 product_id는 바뀌지 않음
+        """
+        columns = [r[1] for r in self._conn.execute("PRAGMA table_info(products)")]
+        if 'product_id' in columns:
+            return
+        self._conn.executescript(
+            """
+            BEGIN;
+            ALTER TABLE products RENAME TO products_legacy;
+            DROP INDEX IF EXISTS idx_products_partition;
+            CREATE TABLE products (
+                product_id INTEGER PRIMARY KEY,
+                snapshot_id INTEGER NOT NULL REFERENCES snapshots (snapshot_id),
+                keyword TEXT NOT NULL,
+                snapshot_date TEXT NOT NULL,
+                rank INTEGER,
+                title TEXT,
+                price INTEGER,
+                store_name TEXT,
+                tags TEXT,
+                url TEXT,
+                is_ad INTEGER NOT NULL DEFAULT 0
+            );
+            INSERT INTO products
+                SELECT rowid, snapshot_id, keyword, snapshot_date, rank, title, price, store_name, tags, url, is_ad
+                FROM products_legacy;
+            DROP TABLE products_legacy;
+            CREATE INDEX idx_products_partition ON products (keyword, snapshot_date, is_ad);
+            COMMIT;
+            """
+        )
+        logger.info("Store: products 테이블에 product_id 컬럼을 추가함")
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        잠금을 잡은 채로 연결을 빌려줌 (같은 DB 파일에 테이블을 두는 부가 색인용, 읽기 전용 조회)
+        """
+        with self._lock:
+            yield self._conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        connection()과 같지만 블록이 끝나면 커밋하고, 예외가 나면 롤백함
+        """
+        with self._lock, self._conn:
+            yield self._conn
+
+    # ------------------------------------------------------------------
+    # Write (append-only)
+    # ------------------------------------------------------------------
+    def has_source(self, source: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM snapshots WHERE source = ?", (source,)).fetchone()
+        return row is not None
+
+    def append_snapshot(
+        self,
+        keyword: str,
+        products: pd.DataFrame,
+        captured_at: Optional[datetime] = None,
+        source: Optional[str] = None,
+        keyword_report: Optional[KeywordReport] = None,
+        tag_report: Optional[TagReport] = None,
+    ) -> int:
+        """
+        수집 결과(results DataFrame)와 선택적으로 키워드/태그 리포트를 하나의 스냅샷으로 추가함.
+        Returns: snapshot_id
+        """
+        captured_at = captured_at or datetime.now()
+        snapshot_date = captured_at.date().isoformat()
+
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO snapshots (keyword, snapshot_date, captured_at, source) VALUES (?, ?, ?, ?)",
+                (keyword, snapshot_date, captured_at.isoformat(timespec="seconds"), source),
+            )
+            snapshot_id = cursor.lastrowid
+            partition = (snapshot_id, keyword, snapshot_date)
+
+            self._conn.executemany(
+                "INSERT INTO products (snapshot_id, keyword, snapshot_date, rank, title, price, store_name, tags, url, is_ad) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [partition + row for row in self._product_rows(products)],
+            )
+
+            if keyword_report is not None and not keyword_report.empty:
+                self._conn.executemany(
+                    "INSERT INTO keyword_reports (snapshot_id, keyword, snapshot_date, rank, token, count, product_count) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        partition + (int(r['순위']), str(r['키워드']), int(r['등장횟수']), int(r['관련_상품수']))
+                        for r in keyword_report.table.to_dict('records')
+                    ],
+                )
+
+            if tag_report is not None and not tag_report.empty:
+                self._conn.executemany(
+                    "INSERT INTO tag_reports (snapshot_id, keyword, snapshot_date, rank, tag, count) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        partition + (int(r['순위']), str(r['태그명']), int(r['사용_빈도']))
+                        for r in tag_report.table.to_dict('records')
+                    ],
+                )
+
+        logger.info(f"Store: snapshot #{snapshot_id} ({keyword}, {snapshot_date}) - {len(products)} products")
+        return snapshot_id
+
+    @staticmethod
+    def _product_rows(df: pd.DataFrame) -> List[tuple]:
+        def col(name, default=None):
+            if name in df.columns:
+                return df[name].tolist()
+            return [default] * len(df)
+
+        is_ad = [str(v).strip().lower() == 'true' for v in col('is_ad', False)]
+        ranks = col('순위')
+        prices = col('가격')
+        return [
+            (
+                int(rank) if pd.notna(rank) else None,
+                title if pd.notna(title) else None,
+                int(price) if pd.notna(price) else None,
+                store if pd.notna(store) else None,
+                tags if pd.notna(tags) else "",
+                str(url) if pd.notna(url) else None,
+                int(ad),
+            )
+            for rank, title, price, store, tags, url, ad in zip(
+                ranks, col('상품명'), prices, col('쇼핑몰명'), col('판매자_설정_태그', ""), col('URL'), is_ad
+            )
+        ]
+
+    # ------------------------------------------------------------------
+    # Query API
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _partition_filter(keyword: Optional[str], since: Optional[DateLike], until: Optional[DateLike]):
+        clauses, params = [], []
+        if keyword is not None:
+            clauses.append("keyword = ?")
+            params.append(keyword)
+        if since is not None:
+            clauses.append("snapshot_date >= ?")
+            params.append(to_date_str(since))
+        if until is not None:
+            clauses.append("snapshot_date <= ?")
+            params.append(to_date_str(until))
+        return clauses, params
+
+    def query_products(
+        self,
+        keyword: Optional[str] = None,
+        since: Optional[DateLike] = None,
+        until: Optional[DateLike] = None,
+        organic_only: bool = False,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        키워드/기간/광고여부 조건으로 상품 행을 조회함. 조건은 모두 SQL WHERE로 내려가 인덱스로 처리됨.
+        columns: PRODUCT_COLUMNS의 키 중 필요한 것만 (기본: 전체)
+        """
+        columns = list(columns or PRODUCT_COLUMNS.keys())
+        unknown = [c for c in columns if c not in PRODUCT_COLUMNS]
+        if unknown:
+            raise ValueError(f"알 수 없는 컬럼: {unknown}")
+
+        clauses, params = self._partition_filter(keyword, since, until)
+        if organic_only:
+            clauses.append("is_ad = 0")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        sql = f"SELECT {', '.join(columns)} FROM products {where} ORDER BY snapshot_date, snapshot_id, rank"
+        with self._lock:
+            df = pd.read_sql_query(sql, self._conn, params=params)
+        if 'is_ad' in df.columns:
+            df['is_ad'] = df['is_ad'].astype(bool)
+        return df.rename(columns=PRODUCT_COLUMNS)
+
+    def organic_titles(self, keyword: str, days: int = 30) -> List[str]:
+        """
+        예: 최근 30일간 키워드 X의 광고 제외 상품명 전체
+        """
+        since = date.today() - timedelta(days=days)
+        df = self.query_products(keyword=keyword, since=since, organic_only=True, columns=['title'])
+        return df['상품명'].dropna().tolist()
+
+    def query_keyword_reports(
+        self,
+        keyword: Optional[str] = None,
+        since: Optional[DateLike] = None,
+        until: Optional[DateLike] = None,
+    ) -> pd.DataFrame:
+        clauses, params = self._partition_filter(keyword, since, until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            "SELECT keyword AS 검색어, snapshot_date AS 수집일, snapshot_id, rank AS 순위, token AS 키워드, "
+            f"count AS 등장횟수, product_count AS 관련_상품수 FROM keyword_reports {where} "
+            "ORDER BY snapshot_date, snapshot_id, rank"
+        )
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    def query_tag_reports(
+        self,
+        keyword: Optional[str] = None,
+        since: Optional[DateLike] = None,
+        until: Optional[DateLike] = None,
+    ) -> pd.DataFrame:
+        clauses, params = self._partition_filter(keyword, since, until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            "SELECT keyword AS 검색어, snapshot_date AS 수집일, snapshot_id, rank AS 순위, tag AS 태그명, "
+            f"count AS 사용_빈도 FROM tag_reports {where} ORDER BY snapshot_date, snapshot_id, rank"
+        )
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    def snapshots(self, keyword: Optional[str] = None) -> pd.DataFrame:
+        clauses, params = self._partition_filter(keyword, None, None)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            return pd.read_sql_query(
+                f"SELECT * FROM snapshots {where} ORDER BY snapshot_date, snapshot_id", self._conn, params=params
+            )
+
+    def iter_snapshot_titles(self, snapshot_id: int, organic_only: bool = True, chunksize: int = 5000) -> Iterator[List[str]]:
+        """
+        스냅샷의 상품명을 chunksize 단위로 나눠서 돌려줌 (큰 스냅샷도 메모리에 한 번에 올리지 않음)
+        """
+        sql = "SELECT title FROM products WHERE snapshot_id = ? AND title IS NOT NULL"
+        if organic_only:
+            sql += " AND is_ad = 0"
+        sql += " ORDER BY rank"
+        with self._lock:
+            cursor = self._conn.execute(sql, (snapshot_id,))
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(chunksize)
+            if not rows:
+                break
+            yield [r[0] for r in rows]
+
+    def snapshot_products(self, snapshot_id: int, organic_only: bool = True) -> pd.DataFrame:
+        """
+        스냅샷의 (product_id, 순위, 상품명). product_id는 products 테이블의 INTEGER PRIMARY KEY로 저장소 전체에서 고유함
+        """
+        sql = "SELECT product_id, rank AS 순위, title AS 상품명 FROM products WHERE snapshot_id = ? AND title IS NOT NULL"
+        if organic_only:
+            sql += " AND is_ad = 0"
+        with self._lock:
+            return pd.read_sql_query(sql + " ORDER BY product_id", self._conn, params=(snapshot_id,))
+
+    def products_by_id(self, product_ids: Sequence[int], columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        product_id 목록으로 상품 행을 조회함 (product_id 컬럼 포함)
+        """
+        columns = list(columns or PRODUCT_COLUMNS.keys())
+        unknown = [c for c in columns if c not in PRODUCT_COLUMNS]
+        if unknown:
+            raise ValueError(f"알 수 없는 컬럼: {unknown}")
+        ids = [int(i) for i in product_ids]
+        frames = []
+        # SQLite 바인딩 변수 개수 제한을 피하려고 나눠서 조회
+        for start in range(0, len(ids), 900):
+            batch = ids[start:start + 900]
+            sql = (
+                f"SELECT product_id, {', '.join(columns)} FROM products "
+                f"WHERE product_id IN ({', '.join('?' * len(batch))})"
+            )
+            with self._lock:
+                frames.append(pd.read_sql_query(sql, self._conn, params=batch))
+        if not frames:
+            return pd.DataFrame(columns=['product_id'] + [PRODUCT_COLUMNS[c] for c in columns])
+        df = pd.concat(frames, ignore_index=True).sort_values('product_id', kind='mergesort')
+        if 'is_ad' in df.columns:
+            df['is_ad'] = df['is_ad'].astype(bool)
+        return df.rename(columns=PRODUCT_COLUMNS).reset_index(drop=True)
+
+    def keywords(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT keyword FROM snapshots ORDER BY keyword").fetchall()
+        return [r[0] for r in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,111 @@
+import logging
+import os
+import subprocess
+from typing import List, Optional
+
+import numpy as np
+from imageio_ffmpeg import get_ffmpeg_exe
+
+logger = logging.getLogger(__name__)
+
+
+class FFmpegPipeWriter:
+    """
+    raw RGB 프레임을 ffmpeg 프로세스의 stdin으로 바로 보내 인코딩 (MoviePy 프레임 합성/임시 파일 없음).
+    with FFmpegPipeWriter(path, 1080, 1920, 24) as writer:
+        for frame in frames:
+            writer.write(frame)
+    """
+
+    def __init__(
+        self,
+        output_filename: str,
+        width: int,
+        height: int,
+        fps: float,
+        codec: str = "libx264",
+        preset: str = "medium",
+        threads: Optional[int] = 4,
+        pix_fmt: str = "yuv420p",
+        extra_args: Optional[List[str]] = None,
+    ):
+        self.output_filename = output_filename
+        self.width = width
+        self.height = height
+        self.frames_written = 0
+
+        output_dir = os.path.dirname(output_filename)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        command = [
+            get_ffmpeg_exe(), "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-vcodec", "rawvideo",
+            "-s", f"{width}x{height}", "-pix_fmt", "rgb24", "-r", f"{fps}",
+            "-i", "-", "-an",
+            "-vcodec", codec, "-preset", preset, "-pix_fmt", pix_fmt,
+        ]
+        if threads:
+            command += ["-threads", str(threads)]
+        command += (extra_args or []) + [output_filename]
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def write(self, frame: np.ndarray):
+        if frame.shape != (self.height, self.width, 3):
+            raise ValueError(f"프레임 크기가 맞지 않습니다: {frame.shape} (기대: {(self.height, self.width, 3)})")
+        try:
+            self._process.stdin.write(np.ascontiguousarray(frame, dtype=np.uint8).tobytes())
+        except BrokenPipeError:
+            raise RuntimeError(f"ffmpeg 인코딩 실패: {self._stderr()}")
+        self.frames_written += 1
+
+    def _stderr(self) -> str:
+        self._process.wait()
+        return self._process.stderr.read().decode("utf-8", errors="replace").strip()
+
+    def close(self):
+        if self._process.stdin and not self._process.stdin.closed:
+            try:
+                self._process.stdin.close()
+            except BrokenPipeError:
+                pass
+        if self._process.wait() != 0:
+            raise RuntimeError(f"ffmpeg 인코딩 실패: {self._stderr()}")
+        self._process.stderr.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            # 예외로 중단되면 ffmpeg를 종료하고 원래 예외를 전파
+            self._process.kill()
+            self._process.wait()
+            return False
+        self.close()
+        return False
+
+
+def concat_videos(paths: List[str], output_filename: str):
+    """
+    같은 코덱/해상도/fps로 인코딩된 영상들을 재인코딩 없이 이어 붙임 (ffmpeg concat demuxer, -c copy)
+    """
+    output_dir = os.path.dirname(output_filename)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    list_path = f"{output_filename}.concat.txt"
+    with open(list_path, "w", encoding="utf-8") as f:
+        for path in paths:
+            escaped = os.path.abspath(path).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+    try:
+        result = subprocess.run(
+            [get_ffmpeg_exe(), "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", list_path, "-c", "copy", output_filename],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        )
+    finally:
+        os.remove(list_path)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg concat 실패: {result.stderr.decode('utf-8', errors='replace').strip()}")
+    return output_filename
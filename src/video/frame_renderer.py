@@ -0,0 +1,188 @@
+import math
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import PIL.Image
+
+
+class KenBurnsRenderer:
+    """
+    릴스 프레임 생성기 (MoviePy의 프레임마다 전체 해상도 resize + CompositeVideoClip 합성을 대체).
+    - 이미지마다 화면(width x height)을 꽉 채우도록 중앙 크롭한 원본을 (1 + zoom)배 크기로 한 번만 만들어 둠
+    - 프레임마다 줌 배율에 해당하는 중앙 영역을 잘라 화면 크기로 축소 (PIL resize box, 항상 축소라 선명함)
+    - crossfade는 uint16 정수 연산으로 두 프레임만 섞음
+
+    타이밍은 기존 MoviePy 경로(concatenate_videoclips(padding=-transition) + crossfadein)와 같음:
+    - 이미지 i는 i x (duration - transition)초에 시작해 duration초 동안 재생
+    - 전체 길이 = 이미지 수 x (duration - transition) (마지막 이미지도 padding만큼 잘림)
+    - 시작 후 transition초 동안 이전 이미지 위로 선형 crossfadein.
+      첫 이미지는 검은 화면에서 (재생 시간 / transition)^2로 나타남 (MoviePy에서 마스크가 두 번 적용되던 결과와 동일)
+    - 줌 배율 = 1 + zoom x (재생 시간 / duration), 프레임 시각 = np.arange(0, 전체 길이, 1 / fps)
+    """
+
+    def __init__(
+        self,
+        width: int = 1080,
+        height: int = 1920,
+        duration_per_image: float = 3.0,
+        transition_duration: float = 0.5,
+        fps: int = 24,
+        zoom: float = 0.05,
+    ):
+        self.width = width
+        self.height = height
+        self.duration_per_image = duration_per_image
+        self.transition_duration = transition_duration
+        self.fps = fps
+        self.zoom = zoom
+        self.source_size = (math.ceil(width * (1 + zoom)), math.ceil(height * (1 + zoom)))
+
+    def crop_box(self, image_size) -> Tuple[float, float, float, float]:
+        """
+        이미지 크기 (w, h)에서 화면 비율로 중앙 크롭할 영역 (left, top, right, bottom)
+        """
+        img_w, img_h = image_size
+        target_ratio = self.width / self.height
+        if img_w / img_h > target_ratio:
+            # 이미지가 더 넓음 -> 높이 기준, 좌우를 자름
+            crop_w, crop_h = img_h * target_ratio, img_h
+        else:
+            # 이미지가 더 길거나 같음 -> 너비 기준, 위아래를 자름
+            crop_w, crop_h = img_w, img_w / target_ratio
+        left, top = (img_w - crop_w) / 2, (img_h - crop_h) / 2
+        return left, top, left + crop_w, top + crop_h
+
+    def prepare_source(self, image: PIL.Image.Image) -> PIL.Image.Image:
+        """
+        화면 비율로 중앙 크롭 + source_size로 리사이즈한 RGB 이미지 (이미지당 1회)
+        """
+        image = image.convert("RGB")
+        return image.resize(self.source_size, PIL.Image.LANCZOS, box=self.crop_box(image.size))
+
+    def load_source(self, image_path: str) -> PIL.Image.Image:
+        with PIL.Image.open(image_path) as image:
+            return self.prepare_source(image)
+
+    def total_duration(self, n_images: int) -> float:
+        if n_images <= 0:
+            return 0.0
+        return n_images * (self.duration_per_image - self.transition_duration)
+
+    def frame_times(self, n_images: int) -> np.ndarray:
+        return np.arange(0, self.total_duration(n_images), 1.0 / self.fps)
+
+    def clip_start(self, index: int) -> float:
+        return index * (self.duration_per_image - self.transition_duration)
+
+    def active_clips(self, t: float, n_images: int) -> List[int]:
+        """
+        시각 t에 재생 중인 이미지 번호 (겹치는 구간에서는 2개, 아래 레이어부터)
+        """
+        step = self.duration_per_image - self.transition_duration
+        last = min(n_images - 1, int(t // step))
+        return [i for i in (last - 1, last) if i >= 0 and self.clip_start(i) <= t < self.clip_start(i) + self.duration_per_image]
+
+    def zoom_frame(self, source: PIL.Image.Image, local_t: float) -> np.ndarray:
+        """
+        재생 시간 local_t에서의 줌 프레임 (height, width, 3) uint8
+        """
+        scale = 1 + self.zoom * (local_t / self.duration_per_image)
+        src_w, src_h = self.source_size
+        # 화면 = 기본 크롭(source 전체)을 scale배 확대한 뒤 가운데 width x height -> source의 가운데 1/scale 영역
+        box_w, box_h = src_w / scale, src_h / scale
+        left, top = (src_w - box_w) / 2, (src_h - box_h) / 2
+        frame = source.resize((self.width, self.height), PIL.Image.BILINEAR, box=(left, top, left + box_w, top + box_h))
+        return np.asarray(frame)
+
+    @staticmethod
+    def blend(bottom: Optional[np.ndarray], top: np.ndarray, alpha: float) -> np.ndarray:
+        """
+        bottom 위에 top을 alpha(0~1) 불투명도로 합성. bottom이 None이면 검은 화면
+        """
+        if alpha >= 1.0:
+            return top
+        weight = int(round(alpha * 256))
+        if bottom is None:
+            return ((top.astype(np.uint16) * weight) >> 8).astype(np.uint8)
+        mixed = bottom.astype(np.uint16) * (256 - weight)
+        mixed += top.astype(np.uint16) * weight
+        return (mixed >> 8).astype(np.uint8)
+
+    def frame_at(self, sources: Sequence[PIL.Image.Image], t: float) -> np.ndarray:
+        frame = None
+        for index in self.active_clips(t, len(sources)):
+            local_t = t - self.clip_start(index)
+            alpha = min(1.0, local_t / self.transition_duration) if self.transition_duration > 0 else 1.0
+            if frame is None:
+                alpha = alpha * alpha
+            frame = self.blend(frame, self.zoom_frame(sources[index], local_t), alpha)
+        if frame is None:
+            return np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        return frame
+
+    def iter_frames(self, sources: Sequence[PIL.Image.Image], start: int = 0, stop: Optional[int] = None) -> Iterator[np.ndarray]:
+        """
+        frame_times 기준 [start, stop) 번째 프레임을 순서대로 생성
+        """
+        for t in self.frame_times(len(sources))[start:stop]:
+            yield self.frame_at(sources, float(t))
+
+    def segments(self, n_images: int) -> List[Tuple[int, int, List[int]]]:
+        """
+        이미지 단위 구간 [(시작 프레임, 끝 프레임(미포함), 필요한 이미지 번호)].
+        구간 i = 이미지 i가 시작하는 시각부터 이미지 i+1이 시작하기 직전까지 (앞쪽 crossfade 겹침 포함).
+        전체 frame_times의 인덱스로 나누므로 구간들을 이어 붙이면 한 번에 렌더링한 것과 프레임 시각이 같음
+        """
+        times = self.frame_times(n_images)
+        bounds = np.searchsorted(times, [self.clip_start(i) for i in range(n_images)] + [self.total_duration(n_images)])
+        bounds[0], bounds[-1] = 0, len(times)
+        result = []
+        for i in range(n_images):
+            start, stop = int(bounds[i]), int(bounds[i + 1])
+            if stop <= start:
+                continue
+            indices = sorted({index for t in times[start:stop] for index in self.active_clips(float(t), n_images)})
+            result.append((start, stop, indices))
+        return result
+
+
+class StaticOverlay:
+    """
+    모든 프레임의 같은 위치에 합성되는 정적 레이어 (자막 등).
+    화면 밖으로 나가는 부분은 미리 잘라 두고, 알파 가중치(0~256)와 미리 곱한 색(premultiplied)을 한 번만 계산해
+    프레임마다 해당 영역에만 정수 연산 한 번으로 합성함
+    """
+
+    def __init__(self, rgb: np.ndarray, alpha: np.ndarray, x: int, y: int, frame_size):
+        frame_w, frame_h = frame_size
+        # 완전히 투명한 가장자리는 합성할 필요가 없으므로 잘라냄
+        rows, cols = np.flatnonzero(alpha.any(axis=1)), np.flatnonzero(alpha.any(axis=0))
+        if not rows.size:
+            self.box, self.weight = (0, 0, 0, 0), None
+            return
+        alpha = alpha[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+        rgb = rgb[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+        x, y = x + int(cols[0]), y + int(rows[0])
+        h, w = alpha.shape
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(frame_w, x + w), min(frame_h, y + h)
+        self.box = (x0, y0, x1, y1)
+        if x1 <= x0 or y1 <= y0:
+            self.weight = None
+            return
+        alpha = alpha[y0 - y:y1 - y, x0 - x:x1 - x]
+        rgb = rgb[y0 - y:y1 - y, x0 - x:x1 - x, :3]
+        weight = np.round(np.clip(alpha, 0.0, 1.0) * 256).astype(np.uint16)[:, :, None]
+        self.weight = weight
+        self.inverse = (256 - weight).astype(np.uint16)
+        self.premultiplied = rgb.astype(np.uint16) * weight
+
+    def apply(self, frame: np.ndarray) -> np.ndarray:
+        if self.weight is None:
+            return frame
+        if not frame.flags.writeable:
+            frame = frame.copy()
+        x0, y0, x1, y1 = self.box
+        band = frame[y0:y1, x0:x1]
+        band[...] = ((band * self.inverse + self.premultiplied) >> 8).astype(np.uint8)
+        return frame
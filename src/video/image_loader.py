@@ -0,0 +1,188 @@
+import logging
+import math
+import sys
+from typing import Dict, List, Optional, Sequence
+
+import PIL.Image
+
+import config
+from src.video.frame_renderer import KenBurnsRenderer
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    현재 프로세스의 최대 RSS (MB). 지원하지 않는 OS면 None
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / _MB if sys.platform == "darwin" else peak / 1024
+
+
+class ImageLoader:
+    """
+    릴스 소스 이미지 로더 (상세페이지의 860 x 10000px 같은 긴 이미지를 전체 크기로 디코딩하지 않음).
+    - JPEG: draft로 DCT 단계에서 1/2~1/8 축소 디코딩 (중앙 크롭 영역이 source_size 이상 남는 범위에서)
+    - PNG(비인터레이스): 타일 높이를 중앙 크롭 영역의 아래 끝까지로 잘라 그 아래 행은 디코딩하지 않음
+    - 디코딩 버퍼 예상 크기가 max_decode_mb를 넘으면 JPEG는 더 축소하고, 그래도 넘으면 이미지를 거부
+    segment_sources()는 구간에 필요한 이미지만 메모리에 두고 나머지는 내보냄 (한 번에 최대 2장)
+    """
+
+    def __init__(self, renderer: KenBurnsRenderer, max_decode_mb: Optional[float] = None):
+        self.renderer = renderer
+        self.max_decode_mb = max_decode_mb or config.REELS_CONFIG["MAX_DECODE_MB"]
+        self._held: Dict[int, PIL.Image.Image] = {}
+        self.decoded = 0
+        self.peak_decode_bytes = 0
+        self.peak_resident_bytes = 0
+
+    @staticmethod
+    def _bytes_per_pixel(mode: str) -> int:
+        # PIL 내부 버퍼 기준 (RGB도 픽셀당 4바이트)
+        return 1 if mode in ("1", "L", "P") else 4
+
+    @staticmethod
+    def _source_bytes(image: PIL.Image.Image) -> int:
+        return image.width * image.height * 4
+
+    def _filter_margin(self, crop_h: float) -> int:
+        """
+        LANCZOS 축소가 크롭 영역 경계 밖에서 참조하는 행 수 (이만큼 더 남겨야 전체 디코딩과 결과가 같음)
+        """
+        return math.ceil(3 * max(1.0, crop_h / self.renderer.source_size[1])) + 1
+
+    @staticmethod
+    def _can_truncate(image: PIL.Image.Image) -> bool:
+        """
+        디코딩 행 수를 줄이는 데 쓰는 PIL 내부 속성(_size, tile)이 기대한 형태인지 확인.
+        Pillow 버전이 달라 형태가 다르면 잘라내지 않고 전체를 디코딩함
+        """
+        return (
+            hasattr(image, "_size")
+            and isinstance(getattr(image, "tile", None), list)
+            and len(image.tile) == 1
+            and isinstance(image.tile[0], tuple)
+            and len(image.tile[0]) >= 2
+        )
+
+    def _truncatable(self, image: PIL.Image.Image) -> bool:
+        return (
+            self._can_truncate(image)
+            and image.format == "PNG"
+            and not image.info.get("interlace")
+            and getattr(image, "n_frames", 1) == 1
+            and tuple(image.tile[0][1]) == (0, 0) + image.size
+        )
+
+    def _plan(self, image: PIL.Image.Image, image_path: str):
+        """
+        (JPEG 축소 배율 k, 디코딩할 행 수, 예상 디코딩 바이트). 상한을 넘으면 ValueError
+        """
+        img_w, img_h = image.size
+        left, top, right, bottom = self.renderer.crop_box(image.size)
+        bpp = self._bytes_per_pixel(image.mode)
+        limit = self.max_decode_mb * _MB
+
+        if image.format == "JPEG":
+            src_w, src_h = self.renderer.source_size
+            # 크롭 영역이 source_size보다 작아지지 않는 가장 큰 축소 배율
+            scale = 1
+            for k in (2, 4, 8):
+                if (right - left) / k >= src_w and (bottom - top) / k >= src_h:
+                    scale = k
+            while math.ceil(img_w / scale) * math.ceil(img_h / scale) * bpp > limit and scale < 8:
+                scale *= 2
+            rows = math.ceil(img_h / scale)
+            decode_bytes = math.ceil(img_w / scale) * rows * bpp
+        else:
+            scale = 1
+            rows = min(img_h, math.ceil(bottom) + self._filter_margin(bottom - top)) if self._truncatable(image) else img_h
+            decode_bytes = img_w * rows * bpp
+
+        if decode_bytes > limit:
+            raise ValueError(
+                f"이미지 디코딩 메모리 {decode_bytes / _MB:.0f}MB가 상한 {self.max_decode_mb}MB를 넘습니다: {image_path}"
+            )
+        return scale, rows, decode_bytes
+
+    def inspect(self, image_path: str) -> int:
+        """
+        헤더만 읽어 디코딩 가능 여부 확인 (예상 디코딩 바이트 반환, 상한 초과 시 ValueError)
+        """
+        with PIL.Image.open(image_path) as image:
+            return self._plan(image, image_path)[2]
+
+    def load_source(self, image_path: str) -> PIL.Image.Image:
+        """
+        메모리를 아껴 디코딩한 Ken Burns 소스 (KenBurnsRenderer.load_source와 같은 결과 크기)
+        """
+        with PIL.Image.open(image_path) as image:
+            scale, rows, decode_bytes = self._plan(image, image_path)
+            img_w, img_h = image.size
+            left, top, right, bottom = self.renderer.crop_box(image.size)
+
+            if scale > 1:
+                image.draft(None, (math.ceil(img_w / scale), math.ceil(img_h / scale)))
+                sx, sy = image.width / img_w, image.height / img_h
+                left, top, right, bottom = left * sx, top * sy, right * sx, bottom * sy
+            elif rows < img_h:
+                # 크롭 영역 아래쪽 행은 디코딩하지 않음
+                tile = image.tile[0]
+                extents = (0, 0, img_w, rows)
+                image._size = (img_w, rows)
+                # Pillow 11부터 tile 항목은 namedtuple(ImageFile._Tile), 그 전에는 일반 tuple
+                image.tile = [tile._replace(extents=extents) if hasattr(tile, "_replace") else (tile[0], extents) + tuple(tile[2:])]
+
+            self._record(decode_bytes)
+            image.load()
+            if image.mode != "RGB":
+                # 색 변환 전에 크롭 영역만 남겨 변환 버퍼를 줄임
+                margin = self._filter_margin(bottom - top)
+                y0 = max(0, int(top) - margin)
+                image = image.crop((0, y0, image.width, min(image.height, math.ceil(bottom) + margin))).convert("RGB")
+                top, bottom = top - y0, bottom - y0
+            source = image.resize(self.renderer.source_size, PIL.Image.LANCZOS, box=(left, top, right, bottom))
+        self.decoded += 1
+        return source
+
+    def _record(self, decode_bytes: int):
+        # 리사이즈 중에는 디코딩 버퍼 + 새 소스 + 이미 들고 있는 소스가 동시에 존재
+        src_w, src_h = self.renderer.source_size
+        held = sum(self._source_bytes(source) for source in self._held.values())
+        self.peak_decode_bytes = max(self.peak_decode_bytes, decode_bytes)
+        self.peak_resident_bytes = max(self.peak_resident_bytes, held + decode_bytes + src_w * src_h * 4)
+
+    def segment_sources(self, image_paths: Sequence[str], indices: Sequence[int]) -> List[Optional[PIL.Image.Image]]:
+        """
+        KenBurnsRenderer.frame_at에 넘길 소스 목록 (indices 외에는 None). 필요 없어진 소스는 먼저 내보낸 뒤 새로 디코딩
+        """
+        for index in list(self._held):
+            if index not in indices:
+                del self._held[index]
+        for index in indices:
+            if index not in self._held:
+                self._held[index] = self.load_source(image_paths[index])
+        return [self._held.get(i) for i in range(len(image_paths))]
+
+    def release(self):
+        self._held.clear()
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        rss = peak_rss_mb()
+        return {
+            "decoded": self.decoded,
+            "peak_decode_mb": round(self.peak_decode_bytes / _MB, 1),
+            "peak_resident_mb": round(self.peak_resident_bytes / _MB, 1),
+            "max_decode_mb": self.max_decode_mb,
+            "peak_rss_mb": round(rss, 1) if rss is not None else None,
+        }
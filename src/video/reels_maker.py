@@ -1,37 +1,54 @@
 import os
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 import PIL.Image
 
 if not hasattr(PIL.Image, 'ANTIALIAS'):
     PIL.Image.ANTIALIAS = PIL.Image.LANCZOS
 
-# Configure ImageMagick path for Windows
-imagemagick_path = r"C:\Program Files\ImageMagick-7.1.2-Q16-HDRI\magick.exe"
-if os.path.exists(imagemagick_path):
-    os.environ["IMAGEMAGICK_BINARY"] = imagemagick_path
-
 from moviepy.editor import *
-from moviepy.video.fx.all import resize
 import logging
 
+import config
+from src.video.frame_renderer import KenBurnsRenderer
+from src.video.image_loader import ImageLoader
+from src.video.segment_render import compose_frame, encode_frames, iter_segment_frames, render_parallel
+from src.video.subtitle import SubtitleRenderer
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class ReelsMaker:
-    def __init__(self):
+    def __init__(self, backend: Optional[str] = None):
+        """
+        backend: "ffmpeg" (프레임을 ffmpeg 파이프로 직접 인코딩) / "moviepy" (VideoClip + write_videofile).
+        기본값은 config.REELS_CONFIG["BACKEND"]
+        """
+        self.backend = backend or config.REELS_CONFIG["BACKEND"]
+        if self.backend not in ("ffmpeg", "moviepy"):
+            raise ValueError(f"알 수 없는 릴스 렌더링 백엔드: {self.backend} (가능: ffmpeg, moviepy)")
+        self.preset = config.REELS_CONFIG["PRESET"]
+        self.threads = config.REELS_CONFIG["THREADS"]
+        self.workers = config.REELS_CONFIG["WORKERS"] or os.cpu_count() or 1
+
         self.width = 1080
         self.height = 1920
         self.duration_per_image = 3.0
         self.transition_duration = 0.5
         self.fps = 24
+
+        self.renderer = KenBurnsRenderer(
+            self.width, self.height, self.duration_per_image, self.transition_duration, self.fps
+        )
+        self.loader = ImageLoader(self.renderer, config.REELS_CONFIG["MAX_DECODE_MB"])
         
         # 폰트 경로 확인 (프로젝트 루트의 font.ttf)
         self.font_path = "font.ttf"
         if not os.path.exists(self.font_path):
             logger.warning(f"Font file not found at {self.font_path}. Text might not render correctly or will use default.")
-            self.font_path = None # None이면 MoviePy 기본값(ImageMagick 검색) 사용
+            self.font_path = None # None이면 PIL 기본 폰트 사용
+        self.subtitle = SubtitleRenderer(self.font_path, font_size=70)
 
     def make_reels(self, image_paths: List[str], text: str, output_filename: str):
         """
@@ -45,116 +62,67 @@ class ReelsMaker:
             logger.error("No images provided for Reels.")
             return None
 
-        # 1. 이미지 클립 생성 및 효과 적용
-        clips = []
-        for img_path in image_paths:
-            if not os.path.exists(img_path):
-                continue
-                
-            # 이미지 로드
-            clip = ImageClip(img_path)
-            
-            # A. 9:16 비율에 맞춰 center crop 및 resize
-            # 먼저 화면을 꽉 채우도록 비율 유지 리사이즈
-            img_w, img_h = clip.size
-            target_ratio = self.width / self.height
-            img_ratio = img_w / img_h
-            
-            if img_ratio > target_ratio:
-                # 이미지가 더 넓음 -> 높이를 1920에 맞춤
-                clip = clip.resize(height=self.height)
-            else:
-                # 이미지가 더 길거나 같음 -> 너비를 1080에 맞춤
-                clip = clip.resize(width=self.width)
-                
-            # 중앙 크롭 (정확히 1080x1920으로)
-            clip = clip.crop(x_center=clip.w/2, y_center=clip.h/2, width=self.width, height=self.height)
-            
-            # B. Duration 설정
-            clip = clip.set_duration(self.duration_per_image)
-            
-            # C. Ken Burns Effect (Zoom In 1.0 -> 1.05)
-            # lambda t: 1 + 0.05 * (t / duration)
-            # resize는 계산 비용이 높으므로, 미리 큰 이미지를 잘라내거나 해야 하지만,
-            # 여기서는 편의상 moviepy의 resize 변환을 사용 (다소 느릴 수 있음)
-            clip = clip.resize(lambda t: 1 + 0.05 * (t / self.duration_per_image))
-            
-            # D. Center Zoom을 위해 다시 Composition (화면 중앙 고정)
-            # 크기가 커지면 중심이 어긋날 수 있으므로 'center' 위치 고정
-            clip = clip.set_position(('center', 'center'))
-            
-            # E. Transition을 위한 Crossfade In
-            # 첫 클립 제외하고 fade in 적용? 
-            # concatenate_videoclips의 method='compose'와 padding을 사용할 것이므로
-            # 개별 클립에 fadein을 걸어주면 겹치는 부분에서 효과가 남.
-            clip = clip.crossfadein(self.transition_duration)
-            
-            clips.append(clip)
-
-        if not clips:
+        # 1. 사용할 이미지 확인 (헤더만 읽어 없거나 이미지가 아니거나 디코딩 메모리 상한을 넘는 파일 제외)
+        image_paths = [p for p in image_paths if os.path.exists(p) and self._readable(p)]
+        if not image_paths:
             logger.error("No valid clips created.")
             return None
 
-        # 2. 클립 연결 (Transition)
-        # padding = -transition_duration (겹치게 함)
-        video = concatenate_videoclips(clips, method="compose", padding=-self.transition_duration)
-        
-        # 마지막 클립의 길이가 겹침으로 인해 줄어드는 것 보정은 moviepy가 자동 처리하지만,
-        # 전체 길이를 확인해볼 필요는 있음.
+        # 2. 자막 (Text Overlay): 텍스트/테두리/그림자를 한 번만 그려 두고 프레임마다 자막 영역만 블렌딩
+        # 화면 좌우 여백 50px, 첫 줄 위쪽 = 하단에서 300px
+        overlays = []
+        if text:
+            overlays.append(self.subtitle.overlay(text, (self.width, self.height), top=self.height - 300, margin=50))
+
+        # 3. 렌더링: 소스(9:16 중앙 크롭 + 줌 여유분 크기)는 구간마다 필요한 것만 축소 디코딩해 두고 지난 것은 내보냄
+        workers = min(self.workers, len(image_paths))
+        if self.backend == "ffmpeg" and workers > 1:
+            # 이미지 단위 구간을 여러 프로세스에서 나눠 인코딩 후 재인코딩 없이 이어 붙임 (소스는 각 프로세스가 직접 읽음)
+            logger.info(f"Rendering Reels to {output_filename} (ffmpeg, {workers} workers)...")
+            stats = render_parallel(
+                self.renderer, image_paths, overlays, output_filename,
+                preset=self.preset, threads=self.threads, workers=workers,
+                max_decode_mb=self.loader.max_decode_mb,
+            )
+        else:
+            logger.info(f"Rendering Reels to {output_filename} ({self.backend})...")
+            if self.backend == "ffmpeg":
+                self._render_ffmpeg(image_paths, overlays, output_filename)
+            else:
+                self._render_moviepy(image_paths, overlays, output_filename)
+            stats = self.loader.stats()
+        logger.info("Rendering complete.")
+        logger.info(
+            f"Reels memory: peak decode {stats['peak_decode_mb']}MB (limit {stats['max_decode_mb']}MB), "
+            f"sources resident {stats['peak_resident_mb']}MB, peak RSS {stats['peak_rss_mb']}MB"
+        )
         
-        # Ken Burns Resize로 인해 캔버스보다 커진 화면을 1080x1920으로 잘라내기 위해
-        # CompositeVideoClip으로 감싸고 size를 지정
-        video = CompositeVideoClip([video], size=(self.width, self.height))
+        return output_filename
 
+    def _readable(self, image_path: str) -> bool:
+        """
+        이미지 헤더만 읽어 디코딩 가능한 파일인지 확인 (전체 디코딩 없음)
+        """
+        try:
+            self.loader.inspect(image_path)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to load image {image_path}: {e}")
+            return False
 
-        # 3. 자막 (Text Overlay)
-        if text:
-            # 폰트 설정
-            font_to_use = self.font_path if self.font_path else 'Arial-Bold'
-            
-            # TextClip 생성
-            # stroke_color='black', stroke_width=2 (테두리)
-            # 그림자는 별도 클립으로 뒤에 깔아야 함 (MoviePy는 shadow 직접 지원 X)
-            
-            # 메인 자막
-            txt_clip = TextClip(
-                text,
-                font=font_to_use,
-                fontsize=70,
-                color='white',
-                stroke_color='black',
-                stroke_width=2,
-                method='caption', # 자동 줄바꿈
-                size=(self.width - 100, None), # 좌우 여백 50씩
-                align='South', # 하단 정렬
-            )
-            
-            # 그림자 (검은색, 투명도 조절은 어려우니 그냥 검은색)
-            shadow_clip = TextClip(
-                text,
-                font=font_to_use,
-                fontsize=70,
-                color='black',
-                method='caption',
-                size=(self.width - 100, None),
-                align='South',
-            ).set_opacity(0.6)
-            
-            # 위치 설정 (하단에서 200px 띄움)
-            # 'bottom'은 화면 끝, margin을 주려면 ('center', height-200) 식으로 좌표 계산 필요
-            # relative position: ('center', 0.8) -> 상단 80% 지점 (하단 근처)
-            
-            txt_y_pos = self.height - 300
-            
-            txt_clip = txt_clip.set_position(('center', txt_y_pos)).set_duration(video.duration)
-            shadow_clip = shadow_clip.set_position(('center', txt_y_pos + 5)).set_duration(video.duration) # 5px offset
-            
-            # 영상 위에 자막 합성
-            video = CompositeVideoClip([video, shadow_clip, txt_clip], size=(self.width, self.height))
+    def _render_moviepy(self, image_paths, overlays, output_filename: str):
+        # 4. Ken Burns (Zoom In 1.0 -> 1.05) + Crossfade Transition + 자막
+        # 프레임마다 전체 해상도 resize/합성을 하지 않고, 미리 만든 소스에서 잘라 축소 + 두 프레임 블렌딩만 함
+        # (타이밍은 기존 concatenate_videoclips(padding=-transition) + crossfadein 경로와 동일)
+        n_images = len(image_paths)
 
-        # 4. 렌더링 (무음)
-        logger.info(f"Rendering Reels to {output_filename}...")
-        
+        def make_frame(t):
+            sources = self.loader.segment_sources(image_paths, self.renderer.active_clips(t, n_images))
+            return compose_frame(self.renderer, sources, overlays, t)
+
+        video = VideoClip(make_frame, duration=self.renderer.total_duration(n_images))
+
+        # 5. 렌더링 (무음)
         output_dir = os.path.dirname(output_filename)
         if output_dir and not os.path.exists(output_dir):
             os.makedirs(output_dir)
@@ -164,12 +132,19 @@ class ReelsMaker:
             fps=self.fps,
             codec='libx264',
             audio=False,
-            threads=4,
-            preset='medium' # 인코딩 속도/화질 타협
+            threads=self.threads,
+            preset=self.preset # 인코딩 속도/화질 타협
         )
-        logger.info("Rendering complete.")
-        
-        return output_filename
+        self.loader.release()
+
+    def _render_ffmpeg(self, image_paths, overlays, output_filename: str):
+        """
+        프레임 생성기 -> (정적 자막 합성) -> ffmpeg stdin 파이프로 바로 인코딩 (MoviePy 합성 없음)
+        """
+        frames = iter_segment_frames(
+            self.renderer, self.loader, image_paths, overlays, self.renderer.segments(len(image_paths))
+        )
+        encode_frames(self.renderer, frames, output_filename, preset=self.preset, threads=self.threads)
 
 if __name__ == "__main__":
     # Test Logic
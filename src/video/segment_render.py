@@ -0,0 +1,139 @@
+import logging
+import multiprocessing as mp
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.video.ffmpeg_writer import FFmpegPipeWriter, concat_videos
+from src.video.frame_renderer import KenBurnsRenderer, StaticOverlay
+from src.video.image_loader import ImageLoader
+
+logger = logging.getLogger(__name__)
+
+
+def compose_frame(renderer: KenBurnsRenderer, sources: Sequence, overlays: Sequence[StaticOverlay], t: float) -> np.ndarray:
+    """
+    시각 t의 Ken Burns 프레임 위에 정적 레이어(자막)를 합성
+    """
+    frame = renderer.frame_at(sources, t)
+    for overlay in overlays:
+        frame = overlay.apply(frame)
+    return frame
+
+
+def encode_frames(
+    renderer: KenBurnsRenderer,
+    frames: Iterable[np.ndarray],
+    output_filename: str,
+    preset: str = "medium",
+    threads: Optional[int] = 4,
+) -> int:
+    """
+    프레임들을 ffmpeg 파이프로 인코딩하고 쓴 프레임 수를 돌려줌
+    """
+    with FFmpegPipeWriter(
+        output_filename, renderer.width, renderer.height, renderer.fps,
+        codec="libx264", preset=preset, threads=threads,
+    ) as writer:
+        for frame in frames:
+            writer.write(frame)
+    return writer.frames_written
+
+
+def iter_segment_frames(
+    renderer: KenBurnsRenderer,
+    loader: ImageLoader,
+    image_paths: List[str],
+    overlays: Sequence[StaticOverlay],
+    segments: Sequence[Tuple[int, int, List[int]]],
+) -> Iterator[np.ndarray]:
+    """
+    구간 순서대로 프레임 생성. 구간마다 필요한 소스만 디코딩해 두고 지난 소스는 내보냄
+    """
+    times = renderer.frame_times(len(image_paths))
+    for start, stop, indices in segments:
+        sources = loader.segment_sources(image_paths, indices)
+        for t in times[start:stop]:
+            yield compose_frame(renderer, sources, overlays, float(t))
+    loader.release()
+
+
+def render_segment(
+    renderer: KenBurnsRenderer,
+    image_paths: List[str],
+    segment: Tuple[int, int, List[int]],
+    overlays: Sequence[StaticOverlay],
+    output_filename: str,
+    preset: str,
+    threads: Optional[int],
+    max_decode_mb: Optional[float] = None,
+) -> Dict:
+    """
+    프로세스 풀 작업 단위: 구간에 필요한 이미지만 읽어 구간 하나를 별도 mp4로 인코딩. 워커의 메모리 통계를 돌려줌
+    """
+    loader = ImageLoader(renderer, max_decode_mb)
+    frames = iter_segment_frames(renderer, loader, image_paths, overlays, [segment])
+    written = encode_frames(renderer, frames, output_filename, preset, threads)
+    return dict(loader.stats(), frames=written)
+
+
+def merge_stats(stats: Sequence[Dict]) -> Dict:
+    """
+    워커별 메모리 통계 합치기 (디코딩 수는 합, 나머지는 워커 중 최댓값)
+    """
+    merged = {}
+    for item in stats:
+        for key, value in item.items():
+            if value is None:
+                merged.setdefault(key, None)
+            elif key in ("decoded", "frames"):
+                merged[key] = (merged.get(key) or 0) + value
+            else:
+                merged[key] = max(merged.get(key) or 0, value)
+    return merged
+
+
+def render_parallel(
+    renderer: KenBurnsRenderer,
+    image_paths: List[str],
+    overlays: Sequence[StaticOverlay],
+    output_filename: str,
+    preset: str = "medium",
+    threads: Optional[int] = 4,
+    workers: Optional[int] = None,
+    max_decode_mb: Optional[float] = None,
+    start_method: Optional[str] = None,
+) -> Dict:
+    """
+    이미지 단위 구간(crossfade 겹침 포함)을 프로세스 풀에서 따로 인코딩한 뒤 ffmpeg concat(-c copy)으로 이어 붙임.
+    구간은 전체 frame_times 인덱스로 나누므로 프레임 수/시각은 한 번에 렌더링한 결과와 같음.
+    ffmpeg 스레드는 워커 수로 나눠 코어를 과하게 점유하지 않게 함. 워커 메모리 통계(최댓값)를 돌려줌
+    워커는 fork 대신 forkserver(없으면 spawn)로 띄움 (이벤트 루프/저장 스레드가 도는 부모를 fork하지 않게)
+    """
+    segments = renderer.segments(len(image_paths))
+    workers = max(1, min(workers or os.cpu_count() or 1, len(segments)))
+    segment_threads = max(1, (threads or 1) // workers)
+
+    output_dir = os.path.dirname(os.path.abspath(output_filename))
+    os.makedirs(output_dir, exist_ok=True)
+    if start_method is None:
+        start_method = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+    results = []
+    with tempfile.TemporaryDirectory(prefix="reels_segments_", dir=output_dir) as tmp:
+        paths = [os.path.join(tmp, f"segment_{i:03d}.mp4") for i in range(len(segments))]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context(start_method)) as executor:
+            futures = {
+                executor.submit(
+                    render_segment, renderer, image_paths, segment, overlays, path,
+                    preset, segment_threads, max_decode_mb,
+                ): i
+                for i, (segment, path) in enumerate(zip(segments, paths))
+            }
+            for future in as_completed(futures):
+                results.append(future.result())
+                logger.info(f"Segment {futures[future] + 1}/{len(segments)} encoded ({results[-1]['frames']} frames)")
+        concat_videos(paths, output_filename)
+    return merge_stats(results)
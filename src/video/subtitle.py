@@ -0,0 +1,118 @@
+import logging
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+from src.video.frame_renderer import StaticOverlay
+
+logger = logging.getLogger(__name__)
+
+
+class SubtitleRenderer:
+    """
+    릴스 자막을 PIL로 한 번만 그려 RGBA 레이어로 만듦 (MoviePy TextClip 2개 + ImageMagick 대체).
+    - 흰 글씨 + 검은 테두리(stroke) + 흐린 검은 그림자(불투명도 0.6, 아래로 5px)
+    - 최대 너비에 맞춰 단어 단위 자동 줄바꿈 (한 단어가 너무 길면 글자 단위), 각 줄 가운데 정렬
+    overlay()로 만든 StaticOverlay를 프레임마다 apply하면 자막 영역만 정수 블렌딩함
+    """
+
+    def __init__(
+        self,
+        font_path: Optional[str] = "font.ttf",
+        font_size: int = 70,
+        color: Tuple[int, int, int] = (255, 255, 255),
+        stroke_color: Tuple[int, int, int] = (0, 0, 0),
+        stroke_width: int = 2,
+        shadow_offset: int = 5,
+        shadow_opacity: float = 0.6,
+        shadow_blur: float = 3.0,
+    ):
+        self.font = self._load_font(font_path, font_size)
+        self.color = color
+        self.stroke_color = stroke_color
+        self.stroke_width = stroke_width
+        self.shadow_offset = shadow_offset
+        self.shadow_opacity = shadow_opacity
+        self.shadow_blur = shadow_blur
+        ascent, descent = self.font.getmetrics()
+        self.line_height = ascent + descent
+        # 테두리와 그림자 번짐이 잘리지 않도록 레이어 사방에 두는 여백
+        self.padding = stroke_width + int(np.ceil(shadow_blur * 3))
+
+    @staticmethod
+    def _load_font(font_path: Optional[str], font_size: int):
+        if font_path and os.path.exists(font_path):
+            return ImageFont.truetype(font_path, font_size)
+        logger.warning(f"Font file not found at {font_path}. Using PIL default font (Korean may not render).")
+        try:
+            return ImageFont.load_default(size=font_size)
+        except TypeError:
+            # Pillow 10.1 미만은 크기 지정 불가
+            return ImageFont.load_default()
+
+    def wrap(self, text: str, max_width: int) -> List[str]:
+        """
+        max_width(px)에 맞춘 줄 목록 (입력의 줄바꿈은 유지)
+        """
+        lines = []
+        for paragraph in text.splitlines() or [""]:
+            line = ""
+            for word in paragraph.split():
+                candidate = f"{line} {word}" if line else word
+                if self._width(candidate) <= max_width:
+                    line = candidate
+                    continue
+                if line:
+                    lines.append(line)
+                line = ""
+                # 한 단어가 한 줄보다 길면 글자 단위로 자름
+                for char in word:
+                    if line and self._width(line + char) > max_width:
+                        lines.append(line)
+                        line = ""
+                    line += char
+            lines.append(line)
+        return lines
+
+    def _width(self, text: str) -> float:
+        return self.font.getlength(text) + 2 * self.stroke_width
+
+    def render(self, text: str, max_width: int) -> Image.Image:
+        """
+        자막 RGBA 레이어. 크기 = (max_width + 2 x padding, 줄 수 x 줄 높이 + 그림자 오프셋 + 2 x padding)
+        """
+        lines = self.wrap(text, max_width)
+        pad = self.padding
+        size = (max_width + 2 * pad, len(lines) * self.line_height + 2 * self.stroke_width + self.shadow_offset + 2 * pad)
+
+        text_layer = Image.new("RGBA", size, (0, 0, 0, 0))
+        shadow_mask = Image.new("L", size, 0)
+        text_draw = ImageDraw.Draw(text_layer)
+        shadow_draw = ImageDraw.Draw(shadow_mask)
+        for i, line in enumerate(lines):
+            x = pad + (max_width - self._width(line)) / 2 + self.stroke_width
+            y = pad + self.stroke_width + i * self.line_height
+            shadow_draw.text((x, y + self.shadow_offset), line, font=self.font, fill=255)
+            text_draw.text(
+                (x, y), line, font=self.font, fill=self.color,
+                stroke_width=self.stroke_width, stroke_fill=self.stroke_color,
+            )
+
+        if self.shadow_blur > 0:
+            shadow_mask = shadow_mask.filter(ImageFilter.GaussianBlur(self.shadow_blur))
+        shadow_mask = shadow_mask.point(lambda v: int(round(v * self.shadow_opacity)))
+        shadow = Image.new("RGBA", size, (0, 0, 0, 0))
+        shadow.putalpha(shadow_mask)
+        return Image.alpha_composite(shadow, text_layer)
+
+    def overlay(self, text: str, frame_size: Tuple[int, int], top: int, margin: int = 50) -> StaticOverlay:
+        """
+        화면(frame_size) 좌우 margin 안에서 가운데 정렬, 첫 줄 위쪽이 top(px)인 StaticOverlay
+        """
+        frame_w, _ = frame_size
+        max_width = frame_w - 2 * margin
+        layer = np.asarray(self.render(text, max_width))
+        alpha = layer[:, :, 3] / 255.0
+        return StaticOverlay(layer[:, :, :3], alpha, margin - self.padding, top - self.padding, frame_size)
@@ -1,46 +1,28 @@
-import google.generativeai as genai
+import asyncio
 import os
+import sys
 import json
 import logging
-from typing import List, Dict, Optional
-from dotenv import load_dotenv
+import time
+from typing import Any, AsyncIterator, List, Dict, Iterable, Optional, Tuple
 import config
+from src.models.copy_request import CopyRequest
+from src.writer.image_prep import ImagePreparer
+from src.writer.json_stream import JsonFieldStream
+from src.writer.llm_backend import create_backend
+from src.writer.response_cache import ResponseCache, content_hash, make_cache_key
+from src.writer.structured_output import COPY_FIELDS, REQUIRED_FIELDS, GenerationStats, parse_copy, response_schema
+from src.writer.throttle import AsyncTokenBucket, retry_async
+from src.writer.title_scorer import TitleScorer
+from src.writer.token_usage import TokenUsage
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class AICopywriter:
-    """
-    Google Gemini API를 사용하여 쇼핑몰 상품 원고를 생성하는 클래스.
-    """
-    
-    def __init__(self):
-        load_dotenv()
-        
-        self.api_key = os.getenv(config.GENAI_CONFIG["API_KEY_ENV"])
-        if not self.api_key:
-            logger.error("GOOGLE_API_KEY is not set in environment variables.")
-            raise ValueError("GOOGLE_API_KEY is missing via .env")
-            
-        genai.configure(api_key=self.api_key)
-        
-        self.model_name = config.GENAI_CONFIG["MODEL_NAME"]
-        self.model = genai.GenerativeModel(self.model_name)
-        
-    def generate_copy(self, product_name: str, keywords: List[str], tags: List[str], image_paths: Optional[List[str]] = None, target_keyword: Optional[str] = None) -> Optional[Dict]:
-        """
-        Generates marketing copy for a product using Gemini.
-        Supports text-only or multimodal (text + image) input.
-        Returns a JSON dictionary.
-        """
-        
-        # Prepare inputs
-        keywords_str = ", ".join(keywords)
-        tags_str = ", ".join(tags)
-        
-        # Base System Prompt (Persona)
-        system_instruction = """
+# Base System Prompt (Persona)
+# 모든 요청에 공통인 정적 지시문이므로 사용자 프롬프트에 붙이지 않고 system_instruction(또는 컨텍스트 캐시)으로 한 번만 설정함
+PERSONA_INSTRUCTION = """
         [Instruction]
         너는 3050 여성을 위한 프리미엄 의류 쇼핑몰 '쥴리씨'의 수석 큐레이터이자 카피라이터다.
         너의 역할은 **'우아한 실용주의'**를 바탕으로 고객의 구매 욕구를 자극하는 것이다.
@@ -63,6 +45,351 @@ class AICopywriter:
         - (Good - 3050용): "들기만 해도 우아해지는, 가볍고 따뜻한 리얼 양털의 품격 🐑"
         """
 
+class AICopywriter:
+    """
+    Google Gemini API를 사용하여 쇼핑몰 상품 원고를 생성하는 클래스.
+    """
+    
+    def __init__(self, use_cache: bool = True, model=None, backend: Optional[str] = None):
+        """
+        backend: LLM 백엔드 이름 ("gemini" / "local", 기본은 GENAI_CONFIG["BACKEND"], src/writer/llm_backend.py).
+        model: generate_content 인터페이스를 가진 백엔드 객체를 직접 주입 (예: LocalStubModel).
+        gemini 백엔드만 GOOGLE_API_KEY가 필요함
+        """
+        self.model_name = config.GENAI_CONFIG["MODEL_NAME"]
+        self.model = model if model is not None else create_backend(backend, self.model_name, PERSONA_INSTRUCTION)
+        # 응답 캐시 네임스페이스: 백엔드가 다르면 같은 프롬프트라도 캐시를 공유하지 않음 (local 대역 원고가 gemini 캐시로 새지 않게)
+        self.cache_model = f"{getattr(self.model, 'name', type(self.model).__name__)}:{self.model_name}"
+
+        # 호출별 토큰 사용량 (캐시된 페르소나 토큰 포함)
+        self.token_usage = TokenUsage()
+
+        # 같은 입력(모델, 프롬프트, 이미지 내용)이면 API를 다시 호출하지 않도록 응답을 캐시함
+        self.response_cache = None
+        if use_cache and config.COPY_CACHE_CONFIG["ENABLED"]:
+            self.response_cache = ResponseCache()
+
+        # 한 번의 요청으로 상품명 후보 N개를 받아 로컬 SEO 점수로 고름 (1이면 후보 요청 안 함)
+        self.title_candidates = config.TITLE_SCORER_CONFIG["CANDIDATES"]
+        self.copy_fields = REQUIRED_FIELDS + (["title_candidates"] if self.title_candidates > 1 else [])
+
+        # 필드 재요청 / 실패 건수 (100건당)
+        self.generation_stats = GenerationStats()
+
+        # 마지막 스트리밍 호출의 첫 필드까지 걸린 시간 / 전체 시간
+        self.last_stream_stats: Dict[str, Any] = {}
+
+        # 업로드 전에 이미지를 모델 입력 해상도로 줄임
+        self.image_preparer = ImagePreparer() if config.IMAGE_PREP_CONFIG["ENABLED"] else None
+
+        # API 할당량에 맞춘 클라이언트 측 속도 제한 (비동기 호출에 적용)
+        self.rate_limiter = AsyncTokenBucket(config.GENAI_CONFIG["RATE_LIMIT_RPM"], config.GENAI_CONFIG["RATE_LIMIT_BURST"])
+        
+    def generate_copy(self, product_name: str, keywords: List[str], tags: List[str], image_paths: Optional[List[str]] = None, target_keyword: Optional[str] = None, use_cache: bool = True, keyword_weights: Optional[Dict[str, float]] = None) -> Optional[Dict]:
+        """
+        Generates marketing copy for a product using Gemini.
+        Supports text-only or multimodal (text + image) input.
+        Returns a JSON dictionary.
+        use_cache=False이면 캐시를 조회하지 않고 항상 API를 호출함 (결과는 캐시에 갱신)
+        keyword_weights: {키워드: 가중치} (키워드 리포트). 상품명 후보 순위 계산에 사용하며, 없으면 keywords 순위로 가중치를 매김
+        """
+        final_prompt, cache_key = self._prepare(product_name, keywords, tags, image_paths, target_keyword)
+        cached = self._cached(cache_key, product_name, use_cache)
+        if cached is not None:
+            return self._rank_titles(cached, keywords, keyword_weights)
+        contents = self._contents(final_prompt, image_paths)
+
+        try:
+            logger.info(f"Generating copy for '{product_name}' (Images: {len(contents) - 1})...")
+            response = self.model.generate_content(contents, generation_config=self._generation_config())
+            self.token_usage.record(response, product_name)
+            result_json, failed = self._parse(response.text)
+            retried = bool(failed)
+            for _ in range(config.GENAI_CONFIG["FIELD_RETRIES"]):
+                if not failed:
+                    break
+                # 실패한 필드만 다시 요청 (이미지 없이 텍스트로)
+                logger.warning(f"Re-requesting fields {failed} for '{product_name}'")
+                response = self.model.generate_content(self._field_retry_contents(contents, result_json, failed), generation_config=self._generation_config(failed))
+                self.token_usage.record(response, f"{product_name} (field retry)")
+                result_json, failed = self._merge_fields(result_json, failed, response.text)
+            return self._rank_titles(self._finish(cache_key, product_name, result_json, failed, retried), keywords, keyword_weights)
+            
+        except Exception as e:
+            self.generation_stats.record(retried=False, failed=True)
+            logger.error(f"Gemini API Error: {e}")
+            return None
+
+    async def generate_copy_async(self, product_name: str, keywords: List[str], tags: List[str], image_paths: Optional[List[str]] = None, target_keyword: Optional[str] = None, use_cache: bool = True, keyword_weights: Optional[Dict[str, float]] = None) -> Optional[Dict]:
+        """
+        generate_copy의 비동기 버전 (이벤트 루프를 막지 않음).
+        요청 전 속도 제한(토큰 버킷)을 거치고, 일시적 오류(429/503/timeout)는 지터 백오프로 재시도함.
+        """
+        # 이미지 읽기/캐시 조회는 파일·DB I/O이므로 스레드에서 처리
+        final_prompt, cache_key = await asyncio.to_thread(self._prepare, product_name, keywords, tags, image_paths, target_keyword)
+        cached = await asyncio.to_thread(self._cached, cache_key, product_name, use_cache)
+        if cached is not None:
+            return self._rank_titles(cached, keywords, keyword_weights)
+        contents = await asyncio.to_thread(self._contents, final_prompt, image_paths)
+
+        try:
+            logger.info(f"Generating copy for '{product_name}' (Images: {len(contents) - 1})...")
+            response = await self._generate_with_retry(contents, product_name)
+            result_json = await self._complete_async(contents, cache_key, product_name, response.text)
+            return self._rank_titles(result_json, keywords, keyword_weights)
+
+        except Exception as e:
+            self.generation_stats.record(retried=False, failed=True)
+            logger.error(f"Gemini API Error: {e}")
+            return None
+
+    async def stream_copy_async(self, product_name: str, keywords: List[str], tags: List[str], image_paths: Optional[List[str]] = None, target_keyword: Optional[str] = None, use_cache: bool = True, keyword_weights: Optional[Dict[str, float]] = None) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        스트리밍 모드: 응답 JSON의 최상위 필드가 완성되는 즉시 (필드명, 값)을 돌려줌.
+        catch_phrase / optimized_title을 detail_body 생성이 끝나기 전에 받아 다음 단계(릴스 자막 등)를 시작할 수 있음.
+        스트림이 끝나면 전체 응답을 파싱해 캐시에 저장하고, 첫 필드까지 걸린 시간을 기록함 (self.last_stream_stats)
+        """
+        start = time.perf_counter()
+        final_prompt, cache_key = await asyncio.to_thread(self._prepare, product_name, keywords, tags, image_paths, target_keyword)
+        cached = await asyncio.to_thread(self._cached, cache_key, product_name, use_cache)
+        if cached is not None:
+            self.last_stream_stats = {"cached": True, "first_field_seconds": 0.0, "total_seconds": time.perf_counter() - start}
+            for field, value in self._rank_titles(cached, keywords, keyword_weights).items():
+                yield field, value
+            return
+        contents = await asyncio.to_thread(self._contents, final_prompt, image_paths)
+
+        parser = JsonFieldStream()
+        first_field_at = None
+        try:
+            logger.info(f"Streaming copy for '{product_name}' (Images: {len(contents) - 1})...")
+            async for chunk_text in self._stream_async(contents, product_name):
+                for field, value in parser.feed(chunk_text):
+                    if first_field_at is None:
+                        first_field_at = time.perf_counter() - start
+                        logger.info(f"Time to first field: {first_field_at:.2f}s ({field})")
+                    yield field, value
+
+            result_json = await self._complete_async(contents, cache_key, product_name, parser.text)
+            result_json = self._rank_titles(result_json, keywords, keyword_weights)
+            # 증분 파서가 놓쳤거나, 다시 요청해서 채웠거나, 후보 순위로 바뀐 필드(optimized_title, title_scores)는 마지막에 전달
+            for field, value in (result_json or {}).items():
+                if parser.fields.get(field) != value:
+                    yield field, value
+
+        except Exception as e:
+            self.generation_stats.record(retried=False, failed=True)
+            logger.error(f"Gemini API Error: {e}")
+        finally:
+            total = time.perf_counter() - start
+            self.last_stream_stats = {"cached": False, "first_field_seconds": first_field_at, "total_seconds": total}
+            first_field = f"{first_field_at:.2f}s" if first_field_at is not None else "-"
+            logger.info(f"Streaming finished in {total:.2f}s (first field: {first_field})")
+
+    async def _stream_async(self, contents: List, product_name: str) -> AsyncIterator[str]:
+        """
+        스트리밍 응답의 텍스트 청크. 스트림 시작(첫 요청)까지만 재시도함
+        """
+        async def open_stream():
+            await self.rate_limiter.acquire()
+            generation_config = self._generation_config()
+            if hasattr(self.model, "generate_content_async"):
+                return await self.model.generate_content_async(contents, generation_config=generation_config, stream=True)
+            return await asyncio.to_thread(self.model.generate_content, contents, generation_config=generation_config, stream=True)
+
+        response = await retry_async(
+            open_stream,
+            max_retries=config.GENAI_CONFIG["MAX_RETRIES"],
+            base_delay=config.GENAI_CONFIG["BACKOFF_BASE"],
+            max_delay=config.GENAI_CONFIG["BACKOFF_MAX"],
+            description=f"Gemini stream '{product_name}'",
+        )
+        last_chunk = None
+        if hasattr(response, "__aiter__"):
+            async for chunk in response:
+                last_chunk = chunk
+                yield chunk.text
+        else:
+            # 동기 스트림은 청크마다 스레드에서 읽어 이벤트 루프를 막지 않음
+            chunks = iter(response)
+            while True:
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    break
+                last_chunk = chunk
+                yield chunk.text
+        # 스트림 사용량은 마지막 청크에 담겨 옴
+        if last_chunk is not None:
+            self.token_usage.record(last_chunk, f"{product_name} (stream)")
+
+    async def generate_copies(self, requests: Iterable[CopyRequest], max_concurrency: Optional[int] = None, use_cache: bool = True) -> AsyncIterator[Tuple[int, CopyRequest, Optional[Dict]]]:
+        """
+        여러 상품의 원고를 동시에 생성하고, 완료되는 순서대로 (입력 순번, 요청, 결과)를 돌려줌.
+        동시 요청 수는 max_concurrency(기본: GENAI_CONFIG["MAX_CONCURRENCY"])로 제한됨.
+
+        async for index, request, result in writer.generate_copies(requests): ...
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or config.GENAI_CONFIG["MAX_CONCURRENCY"])
+
+        async def run(index: int, request: CopyRequest):
+            async with semaphore:
+                result = await self.generate_copy_async(
+                    request.product_name, request.keywords, request.tags,
+                    request.image_paths, request.target_keyword, use_cache, request.keyword_weights,
+                )
+                return index, request, result
+
+        tasks = [asyncio.create_task(run(i, request)) for i, request in enumerate(requests)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 호출부가 중간에 멈추면 남은 요청은 취소
+            for task in tasks:
+                task.cancel()
+
+    async def _generate_async(self, contents: List, fields: Optional[List[str]] = None):
+        await self.rate_limiter.acquire()
+        generation_config = self._generation_config(fields)
+        if hasattr(self.model, "generate_content_async"):
+            response = await self.model.generate_content_async(contents, generation_config=generation_config)
+        else:
+            response = await asyncio.to_thread(self.model.generate_content, contents, generation_config=generation_config)
+        self.token_usage.record(response)
+        return response
+
+    async def _generate_with_retry(self, contents: List, product_name: str, fields: Optional[List[str]] = None):
+        return await retry_async(
+            lambda: self._generate_async(contents, fields),
+            max_retries=config.GENAI_CONFIG["MAX_RETRIES"],
+            base_delay=config.GENAI_CONFIG["BACKOFF_BASE"],
+            max_delay=config.GENAI_CONFIG["BACKOFF_MAX"],
+            description=f"Gemini '{product_name}'",
+        )
+
+    async def _complete_async(self, contents: List, cache_key: Optional[str], product_name: str, text_response: str) -> Optional[Dict]:
+        """
+        응답을 파싱하고, 빠지거나 깨진 필드만 다시 요청해서 채움
+        """
+        result_json, failed = self._parse(text_response)
+        retried = bool(failed)
+        for _ in range(config.GENAI_CONFIG["FIELD_RETRIES"]):
+            if not failed:
+                break
+            logger.warning(f"Re-requesting fields {failed} for '{product_name}'")
+            response = await self._generate_with_retry(self._field_retry_contents(contents, result_json, failed), product_name, failed)
+            result_json, failed = self._merge_fields(result_json, failed, response.text)
+        return await asyncio.to_thread(self._finish, cache_key, product_name, result_json, failed, retried)
+
+    def _generation_config(self, fields: Optional[List[str]] = None) -> Optional[Dict]:
+        """
+        STRUCTURED_OUTPUT이면 JSON 응답 + 원고 필드 스키마를 강제함 (fields를 주면 그 필드만)
+        """
+        if not config.GENAI_CONFIG["STRUCTURED_OUTPUT"]:
+            return None
+        return {"response_mime_type": "application/json", "response_schema": response_schema(fields or self.copy_fields)}
+
+    def _parse(self, text_response: str) -> Tuple[Dict, List[str]]:
+        result_json, failed = parse_copy(text_response, self.copy_fields)
+        if failed:
+            logger.warning(f"Invalid or missing fields in response: {failed}")
+            logger.debug(f"Raw response: {text_response}")
+        return result_json, failed
+
+    @staticmethod
+    def _field_retry_contents(contents: List, result_json: Dict, failed: List[str]) -> List[str]:
+        return [
+            contents[0],
+            "[이미 작성된 필드]\n" + json.dumps(result_json, ensure_ascii=False)
+            + f"\n\n위 원고와 어울리도록 다음 필드만 JSON으로 다시 작성해줘: {', '.join(failed)}",
+        ]
+
+    def _merge_fields(self, result_json: Dict, failed: List[str], text_response: str) -> Tuple[Dict, List[str]]:
+        repaired, _ = parse_copy(text_response, failed)
+        result_json = dict(result_json)
+        result_json.update({field: repaired[field] for field in failed if field in repaired})
+        result_json = {field: result_json[field] for field in COPY_FIELDS if field in result_json}
+        return result_json, [field for field in failed if field not in repaired]
+
+    def _rank_titles(self, result_json: Optional[Dict], keywords: List[str], keyword_weights: Optional[Dict[str, float]]) -> Optional[Dict]:
+        """
+        상품명 후보(+ 모델이 고른 optimized_title)를 로컬 SEO 점수로 정렬해 1위를 optimized_title로 사용.
+        점수표는 title_scores로 함께 돌려줌 (추가 API 호출 없음)
+        """
+        if not result_json or self.title_candidates <= 1:
+            return result_json
+        candidates = [result_json.get("optimized_title")] + list(result_json.get("title_candidates", []))
+        scorer = TitleScorer(keyword_weights or TitleScorer.weights_from_keywords(keywords))
+        ranked = scorer.rank([c for c in candidates if isinstance(c, str) and c.strip()])
+        if not ranked:
+            return result_json
+        result_json = dict(result_json)
+        result_json["optimized_title"] = ranked[0]["title"]
+        result_json["title_scores"] = ranked
+        return result_json
+
+    def _prepare(self, product_name: str, keywords: List[str], tags: List[str], image_paths: Optional[List[str]], target_keyword: Optional[str]) -> Tuple[str, Optional[str]]:
+        """
+        (프롬프트, 캐시 키). 캐시 키는 이미지 원본 바이트 + 전처리 설정으로 만들어 캐시 히트면 이미지를 디코딩/축소하지 않음
+        """
+        final_prompt = self._build_prompt(product_name, keywords, tags, image_paths, target_keyword)
+        cache_key = None
+        if self.response_cache is not None:
+            prep = self.image_preparer.signature() if self.image_preparer is not None else "raw"
+            # 페르소나가 바뀌면 캐시도 무효가 되도록 키에 포함
+            cache_key = make_cache_key(self.cache_model, PERSONA_INSTRUCTION + "\n" + final_prompt, [prep] + self._image_hashes(image_paths))
+        return final_prompt, cache_key
+
+    def _contents(self, final_prompt: str, image_paths: Optional[List[str]]) -> List:
+        """
+        요청 contents = [프롬프트, 이미지...] (캐시 미스일 때만 호출)
+        """
+        return [final_prompt] + self._image_parts(image_paths)
+
+    @staticmethod
+    def _image_hashes(image_paths: Optional[List[str]]) -> List[str]:
+        hashes = []
+        for img_path in image_paths or []:
+            if os.path.exists(img_path):
+                try:
+                    with open(img_path, 'rb') as f:
+                        hashes.append(content_hash(f.read()))
+                except OSError as e:
+                    logger.error(f"Failed to read image {img_path}: {e}")
+        return hashes
+
+    def _cached(self, cache_key: Optional[str], product_name: str, use_cache: bool) -> Optional[Dict]:
+        if cache_key is None or not use_cache:
+            return None
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Copy cache hit for '{product_name}' ({self.response_cache.stats()})")
+        return cached
+
+    def _finish(self, cache_key: Optional[str], product_name: str, result_json: Dict, failed: List[str], retried: bool) -> Optional[Dict]:
+        """
+        지표 기록 후, 모든 필드가 채워진 원고만 캐시에 저장함.
+        끝까지 채우지 못한 필드가 있으면 나머지 필드만이라도 돌려줌 (하나도 없으면 None)
+        """
+        self.generation_stats.record(retried=retried, failed=bool(failed))
+        if failed:
+            logger.error(f"Copy generation incomplete for '{product_name}': missing {failed} ({self.generation_stats.per_100()})")
+            return result_json or None
+
+        logger.info("Copy generation successful.")
+        if cache_key is not None:
+            self.response_cache.put(cache_key, self.cache_model, result_json)
+        return result_json
+
+    def _build_prompt(self, product_name: str, keywords: List[str], tags: List[str], image_paths: Optional[List[str]] = None, target_keyword: Optional[str] = None) -> str:
+        """
+        상품 정보 + 출력 포맷 프롬프트 (페르소나는 모델의 system_instruction으로 따로 전달)
+        """
+        # Prepare inputs
+        keywords_str = ", ".join(keywords)
+        tags_str = ", ".join(tags)
+        
+
         user_prompt = f"""
         아래 정보를 바탕으로 '쥴리씨(Jullyssy)' 쇼핑몰의 상품 원고를 작성해줘.
 
@@ -84,69 +411,52 @@ class AICopywriter:
         [출력 포맷]
         {
             "optimized_title": "SEO와 클릭률을 모두 잡은 50자 이내 상품명",
-            "main_keywords": ["핵심키워드1", "핵심키워드2", "핵심키워드3"],
-            "tags": ["#태그1", "#태그2", "#태그3", "#태그4", "#태그5", "#태그6", "#태그7", "#태그8", "#태그9", "#태그10"],
             "catch_phrase": "오길비 스타일의 한 줄 헤드라인 (상세페이지 최상단용)",
             "detail_body": "상세페이지 본문 (3단 구성: 공감/문제/해결)",
+            "main_keywords": ["핵심키워드1", "핵심키워드2", "핵심키워드3"],
+            "tags": ["#태그1", "#태그2", "#태그3", "#태그4", "#태그5", "#태그6", "#태그7", "#태그8", "#태그9", "#태그10"],
             "insta_caption": "인스타 업로드용 텍스트 (이모지 포함)"
         }
         """
+
+        if self.title_candidates > 1:
+            user_prompt += f"""
+        - 위 JSON에 "title_candidates" 필드도 추가해줘: optimized_title과 다른 SEO 상품명 후보 {self.title_candidates}개 (각 50자 이내, 문자열 배열)
+        """
         
-        # Combine instructions
-        final_prompt = system_instruction + "\n" + user_prompt
+        return user_prompt
 
-        try:
-            logger.info(f"Generating copy for '{product_name}' (Images: {len(image_paths) if image_paths else 0})...")
-            
-            content_parts = [final_prompt]
-            
-            # Handle Images (Max 5)
-            if image_paths:
-                for img_path in image_paths[:5]:
-                    if os.path.exists(img_path):
-                        try:
-                            img_data = {
-                                'mime_type': 'image/jpeg',
-                                'data': open(img_path, 'rb').read()
-                            }
-                            content_parts.append(img_data)
-                        except Exception as e:
-                            logger.error(f"Failed to read image {img_path}: {e}")
-                
-            response = self.model.generate_content(content_parts)
-            
-            # Extract text
-            text_response = response.text.strip()
-            
-            # Remove Markdown code blocks if present (```json ... ```)
-            if text_response.startswith("```"):
-                text_response = text_response.strip("`")
-                if text_response.startswith("json"):
-                    text_response = text_response[4:].strip()
-            
-            # Parse JSON
-            result_json = json.loads(text_response)
-            
-            logger.info("Copy generation successful.")
-            return result_json
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.debug(f"Raw response: {text_response}")
-            return None
-        except Exception as e:
-            logger.error(f"Gemini API Error: {e}")
-            return None
+    def _image_parts(self, image_paths: Optional[List[str]]) -> List[Dict]:
+        """
+        첨부 이미지 (최대 5장). IMAGE_PREP_CONFIG가 켜져 있으면 실제 형식 판별 + 축소/재인코딩
+        """
+        if self.image_preparer is not None:
+            return self.image_preparer.prepare(image_paths)
+        parts = []
+        if not image_paths:
+            return parts
+        for img_path in image_paths[:5]:
+            if os.path.exists(img_path):
+                try:
+                    with open(img_path, 'rb') as f:
+                        parts.append({'mime_type': 'image/jpeg', 'data': f.read()})
+                except Exception as e:
+                    logger.error(f"Failed to read image {img_path}: {e}")
+        return parts
 
 if __name__ == "__main__":
-    # Test Code
+    # Test Code (--stub: API 키 없이 로컬 대역 백엔드로 실행)
     try:
-        writer = AICopywriter()
+        if "--stub" in sys.argv:
+            writer = AICopywriter(use_cache=False, backend="local")
+        else:
+            writer = AICopywriter()
         test_res = writer.generate_copy(
             "뽀글이 토트백", 
             ["가방", "양털", "겨울"], 
             ["#귀여운", "#데일리"]
         )
         print(json.dumps(test_res, indent=2, ensure_ascii=False))
+        print(f"Token usage: {writer.token_usage.summary()}")
     except Exception as e:
         print(f"Init failed: {e}")
@@ -0,0 +1,164 @@
+import io
+import logging
+import os
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from PIL import Image, ImageOps
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# EXIF Orientation 태그. 5~8은 90도 회전이 들어가 있어 exif_transpose 후 가로/세로가 바뀜
+_ORIENTATION_TAG = 0x0112
+_ROTATED_ORIENTATIONS = {5, 6, 7, 8}
+
+# Gemini가 그대로 받는 이미지 형식 (그 외 형식은 JPEG으로 재인코딩)
+SUPPORTED_MIME_TYPES = {"image/jpeg", "image/png", "image/webp", "image/heic", "image/heif"}
+
+
+class ImagePreparer:
+    """
+    Gemini 멀티모달 요청용 이미지 전처리.
+    - 파일 확장자가 아니라 실제 내용으로 MIME 타입을 판별
+    - 모델 유효 입력 해상도(긴 변 MAX_SIDE, 총 픽셀 MAX_PIXELS)로 축소 후 JPEG 재인코딩
+    - SELECT="informative"이면 앞에서부터가 아니라 정보량(밝기 엔트로피)이 큰 이미지를 골라 보냄
+    """
+
+    def __init__(
+        self,
+        max_images: Optional[int] = None,
+        max_side: Optional[int] = None,
+        max_pixels: Optional[int] = None,
+        quality: Optional[int] = None,
+        select: Optional[str] = None,
+    ):
+        prep_config = config.IMAGE_PREP_CONFIG
+        self.max_images = max_images or prep_config["MAX_IMAGES"]
+        self.max_side = max_side or prep_config["MAX_SIDE"]
+        self.max_pixels = max_pixels or prep_config["MAX_PIXELS"]
+        self.quality = quality or prep_config["JPEG_QUALITY"]
+        self.select = select or prep_config["SELECT"]
+        self.passthrough_bytes = prep_config["PASSTHROUGH_BYTES"]
+        if self.select not in ("first", "informative"):
+            raise ValueError(f"알 수 없는 이미지 선택 방식: {self.select} (가능: first, informative)")
+
+    def signature(self) -> str:
+        """
+        전처리 설정 요약. 같은 원본이라도 설정이 바뀌면 보내는 이미지가 달라지므로 응답 캐시 키에 포함함
+        """
+        return f"prep:{self.max_images}:{self.max_side}:{self.max_pixels}:{self.quality}:{self.select}:{self.passthrough_bytes}"
+
+    def prepare(self, image_paths: Optional[Sequence[str]]) -> List[Dict]:
+        """
+        요청에 첨부할 이미지 파트 [{'mime_type', 'data'}] (최대 max_images장)
+        """
+        if not image_paths:
+            return []
+        paths = [p for p in image_paths if os.path.exists(p)]
+        if self.select == "first":
+            paths = paths[:self.max_images]
+
+        candidates = []
+        for path in paths:
+            try:
+                candidates.append((path, Image.open(path)))
+            except Exception as e:
+                logger.error(f"Failed to read image {path}: {e}")
+
+        if self.select == "informative" and len(candidates) > self.max_images:
+            scores = [self._information_score(path) for path, _ in candidates]
+            keep = set(np.argsort(scores)[::-1][:self.max_images].tolist())
+            for i, (_, image) in enumerate(candidates):
+                if i not in keep:
+                    image.close()
+            candidates = [candidates[i] for i in sorted(keep)]
+
+        parts = []
+        original_bytes = 0
+        for path, image in candidates:
+            try:
+                original_bytes += os.path.getsize(path)
+                parts.append(self._encode(path, image))
+            except Exception as e:
+                logger.error(f"Failed to prepare image {path}: {e}")
+            finally:
+                image.close()
+
+        if parts:
+            uploaded = sum(len(part["data"]) for part in parts)
+            logger.info(
+                f"Image payload: {len(parts)} images, {original_bytes / 1024:.0f}KB -> {uploaded / 1024:.0f}KB"
+            )
+        return parts
+
+    def _target_size(self, width: int, height: int):
+        scale = min(1.0, self.max_side / max(width, height), (self.max_pixels / (width * height)) ** 0.5)
+        return max(1, round(width * scale)), max(1, round(height * scale)), scale < 1.0
+
+    @staticmethod
+    def _oriented_size(image: Image.Image):
+        """
+        exif_transpose 후의 (width, height). 헤더만 읽으므로 draft 전에 호출 가능
+        """
+        width, height = image.size
+        if image.getexif().get(_ORIENTATION_TAG) in _ROTATED_ORIENTATIONS:
+            return height, width
+        return width, height
+
+    def _encode(self, path: str, image: Image.Image) -> Dict:
+        mime_type = Image.MIME.get(image.format, "")
+        # 목표 크기는 회전을 적용한 방향 기준 (리사이즈는 exif_transpose 뒤에 하므로)
+        width, height = self._oriented_size(image)
+        new_width, new_height, needs_resize = self._target_size(width, height)
+        rotated = (width, height) != image.size
+
+        file_size = os.path.getsize(path)
+        keep_original = not needs_resize and mime_type in SUPPORTED_MIME_TYPES
+
+        # 이미 작고 지원되는 형식이면 원본 그대로 사용
+        if keep_original and file_size <= self.passthrough_bytes:
+            return self._read_original(path, mime_type)
+
+        if needs_resize and image.format == "JPEG":
+            # JPEG은 DCT 단계에서 1/2, 1/4, 1/8로 줄여서 디코딩 (전체 해상도 디코딩 방지)
+            image.draft("RGB", (new_height, new_width) if rotated else (new_width, new_height))
+        image = ImageOps.exif_transpose(image)
+        image = self._to_rgb(image)
+        if image.size != (new_width, new_height):
+            image = image.resize((new_width, new_height), Image.LANCZOS)
+
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", quality=self.quality, optimize=True)
+        data = buffer.getvalue()
+        if keep_original and len(data) >= file_size:
+            return self._read_original(path, mime_type)
+        return {"mime_type": "image/jpeg", "data": data}
+
+    @staticmethod
+    def _read_original(path: str, mime_type: str) -> Dict:
+        with open(path, "rb") as f:
+            return {"mime_type": mime_type, "data": f.read()}
+
+    @staticmethod
+    def _to_rgb(image: Image.Image) -> Image.Image:
+        if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+            rgba = image.convert("RGBA")
+            background = Image.new("RGB", rgba.size, (255, 255, 255))
+            background.paste(rgba, mask=rgba.split()[-1])
+            return background
+        return image.convert("RGB")
+
+    @staticmethod
+    def _information_score(path: str) -> float:
+        """
+        작은 썸네일의 밝기 히스토그램 엔트로피 (단색 배경/여백 이미지일수록 낮음)
+        """
+        with Image.open(path) as image:
+            image.draft("L", (128, 128))
+            thumb = image.convert("L")
+        thumb.thumbnail((128, 128))
+        histogram = np.asarray(thumb.histogram(), dtype=np.float64)
+        p = histogram[histogram > 0] / histogram.sum()
+        return float(-(p * np.log2(p)).sum())
@@ -0,0 +1,94 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class JsonFieldStream:
+    """
+    스트리밍으로 들어오는 JSON 객체 텍스트에서 최상위 필드가 완성되는 즉시 꺼내는 증분 파서.
+    - 첫 '{' 이전의 텍스트(```json 코드 펜스 등)는 무시
+    - 문자열/배열/객체 값은 닫히는 순간, 숫자/불리언 값은 뒤따르는 ',' 또는 '}'에서 완성으로 판단
+    - 이미 읽은 위치는 다시 스캔하지 않음 (청크당 새로 들어온 문자만 처리)
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.fields: Dict[str, Any] = {}
+        self.done = False
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        # 최상위에서 기대하는 토큰: key -> colon -> value -> (',' 후) key
+        self._expect = "key"
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        청크를 추가하고, 이번 청크로 새로 완성된 (필드명, 값) 목록을 돌려줌
+        """
+        self.text += chunk
+        completed = []
+        text = self.text
+        while self._pos < len(text) and not self.done:
+            c = text[self._pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        if self._expect == "key":
+                            self._key = json.loads(text[self._string_start:self._pos + 1])
+                            self._expect = "colon"
+                        elif self._expect == "value" and self._value_start == self._string_start:
+                            self._complete(self._pos + 1, completed)
+            elif c == '"':
+                self._in_string = True
+                self._string_start = self._pos
+                if self._depth == 1 and self._expect == "value" and self._value_start is None:
+                    self._value_start = self._pos
+            elif c in "{[":
+                if self._depth == 0:
+                    if c == "{":
+                        self._depth = 1
+                        self._expect = "key"
+                else:
+                    if self._depth == 1 and self._expect == "value" and self._value_start is None:
+                        self._value_start = self._pos
+                    self._depth += 1
+            elif c in "}]":
+                if self._depth == 1:
+                    if self._expect == "value" and self._value_start is not None:
+                        self._complete(self._pos, completed)
+                    self.done = True
+                elif self._depth > 1:
+                    self._depth -= 1
+                    if self._depth == 1 and self._expect == "value" and self._value_start is not None:
+                        self._complete(self._pos + 1, completed)
+            elif self._depth == 1:
+                if c == ":" and self._expect == "colon":
+                    self._expect = "value"
+                    self._value_start = None
+                elif c == ",":
+                    if self._expect == "value" and self._value_start is not None:
+                        self._complete(self._pos, completed)
+                    self._expect = "key"
+                elif not c.isspace() and self._expect == "value" and self._value_start is None:
+                    self._value_start = self._pos
+            self._pos += 1
+        return completed
+
+    def _complete(self, end: int, completed: List[Tuple[str, Any]]):
+        raw = self.text[self._value_start:end].strip()
+        self._value_start = None
+        self._expect = "next"
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            return
+        self.fields[self._key] = value
+        completed.append((self._key, value))
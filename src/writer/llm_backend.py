@@ -0,0 +1,78 @@
+import datetime
+import logging
+import os
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+import config
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("gemini", "local")
+
+
+class GeminiBackend:
+    """
+    Google Gemini (genai.GenerativeModel) 백엔드.
+    AICopywriter가 쓰는 LLM 백엔드 인터페이스:
+    - generate_content(contents, generation_config=None, stream=False) -> 응답(.text, .usage_metadata) 또는 청크 iterable
+    - generate_content_async(...) (선택) -> 응답 또는 청크 async iterable
+    """
+
+    name = "gemini"
+
+    def __init__(self, model_name: str, system_instruction: Optional[str] = None):
+        # SDK는 이 백엔드를 쓸 때만 필요함 (local 백엔드는 SDK/API 키 없이 동작)
+        import google.generativeai as genai
+
+        load_dotenv()
+        self.api_key = os.getenv(config.GENAI_CONFIG["API_KEY_ENV"])
+        if not self.api_key:
+            logger.error("GOOGLE_API_KEY is not set in environment variables.")
+            raise ValueError("GOOGLE_API_KEY is missing via .env")
+
+        genai.configure(api_key=self.api_key)
+        self.model_name = model_name
+        self.model = self._create_model(genai, system_instruction)
+
+    def _create_model(self, genai, system_instruction: Optional[str]):
+        """
+        페르소나를 system_instruction 슬롯에 넣은 모델.
+        CONTEXT_CACHE가 켜져 있으면 페르소나를 서버 측 컨텍스트 캐시로 만들어 요청마다 다시 과금되지 않게 함
+        (캐시 최소 토큰 수 미달 등으로 실패하면 system_instruction 방식으로 사용)
+        """
+        if system_instruction and config.GENAI_CONFIG["CONTEXT_CACHE"]:
+            try:
+                cached_content = genai.caching.CachedContent.create(
+                    model=f"models/{self.model_name}",
+                    display_name="jops-copywriter-persona",
+                    system_instruction=system_instruction,
+                    ttl=datetime.timedelta(seconds=config.GENAI_CONFIG["CONTEXT_CACHE_TTL"]),
+                )
+                logger.info(f"Persona context cache created: {cached_content.name}")
+                return genai.GenerativeModel.from_cached_content(cached_content=cached_content)
+            except Exception as e:
+                logger.warning(f"Context cache unavailable, using system_instruction: {e}")
+        return genai.GenerativeModel(self.model_name, system_instruction=system_instruction)
+
+    def generate_content(self, contents: List, generation_config: Optional[Dict] = None, stream: bool = False):
+        return self.model.generate_content(contents, generation_config=generation_config, stream=stream)
+
+    async def generate_content_async(self, contents: List, generation_config: Optional[Dict] = None, stream: bool = False):
+        return await self.model.generate_content_async(contents, generation_config=generation_config, stream=stream)
+
+
+def create_backend(name: Optional[str] = None, model_name: Optional[str] = None, system_instruction: Optional[str] = None):
+    """
+    이름으로 LLM 백엔드 생성. name이 없으면 환경변수(GENAI_CONFIG["BACKEND_ENV"]) -> GENAI_CONFIG["BACKEND"] 순
+    - gemini: 실제 API (GOOGLE_API_KEY 필요)
+    - local: 결정적 JSON을 돌려주는 로컬 대역 (지연/오류율/스트리밍은 LOCAL_LLM_CONFIG)
+    """
+    name = name or os.getenv(config.GENAI_CONFIG["BACKEND_ENV"]) or config.GENAI_CONFIG["BACKEND"]
+    if name == "gemini":
+        return GeminiBackend(model_name or config.GENAI_CONFIG["MODEL_NAME"], system_instruction)
+    if name == "local":
+        from src.writer.local_model import LocalStubModel
+        return LocalStubModel(system_instruction, cached_system_instruction=config.GENAI_CONFIG["CONTEXT_CACHE"])
+    raise ValueError(f"알 수 없는 LLM 백엔드: {name} (가능: {', '.join(BACKENDS)})")
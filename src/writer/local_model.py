@@ -0,0 +1,142 @@
+import asyncio
+import hashlib
+import json
+import random
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+import config
+from src.writer.structured_output import COPY_FIELDS, REQUIRED_FIELDS
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    대략적인 토큰 수 (UTF-8 4바이트당 1토큰)
+    """
+    return (len(text.encode("utf-8")) + 3) // 4
+
+
+class ServiceUnavailable(Exception):
+    """
+    로컬 대역이 흉내 내는 일시적 서버 오류 (이름으로 재시도 대상 판별, src/writer/throttle.py)
+    """
+
+
+class LocalStubModel:
+    """
+    Gemini 대신 쓰는 로컬 LLM 대역 (API 키/네트워크 없이 AICopywriter와 파이프라인 부하 테스트용).
+    - 입력 프롬프트 해시로 결정적인 원고 JSON을 만들고, usage_metadata도 실제 응답처럼 채움
+    - 응답 지연 = latency(± jitter) + 출력 토큰 / tokens_per_second (스트리밍이면 청크마다 나눠서 도착)
+    - error_rate 확률로 ServiceUnavailable, malformed_rate 확률로 중간에 잘린 JSON을 돌려줌
+    cached_system_instruction=True면 system_instruction 토큰을 캐시된 컨텍스트로 집계함
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        system_instruction: Optional[str] = None,
+        cached_system_instruction: bool = False,
+        latency: Optional[float] = None,
+        latency_jitter: Optional[float] = None,
+        tokens_per_second: Optional[float] = None,
+        error_rate: Optional[float] = None,
+        malformed_rate: Optional[float] = None,
+        chunk_chars: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        local_config = config.LOCAL_LLM_CONFIG
+        self.system_instruction = system_instruction or ""
+        self.cached_system_instruction = cached_system_instruction
+        self.latency = latency if latency is not None else local_config["LATENCY_SECONDS"]
+        self.latency_jitter = latency_jitter if latency_jitter is not None else local_config["LATENCY_JITTER"]
+        self.tokens_per_second = tokens_per_second or local_config["TOKENS_PER_SECOND"]
+        self.error_rate = error_rate if error_rate is not None else local_config["ERROR_RATE"]
+        self.malformed_rate = malformed_rate if malformed_rate is not None else local_config["MALFORMED_RATE"]
+        self.chunk_chars = chunk_chars or local_config["STREAM_CHUNK_CHARS"]
+        self._rng = random.Random(seed if seed is not None else local_config["SEED"])
+        self.calls = 0
+
+    def _usage(self, contents: List, output: str) -> SimpleNamespace:
+        text = "".join(part for part in contents if isinstance(part, str))
+        image_tokens = 258 * sum(1 for part in contents if isinstance(part, dict))
+        system_tokens = estimate_tokens(self.system_instruction)
+        prompt = system_tokens + estimate_tokens(text) + image_tokens
+        output_tokens = estimate_tokens(output)
+        return SimpleNamespace(
+            prompt_token_count=prompt,
+            cached_content_token_count=system_tokens if self.cached_system_instruction else 0,
+            candidates_token_count=output_tokens,
+            total_token_count=prompt + output_tokens,
+        )
+
+    def _copy_json(self, contents: List, generation_config: Optional[Dict]) -> str:
+        seed = hashlib.sha256("".join(p for p in contents if isinstance(p, str)).encode("utf-8")).hexdigest()[:8]
+        fields = REQUIRED_FIELDS
+        if generation_config and generation_config.get("response_schema"):
+            schema = generation_config["response_schema"]
+            fields = schema.get("propertyOrdering", schema["required"])
+        result = {}
+        for name in fields:
+            if COPY_FIELDS[name][0] == "array":
+                prefix = "#" if name == "tags" else ""
+                count = 5 if name == "title_candidates" else 3
+                result[name] = [f"{prefix}{name}{i}_{seed}" for i in range(1, count + 1)]
+            else:
+                result[name] = f"{name} {seed}"
+        return json.dumps(result, ensure_ascii=False)
+
+    def _plan(self, contents, generation_config: Optional[Dict]):
+        """
+        (첫 응답까지 지연, 응답 텍스트, 사용량, 오류 여부)
+        """
+        self.calls += 1
+        contents = contents if isinstance(contents, list) else [contents]
+        delay = max(0.0, self.latency + self._rng.uniform(-self.latency_jitter, self.latency_jitter))
+        if self._rng.random() < self.error_rate:
+            return delay, "", None, True
+        text = self._copy_json(contents, generation_config)
+        if self._rng.random() < self.malformed_rate:
+            text = text[:int(len(text) * 0.7)]
+        return delay, text, self._usage(contents, text), False
+
+    def _pieces(self, text: str, usage) -> List[SimpleNamespace]:
+        pieces = [text[i:i + self.chunk_chars] for i in range(0, len(text), self.chunk_chars)] or [""]
+        return [
+            SimpleNamespace(text=piece, usage_metadata=usage if i == len(pieces) - 1 else None)
+            for i, piece in enumerate(pieces)
+        ]
+
+    def _piece_delay(self, piece: SimpleNamespace) -> float:
+        return estimate_tokens(piece.text) / self.tokens_per_second
+
+    def generate_content(self, contents, generation_config: Optional[Dict] = None, stream: bool = False, **kwargs):
+        delay, text, usage, failed = self._plan(contents, generation_config)
+        time.sleep(delay)
+        if failed:
+            raise ServiceUnavailable("local stand-in: 503 Service Unavailable")
+        if stream:
+            return self._iter_pieces(self._pieces(text, usage))
+        time.sleep(estimate_tokens(text) / self.tokens_per_second)
+        return SimpleNamespace(text=text, usage_metadata=usage)
+
+    def _iter_pieces(self, pieces):
+        for piece in pieces:
+            time.sleep(self._piece_delay(piece))
+            yield piece
+
+    async def generate_content_async(self, contents, generation_config: Optional[Dict] = None, stream: bool = False, **kwargs):
+        delay, text, usage, failed = self._plan(contents, generation_config)
+        await asyncio.sleep(delay)
+        if failed:
+            raise ServiceUnavailable("local stand-in: 503 Service Unavailable")
+        if stream:
+            return self._aiter_pieces(self._pieces(text, usage))
+        await asyncio.sleep(estimate_tokens(text) / self.tokens_per_second)
+        return SimpleNamespace(text=text, usage_metadata=usage)
+
+    async def _aiter_pieces(self, pieces):
+        for piece in pieces:
+            await asyncio.sleep(self._piece_delay(piece))
+            yield piece
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(model_name: str, prompt: str, image_hashes: Iterable[str] = ()) -> str:
+    """
+    모델명 + 프롬프트 + 이미지 내용 해시로 캐시 키 생성 (이미지 파일 경로가 아니라 내용 기준)
+    """
+    digest = hashlib.sha256()
+    for part in (model_name, prompt, *image_hashes):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class ResponseCache:
+    """
+    AICopywriter 응답(JSON)을 SQLite에 영구 저장하는 캐시.
+    - TTL(초)이 지난 엔트리는 조회되지 않고 정리 대상이 됨
+    - 엔트리 수가 MAX_ENTRIES를 넘으면 가장 오래 사용하지 않은 것부터 삭제 (LRU)
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ttl_seconds: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ):
+        cache_config = config.COPY_CACHE_CONFIG
+        self.db_path = Path(db_path or cache_config["PATH"])
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else cache_config["TTL_SECONDS"]
+        self.max_entries = max_entries or cache_config["MAX_ENTRIES"]
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._init_db()
+
+    def _init_db(self):
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS copy_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    model_name TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_copy_cache_lru ON copy_cache (last_used)")
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return bool(self.ttl_seconds) and now - created_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[Dict]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM copy_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None or self._expired(row[1], now):
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE copy_cache SET last_used = ? WHERE cache_key = ?", (now, key))
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, model_name: str, response: Dict):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO copy_cache (cache_key, model_name, response, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, model_name, json.dumps(response, ensure_ascii=False), now, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float):
+        if self.ttl_seconds:
+            self._conn.execute("DELETE FROM copy_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+        count = self._conn.execute("SELECT COUNT(*) FROM copy_cache").fetchone()[0]
+        if count > self.max_entries:
+            self._conn.execute(
+                "DELETE FROM copy_cache WHERE cache_key IN "
+                "(SELECT cache_key FROM copy_cache ORDER BY last_used ASC LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM copy_cache").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "entries": entries,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
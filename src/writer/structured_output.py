@@ -0,0 +1,149 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.writer.json_stream import JsonFieldStream
+
+# 원고 JSON 필드 (이름: (타입, 설명)). 생성 순서 = 프롬프트 출력 포맷 = response_schema의 propertyOrdering.
+# 스트리밍에서 먼저 쓰이는 필드(상품명, 릴스 자막용 헤드라인, 상세페이지 본문)를 앞에 둠
+COPY_FIELDS = {
+    "optimized_title": ("string", "SEO와 클릭률을 모두 잡은 50자 이내 상품명"),
+    "catch_phrase": ("string", "오길비 스타일의 한 줄 헤드라인 (상세페이지 최상단용)"),
+    "detail_body": ("string", "상세페이지 본문 (3단 구성: 공감/문제/해결)"),
+    "main_keywords": ("array", "핵심 키워드 3개"),
+    "tags": ("array", "'#'으로 시작하는 추천 태그 10개"),
+    "insta_caption": ("string", "인스타 업로드용 텍스트 (이모지 포함)"),
+    # 상품명 후보 N개를 요청할 때만 사용 (TITLE_SCORER_CONFIG["CANDIDATES"] > 1)
+    "title_candidates": ("array", "서로 다른 SEO 상품명 후보"),
+}
+
+# 항상 요구하는 기본 6개 필드
+REQUIRED_FIELDS = [name for name in COPY_FIELDS if name != "title_candidates"]
+
+
+def response_schema(fields: Optional[List[str]] = None) -> Dict:
+    """
+    Gemini response_schema (OpenAPI 부분집합). fields를 주면 그 필드만 요구하는 스키마.
+    propertyOrdering이 없으면 Gemini는 필드를 알파벳순으로 생성하므로 COPY_FIELDS 순서를 명시함
+    """
+    names = fields or REQUIRED_FIELDS
+    properties = {}
+    for name in names:
+        field_type, description = COPY_FIELDS[name]
+        if field_type == "array":
+            properties[name] = {"type": "array", "items": {"type": "string"}, "description": description}
+        else:
+            properties[name] = {"type": "string", "description": description}
+    ordering = [name for name in COPY_FIELDS if name in properties]
+    return {"type": "object", "properties": properties, "required": names, "propertyOrdering": ordering}
+
+
+def _valid(name: str, value: Any) -> bool:
+    field_type = COPY_FIELDS[name][0]
+    if field_type == "array":
+        return isinstance(value, list) and len(value) > 0 and all(isinstance(v, str) for v in value)
+    return isinstance(value, str) and bool(value.strip())
+
+
+def invalid_fields(data: Dict, fields: Optional[List[str]] = None) -> List[str]:
+    """
+    빠졌거나 타입이 맞지 않는 필드 목록
+    """
+    return [name for name in fields or REQUIRED_FIELDS if not _valid(name, data.get(name))]
+
+
+def repair_json(text: str) -> Dict:
+    """
+    관대한 JSON 파서. 순서대로 시도하고 처음 성공한 결과를 돌려줌
+    1) 코드 펜스/앞뒤 잡문 제거 후 json.loads
+    2) 후행 쉼표 제거, 문자열 안의 raw 줄바꿈 이스케이프 후 json.loads
+    3) 증분 파서로 완성된 필드만 건짐 (응답이 중간에 잘린 경우)
+    """
+    text = text.strip()
+    start, end = text.find("{"), text.rfind("}")
+    body = text[start:end + 1] if start != -1 and end > start else text[start:] if start != -1 else text
+
+    try:
+        data = json.loads(body)
+        if isinstance(data, dict):
+            return data
+    except json.JSONDecodeError:
+        pass
+
+    fixed = _relax_json(body)
+    try:
+        data = json.loads(fixed)
+        if isinstance(data, dict):
+            return data
+    except json.JSONDecodeError:
+        pass
+
+    parser = JsonFieldStream()
+    parser.feed(fixed)
+    return dict(parser.fields)
+
+
+def _relax_json(text: str) -> str:
+    """
+    문자열 밖의 후행 쉼표(',' 뒤에 '}' 또는 ']')를 지우고 문자열 안의 raw 줄바꿈을 이스케이프함
+    (문자열 안의 ', }' 같은 내용은 그대로 둠)
+    """
+    out = []
+    in_string = escape = False
+    for c in text:
+        if in_string:
+            if escape:
+                escape = False
+            elif c == "\\":
+                escape = True
+            elif c == '"':
+                in_string = False
+            elif c == "\n":
+                out.append("\\n")
+                continue
+            elif c == "\r":
+                continue
+        elif c == '"':
+            in_string = True
+        elif c in "}]":
+            # 직전의 공백을 건너뛰고 쉼표가 있으면 제거
+            i = len(out) - 1
+            while i >= 0 and out[i].isspace():
+                i -= 1
+            if i >= 0 and out[i] == ",":
+                del out[i]
+        out.append(c)
+    return "".join(out)
+
+
+def parse_copy(text: str, fields: Optional[List[str]] = None) -> Tuple[Dict, List[str]]:
+    """
+    (유효한 필드만 담은 원고 dict, 다시 요청해야 할 필드 목록)
+    """
+    fields = fields or REQUIRED_FIELDS
+    data = repair_json(text)
+    failed = invalid_fields(data, fields)
+    return {name: data[name] for name in fields if name not in failed}, failed
+
+
+class GenerationStats:
+    """
+    원고 생성 품질 지표: API 호출 100건당 필드 재요청 / 최종 실패 건수
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.retried = 0
+        self.failed = 0
+
+    def record(self, retried: bool, failed: bool):
+        self.requests += 1
+        self.retried += int(retried)
+        self.failed += int(failed)
+
+    def per_100(self) -> Dict[str, float]:
+        scale = 100.0 / self.requests if self.requests else 0.0
+        return {
+            "requests": self.requests,
+            "retried_per_100": round(self.retried * scale, 2),
+            "failed_per_100": round(self.failed * scale, 2),
+        }
@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# google.api_core.exceptions 등 재시도 가능한 일시적 오류 (SDK에 직접 의존하지 않도록 클래스 이름으로 판별)
+TRANSIENT_ERROR_NAMES = {
+    "ResourceExhausted",
+    "TooManyRequests",
+    "ServiceUnavailable",
+    "DeadlineExceeded",
+    "InternalServerError",
+    "Aborted",
+    "GatewayTimeout",
+}
+
+
+def is_transient(error: BaseException) -> bool:
+    if isinstance(error, (TimeoutError, ConnectionError, asyncio.TimeoutError)):
+        return True
+    return any(cls.__name__ in TRANSIENT_ERROR_NAMES for cls in type(error).__mro__)
+
+
+class AsyncTokenBucket:
+    """
+    클라이언트 측 요청 속도 제한 (토큰 버킷).
+    rate_per_minute개의 토큰이 분당 균일하게 채워지고, 최대 burst개까지 쌓임.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: Optional[int] = None):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute는 0보다 커야 합니다.")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(burst or 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    full jitter 지수 백오프: uniform(0, min(cap, base * 2^attempt))
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+async def retry_async(
+    call: Callable[[], Awaitable[T]],
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    description: str = "request",
+) -> T:
+    """
+    일시적 오류(is_transient)면 지터 백오프 후 최대 max_retries번 재시도. 그 외 오류는 그대로 전파
+    """
+    attempt = 0
+    while True:
+        try:
+            return await call()
+        except Exception as e:
+            if attempt >= max_retries or not is_transient(e):
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            attempt += 1
+            logger.warning(f"{description} 일시적 오류 ({type(e).__name__}), {delay:.1f}s 후 재시도 {attempt}/{max_retries}")
+            await asyncio.sleep(delay)
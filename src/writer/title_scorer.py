@@ -0,0 +1,107 @@
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+import config
+from src.models.report import KeywordReport
+
+SCORE_COLUMNS = ['상품명', 'SEO점수', '키워드_커버리지', '길이_감점', '불용어수', '중복수']
+
+
+class TitleScorer:
+    """
+    상품명 후보 SEO 점수 (API 호출 없이 로컬에서 계산).
+    SEO점수 = COVERAGE x 키워드_커버리지 - LENGTH x 길이_감점 - STOPWORD x 불용어수 - DUPLICATE x 중복수
+    - 키워드_커버리지: 후보에 포함된 키워드의 가중치 합 / 전체 가중치 합 (띄어쓰기 무시 부분 문자열 일치)
+    - 길이_감점: MAX_LENGTH 초과분 / MAX_LENGTH + MIN_LENGTH 미달분 / MIN_LENGTH
+    - 불용어수: 불용어와 같은 단어 수, 중복수: 같은 단어/키워드 반복 횟수
+    후보 x 키워드 출현 횟수를 np.char.count 브로드캐스팅으로 한 번에 계산함
+    """
+
+    def __init__(
+        self,
+        keyword_weights: Dict[str, float],
+        max_length: Optional[int] = None,
+        min_length: Optional[int] = None,
+        stopwords: Optional[Iterable[str]] = None,
+    ):
+        scorer_config = config.TITLE_SCORER_CONFIG
+        weights = {k.replace(" ", ""): float(v) for k, v in keyword_weights.items() if k and float(v) > 0}
+        self.keywords = np.array(list(weights), dtype=str)
+        self.weights = np.array(list(weights.values()), dtype=np.float64)
+        self.max_length = max_length or scorer_config["MAX_LENGTH"]
+        self.min_length = min_length or scorer_config["MIN_LENGTH"]
+        self.stopwords = np.array(
+            sorted(stopwords if stopwords is not None else config.TOKENIZER_CONFIG["STOPWORDS"]["analyzer"]), dtype=str
+        )
+        self.score_weights = scorer_config["WEIGHTS"]
+
+    @staticmethod
+    def weights_from_report(report: KeywordReport, top_n: Optional[int] = None) -> Dict[str, float]:
+        """
+        키워드 리포트 상위 top_n개의 {키워드: 가중점수}
+        """
+        if report is None or report.empty:
+            return {}
+        table = report.head(top_n or config.TITLE_SCORER_CONFIG["TOP_KEYWORDS"])
+        return dict(zip(table['키워드'].astype(str), table['가중점수'].astype(float)))
+
+    @staticmethod
+    def weights_from_keywords(keywords: Sequence[str]) -> Dict[str, float]:
+        """
+        점수 없이 순위만 있는 키워드 리스트는 1/순위 가중치
+        """
+        return {keyword: 1.0 / rank for rank, keyword in enumerate(keywords, start=1)}
+
+    def score(self, titles: Sequence[str]) -> pd.DataFrame:
+        """
+        후보별 점수표 (SEO점수 내림차순, 동점이면 입력 순서)
+        """
+        titles = [str(t).strip() for t in titles if t and str(t).strip()]
+        if not titles:
+            return pd.DataFrame(columns=SCORE_COLUMNS)
+
+        compact = np.array([t.replace(" ", "") for t in titles], dtype=str)
+        if len(self.keywords):
+            counts = np.char.count(compact[:, None], self.keywords[None, :])
+            coverage = (counts > 0) @ self.weights / self.weights.sum()
+            keyword_repeats = np.maximum(counts - 1, 0).sum(axis=1)
+        else:
+            coverage = np.zeros(len(titles))
+            keyword_repeats = np.zeros(len(titles), dtype=int)
+
+        lengths = np.char.str_len(np.array(titles, dtype=str)).astype(np.float64)
+        length_penalty = (
+            np.maximum(lengths - self.max_length, 0) / self.max_length
+            + np.maximum(self.min_length - lengths, 0) / self.min_length
+        )
+
+        words = [t.split() for t in titles]
+        stopword_counts = np.array([np.isin(w, self.stopwords).sum() for w in words])
+        word_repeats = np.array([len(w) - len(set(w)) for w in words])
+        duplicates = keyword_repeats + word_repeats
+
+        w = self.score_weights
+        scores = (
+            w["COVERAGE"] * coverage
+            - w["LENGTH"] * length_penalty
+            - w["STOPWORD"] * stopword_counts
+            - w["DUPLICATE"] * duplicates
+        )
+        table = pd.DataFrame({
+            '상품명': titles,
+            'SEO점수': np.round(scores, 4),
+            '키워드_커버리지': np.round(coverage, 4),
+            '길이_감점': np.round(length_penalty, 4),
+            '불용어수': stopword_counts,
+            '중복수': duplicates,
+        })
+        return table.sort_values('SEO점수', ascending=False, kind='mergesort').reset_index(drop=True)
+
+    def rank(self, titles: Sequence[str]) -> List[Dict]:
+        """
+        [{'title', 'score'}, ...] (점수 내림차순, 중복 후보 제거)
+        """
+        table = self.score(list(dict.fromkeys(titles)))
+        return [{'title': t, 'score': float(s)} for t, s in zip(table['상품명'], table['SEO점수'])]
@@ -0,0 +1,49 @@
+import logging
+import threading
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+# GenerateContentResponse.usage_metadata 필드 -> 집계 키
+USAGE_FIELDS = {
+    "prompt_token_count": "prompt",
+    "cached_content_token_count": "cached",
+    "candidates_token_count": "output",
+    "total_token_count": "total",
+}
+
+
+class TokenUsage:
+    """
+    호출별 토큰 사용량 집계 (usage_metadata 기준).
+    cached는 프롬프트 중 캐시된 컨텍스트(페르소나 등)에서 온 토큰 수로, 요청마다 새로 과금되는 입력은 prompt - cached
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.totals = {key: 0 for key in USAGE_FIELDS.values()}
+        self.last: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, response, label: str = "") -> Dict[str, int]:
+        metadata = getattr(response, "usage_metadata", None)
+        if metadata is None:
+            return {}
+        usage = {key: int(getattr(metadata, field, 0) or 0) for field, key in USAGE_FIELDS.items()}
+        with self._lock:
+            self.calls += 1
+            for key, value in usage.items():
+                self.totals[key] += value
+            self.last = usage
+        logger.info(
+            f"Tokens{' ' + label if label else ''}: prompt {usage['prompt']} (cached {usage['cached']}), "
+            f"output {usage['output']}, total {usage['total']}"
+        )
+        return usage
+
+    def summary(self) -> Dict[str, float]:
+        with self._lock:
+            calls = self.calls
+            totals = dict(self.totals)
+        per_call = {f"{key}_per_call": round(value / calls, 1) if calls else 0.0 for key, value in totals.items()}
+        return {"calls": calls, **totals, **per_call, "uncached_prompt": totals["prompt"] - totals["cached"]}
@@ -0,0 +1,52 @@
+import pandas as pd
+
+import config
+from src.analyzer.keyword_analyzer import KeywordAnalyzer
+from src.analyzer.keyword_scoring import KeywordScorer
+from src.analyzer.sketches import ApproxKeywordCounter
+
+
+class BatchRecordingAnalyzer(KeywordAnalyzer):
+    """
+    Kiwi 없이 공백 기준으로 토큰을 나누고 토큰화 배치 크기를 기록하는 테스트용 분석기
+    """
+
+    def __init__(self):
+        self.scorer = KeywordScorer()
+        self.phrase_top_n = 20
+        self.token_cache = None
+        self.count_mode = "approx"
+        self.dedupe = True
+        self.batches = []
+
+    def _extract_keywords_many(self, titles):
+        self.batches.append(len(titles))
+        return [title.split() for title in titles]
+
+
+def test_approx_mode_streams_titles_in_batches(monkeypatch):
+    monkeypatch.setitem(config.SKETCH_CONFIG, "BATCH_SIZE", 4)
+    titles = ["여름 린넨 원피스", "린넨 셔츠", "기모 슬랙스", "린넨 바지", "기모 원피스"] * 3
+    df = pd.DataFrame({
+        "순위": range(1, len(titles) + 1),
+        "상품명": titles,
+        "is_ad": False,
+        "쇼핑몰명": ["a", "b", "c"] * 5,
+    })
+    analyzer = BatchRecordingAnalyzer()
+    report = analyzer.build_keyword_report(df)
+
+    assert max(analyzer.batches) == 4
+    assert sum(analyzer.batches) == len(titles)
+    # 근사 모드는 전체 토큰/중복 제거/복합 키워드를 만들지 않음
+    assert report.tokens is None
+    assert report.phrases.empty
+    assert report.duplicate_titles == 0
+
+    # 한 번에 반영한 결과와 같음
+    scorer = analyzer.scorer
+    ranks, prices, stores = scorer.frame_inputs(df)
+    counter = ApproxKeywordCounter(store_diversity_power=scorer.store_diversity_power)
+    counter.update([t.split() for t in titles], scorer.product_weights(len(df), ranks, prices), stores, product_ids=df.index.tolist())
+    expected = counter.top(30)
+    pd.testing.assert_frame_equal(report.table.drop(columns="순위"), expected)
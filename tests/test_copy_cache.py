@@ -0,0 +1,80 @@
+import pytest
+
+import config
+from src.writer.ai_copywriter import AICopywriter
+from src.writer.local_model import LocalStubModel
+
+
+class FakeGeminiModel(LocalStubModel):
+    """
+    네트워크 없이 gemini 백엔드로 식별되는 대역 (호출 수는 calls로 확인)
+    """
+
+    name = "gemini"
+
+
+@pytest.fixture
+def copy_cache(tmp_path, monkeypatch):
+    monkeypatch.setitem(config.COPY_CACHE_CONFIG, "PATH", tmp_path / "copy_cache.sqlite3")
+    monkeypatch.setitem(config.LOCAL_LLM_CONFIG, "LATENCY_SECONDS", 0.0)
+    monkeypatch.setitem(config.LOCAL_LLM_CONFIG, "LATENCY_JITTER", 0.0)
+    monkeypatch.setitem(config.LOCAL_LLM_CONFIG, "TOKENS_PER_SECOND", 1e9)
+
+
+def generate(writer):
+    return writer.generate_copy("기모 슬랙스", ["기모", "슬랙스"], ["#기모"])
+
+
+def test_local_backend_copy_is_not_served_to_gemini(copy_cache):
+    local = AICopywriter(backend="local")
+    assert generate(local) is not None
+    assert local.model.calls == 1
+
+    # 같은 프롬프트라도 gemini 백엔드는 local 대역 원고를 캐시 히트로 받지 않음
+    gemini = AICopywriter(model=FakeGeminiModel(latency=0.0, latency_jitter=0.0))
+    assert generate(gemini) is not None
+    assert gemini.model.calls == 1
+
+
+def test_same_backend_hits_the_cache(copy_cache):
+    generate(AICopywriter(backend="local"))
+    again = AICopywriter(backend="local")
+    assert generate(again) is not None
+    assert again.model.calls == 0
+
+
+def test_cache_hit_skips_image_preparation(copy_cache, tmp_path, monkeypatch):
+    from PIL import Image
+
+    from src.writer.image_prep import ImagePreparer
+
+    image_path = tmp_path / "product.jpg"
+    Image.new("RGB", (64, 64), (200, 30, 30)).save(image_path)
+    prepared = []
+    original_prepare = ImagePreparer.prepare
+
+    def counting_prepare(self, image_paths):
+        prepared.append(list(image_paths))
+        return original_prepare(self, image_paths)
+
+    monkeypatch.setattr(ImagePreparer, "prepare", counting_prepare)
+
+    def generate_with_image(writer):
+        return writer.generate_copy("기모 슬랙스", ["기모", "슬랙스"], ["#기모"], image_paths=[str(image_path)])
+
+    first = AICopywriter(backend="local")
+    assert generate_with_image(first) is not None
+    assert len(prepared) == 1
+
+    # 캐시 히트면 이미지를 디코딩/축소하지 않음
+    again = AICopywriter(backend="local")
+    assert generate_with_image(again) is not None
+    assert again.model.calls == 0
+    assert len(prepared) == 1
+
+    # 원본 이미지가 바뀌면 캐시 미스
+    Image.new("RGB", (64, 64), (30, 30, 200)).save(image_path)
+    changed = AICopywriter(backend="local")
+    assert generate_with_image(changed) is not None
+    assert changed.model.calls == 1
+    assert len(prepared) == 2
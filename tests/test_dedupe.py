@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from src.analyzer.dedupe import TitleDeduper
+
+ROOT = Path(__file__).resolve().parents[1]
+
+TITLES = [
+    "여름 린넨 원피스 롱 원피스",
+    "여름 린넨원피스 롱원피스",
+    "기모 부츠컷 슬랙스 여성",
+    "기모 부츠컷 슬랙스 여성용",
+    "남성 린넨 셔츠 반팔",
+]
+
+SCRIPT = f"""
+from src.analyzer.dedupe import TitleDeduper
+deduper = TitleDeduper()
+print(deduper.signatures({TITLES!r}).sum(axis=1).tolist())
+print(deduper.cluster({TITLES!r}).tolist())
+"""
+
+
+def run_with_hash_seed(seed: str) -> str:
+    env = dict(os.environ, PYTHONHASHSEED=seed)
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=True,
+    )
+    return result.stdout
+
+
+def test_signatures_do_not_depend_on_python_hash_seed():
+    assert run_with_hash_seed("1") == run_with_hash_seed("2")
+
+
+def test_near_duplicate_titles_share_a_representative():
+    keep, labels = TitleDeduper().representatives(TITLES)
+    assert labels[0] == labels[1]
+    assert labels[2] == labels[3]
+    assert keep.tolist() == [True, False, True, False, True]
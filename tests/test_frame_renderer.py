@@ -0,0 +1,54 @@
+import numpy as np
+import PIL.Image
+import pytest
+
+from benchmarks.reels_render import legacy_video
+from src.video.frame_renderer import KenBurnsRenderer
+
+WIDTH, HEIGHT, FPS = 108, 192, 24
+COLORS = [(200, 40, 40), (40, 200, 40), (40, 40, 200)]
+
+
+@pytest.fixture
+def image_paths(tmp_path):
+    # 단색 이미지: 기존 경로의 줌 중심이 픽셀 단위로 어긋나도 색이 같아 crossfade/타이밍만 비교됨
+    paths = []
+    for i, color in enumerate(COLORS):
+        path = tmp_path / f"{i}.png"
+        PIL.Image.new("RGB", (300 if i % 2 else 200, 400), color).save(path)
+        paths.append(str(path))
+    return paths
+
+
+def boundary_times(renderer, n_images):
+    # 각 이미지 시작/crossfade 끝 앞뒤 한 프레임, 마지막 프레임
+    step = 1.0 / renderer.fps
+    times = {renderer.frame_times(n_images)[-1]}
+    for i in range(n_images):
+        for edge in (renderer.clip_start(i), renderer.clip_start(i) + renderer.transition_duration):
+            times.update(t for t in (edge - step, edge, edge + step) if 0 <= t < renderer.total_duration(n_images))
+    return sorted(times)
+
+
+def test_frames_match_legacy_moviepy_at_segment_boundaries(image_paths):
+    renderer = KenBurnsRenderer(width=WIDTH, height=HEIGHT, fps=FPS)
+    sources = [renderer.load_source(path) for path in image_paths]
+    legacy = legacy_video(image_paths, width=WIDTH, height=HEIGHT)
+    assert legacy.duration == pytest.approx(renderer.total_duration(len(image_paths)))
+    for t in boundary_times(renderer, len(image_paths)):
+        expected = legacy.get_frame(t).astype(np.int16)
+        actual = renderer.frame_at(sources, t).astype(np.int16)
+        assert np.abs(actual - expected).max() <= 1, f"t={t:.4f}"
+
+
+def test_segments_cover_every_frame_with_their_sources():
+    renderer = KenBurnsRenderer(width=WIDTH, height=HEIGHT, fps=FPS)
+    n_images = 3
+    times = renderer.frame_times(n_images)
+    segments = renderer.segments(n_images)
+    assert segments == [(0, 60, [0]), (60, 120, [0, 1]), (120, 180, [1, 2])]
+    assert [start for start, _, _ in segments[1:]] == [stop for _, stop, _ in segments[:-1]]
+    assert segments[-1][1] == len(times)
+    for start, stop, indices in segments:
+        for t in times[start:stop]:
+            assert set(renderer.active_clips(float(t), n_images)) <= set(indices)
@@ -0,0 +1,47 @@
+import numpy as np
+import PIL.Image
+
+from src.video import image_loader
+from src.video.frame_renderer import KenBurnsRenderer
+from src.video.image_loader import ImageLoader
+
+
+def tall_png(path):
+    # 상세페이지처럼 세로로 긴 이미지 (중앙 크롭 아래쪽 행은 디코딩하지 않아도 됨)
+    pixels = np.random.default_rng(0).integers(0, 256, size=(2000, 90, 3), dtype=np.uint8)
+    PIL.Image.fromarray(pixels).save(path)
+    return str(path)
+
+
+def test_truncated_png_matches_full_decode(tmp_path):
+    renderer = KenBurnsRenderer(width=54, height=96)
+    path = tall_png(tmp_path / "tall.png")
+    loader = ImageLoader(renderer, max_decode_mb=64)
+    with PIL.Image.open(path) as image:
+        _, rows, _ = loader._plan(image, path)
+    assert rows < 2000
+    expected = np.asarray(renderer.load_source(path))
+    assert np.array_equal(np.asarray(loader.load_source(path)), expected)
+
+
+def test_full_decode_when_pil_internals_differ(tmp_path, monkeypatch):
+    renderer = KenBurnsRenderer(width=54, height=96)
+    path = tall_png(tmp_path / "tall.png")
+    monkeypatch.setattr(ImageLoader, "_can_truncate", staticmethod(lambda image: False))
+    loader = ImageLoader(renderer, max_decode_mb=64)
+    with PIL.Image.open(path) as image:
+        _, rows, _ = loader._plan(image, path)
+    assert rows == 2000
+    expected = np.asarray(renderer.load_source(path))
+    assert np.array_equal(np.asarray(loader.load_source(path)), expected)
+
+
+def test_peak_rss_units_follow_platform(monkeypatch):
+    class Usage:
+        ru_maxrss = 2 * 1024 * 1024
+
+    monkeypatch.setattr(image_loader.resource, "getrusage", lambda who: Usage())
+    monkeypatch.setattr(image_loader.sys, "platform", "linux")
+    assert image_loader.peak_rss_mb() == 2048
+    monkeypatch.setattr(image_loader.sys, "platform", "darwin")
+    assert image_loader.peak_rss_mb() == 2
@@ -0,0 +1,52 @@
+import io
+
+import numpy as np
+from PIL import Image
+
+from src.writer import image_prep
+from src.writer.image_prep import ImagePreparer
+
+
+def save_rotated(path, size, orientation=6, quality=75):
+    exif = Image.Exif()
+    exif[0x0112] = orientation
+    pixels = np.random.default_rng(0).integers(0, 256, size=(size[1], size[0], 3), dtype=np.uint8)
+    Image.fromarray(pixels).save(path, format="JPEG", quality=quality, exif=exif)
+    return str(path)
+
+
+def decoded_size(part):
+    with Image.open(io.BytesIO(part["data"])) as image:
+        return image.size
+
+
+def test_resize_target_follows_exif_orientation(tmp_path):
+    # 저장된 픽셀은 가로 400 x 세로 200, 회전 적용 후 200 x 400
+    path = save_rotated(tmp_path / "rotated.jpg", (400, 200))
+    [part] = ImagePreparer(max_side=100).prepare([path])
+    assert decoded_size(part) == (50, 100)
+
+
+def test_rotated_image_without_resize_is_not_stretched(tmp_path):
+    # 원본보다 작아지도록 낮은 품질로 재인코딩 (원본 그대로 보내는 경로를 타지 않게)
+    path = save_rotated(tmp_path / "small.jpg", (200, 100), quality=100)
+    preparer = ImagePreparer(max_side=1000, quality=30)
+    preparer.passthrough_bytes = 0
+    [part] = preparer.prepare([path])
+    assert len(part["data"]) < (tmp_path / "small.jpg").stat().st_size
+    assert decoded_size(part) == (100, 200)
+
+
+def test_informative_selection_closes_dropped_images(tmp_path, monkeypatch):
+    opened = []
+    original_open = Image.open
+
+    def tracking_open(path, *args, **kwargs):
+        image = original_open(path, *args, **kwargs)
+        opened.append(image)
+        return image
+
+    paths = [save_rotated(tmp_path / f"{i}.jpg", (64, 64), orientation=1) for i in range(4)]
+    monkeypatch.setattr(image_prep.Image, "open", tracking_open)
+    ImagePreparer(max_images=2, select="informative").prepare(paths)
+    assert opened and all(image.fp is None for image in opened)
@@ -0,0 +1,86 @@
+import numpy as np
+
+from src.storage.inverted_index import decode_postings, decode_varints, encode_postings, encode_varints
+
+
+def test_varint_round_trip_across_byte_lengths():
+    values = np.array([0, 1, 127, 128, 255, 16383, 16384, 2**32, 2**56 - 1, 2**63 - 1], dtype=np.uint64)
+    data = encode_varints(values)
+    assert np.array_equal(decode_varints(data), values)
+    # 1바이트(<128)와 2바이트(<16384) 경계
+    assert len(encode_varints(np.array([127]))) == 1
+    assert len(encode_varints(np.array([128]))) == 2
+    assert len(encode_varints(np.array([16384]))) == 3
+
+
+def test_varint_empty():
+    assert encode_varints(np.array([], dtype=np.uint64)) == b""
+    assert len(decode_varints(b"")) == 0
+
+
+def test_postings_round_trip_with_large_gaps():
+    postings = np.array([
+        [1, 5, 1, 1],
+        [1, 9, 3, 2],
+        [7, 2**40, 40, 1],
+        # 다음 스냅샷의 product_id가 더 작으면 차분이 음수 (uint64로 감싸 10바이트 varint)
+        [8, 3, 2, 1],
+        [2**33, 2**40 + 1, 1, 3],
+        [2**33, 2**62, 100, 1],
+    ], dtype=np.int64)
+    blob = encode_postings(postings)
+    assert np.array_equal(decode_postings(blob, len(postings)), postings)
+
+
+def test_postings_round_trip_empty():
+    postings = np.empty((0, 4), dtype=np.int64)
+    decoded = decode_postings(encode_postings(postings), 0)
+    assert decoded.shape == (0, 4)
+
+
+class _SplitAnalyzer:
+    def _extract_keywords_many(self, titles):
+        return [title.split() for title in titles]
+
+
+def test_product_id_survives_legacy_upgrade_and_vacuum(tmp_path):
+    import sqlite3
+
+    import pandas as pd
+
+    from src.storage.inverted_index import KeywordIndex
+    from src.storage.scrape_store import ScrapeStore
+
+    db_path = tmp_path / "store.db"
+    # product_id 컬럼이 없던 예전 스키마에 행을 넣고 중간 행을 지워 rowid에 빈자리를 만듦
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(
+        """
+        CREATE TABLE products (
+            snapshot_id INTEGER NOT NULL, keyword TEXT NOT NULL, snapshot_date TEXT NOT NULL, rank INTEGER,
+            title TEXT, price INTEGER, store_name TEXT, tags TEXT, url TEXT, is_ad INTEGER NOT NULL DEFAULT 0
+        );
+        INSERT INTO products (snapshot_id, keyword, snapshot_date, rank, title) VALUES
+            (99, '슬랙스', '2024-01-01', 1, '지워질 상품'),
+            (99, '슬랙스', '2024-01-01', 2, '기모 슬랙스');
+        DELETE FROM products WHERE rank = 1;
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    store = ScrapeStore(db_path)
+    legacy = store.products_by_id([2], columns=['title'])
+    assert legacy['상품명'].tolist() == ['기모 슬랙스']
+
+    store.append_snapshot("슬랙스", pd.DataFrame({'순위': [1, 2], '상품명': ['기모 슬랙스 블랙', '와이드 팬츠']}))
+    index = KeywordIndex(store=store, analyzer=_SplitAnalyzer())
+    index.update()
+    before = index.query(["기모"])[['product_id', '상품명']]
+
+    with store.connection() as conn:
+        conn.execute("VACUUM")
+    after = index.query(["기모"])[['product_id', '상품명']]
+    assert after.equals(before)
+    assert after['상품명'].tolist() == ['기모 슬랙스 블랙']
+    store.close()
@@ -0,0 +1,56 @@
+import json
+
+from src.writer.json_stream import JsonFieldStream
+from src.writer.structured_output import COPY_FIELDS, response_schema
+
+
+def feed_all(chunks):
+    parser = JsonFieldStream()
+    completed = []
+    for chunk in chunks:
+        completed.extend(parser.feed(chunk))
+    return parser, completed
+
+
+def split_every(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_escape_split_across_chunks():
+    text = json.dumps({"catch_phrase": 'say "hi" \\ ok', "tags": ["#a\\"]})
+    # 모든 위치에서 잘라 봄 (백슬래시와 다음 문자가 다른 청크로 나뉘는 경우 포함)
+    for cut in range(1, len(text)):
+        parser, completed = feed_all([text[:cut], text[cut:]])
+        assert parser.fields == json.loads(text)
+        assert [name for name, _ in completed] == ["catch_phrase", "tags"]
+
+
+def test_multibyte_values_one_character_per_chunk():
+    data = {"optimized_title": "여름 린넨 원피스 🌿", "detail_body": "시원한\n린넨 é"}
+    text = json.dumps(data, ensure_ascii=False)
+    parser, completed = feed_all(split_every(text, 1))
+    assert dict(completed) == data
+    # \uXXXX 이스케이프로 온 경우도 같은 값
+    parser, _ = feed_all(split_every(json.dumps(data), 3))
+    assert parser.fields == data
+
+
+def test_fields_are_emitted_in_arrival_order():
+    text = '```json\n{"tags": ["#b"], "rank": 3, "optimized_title": "t", "nested": {"a": [1, {"b": "}"}]}, "ok": true}\n```'
+    parser, completed = feed_all(split_every(text, 5))
+    assert [name for name, _ in completed] == ["tags", "rank", "optimized_title", "nested", "ok"]
+    assert parser.fields["nested"] == {"a": [1, {"b": "}"}]}
+    assert parser.done
+
+
+def test_field_completes_as_soon_as_it_closes():
+    parser = JsonFieldStream()
+    assert parser.feed('{"optimized_title": "상품') == []
+    assert parser.feed('명", "detail_body": "본') == [("optimized_title", "상품명")]
+    assert parser.fields == {"optimized_title": "상품명"}
+
+
+def test_response_schema_orders_properties_like_copy_fields():
+    schema = response_schema(["tags", "detail_body", "optimized_title", "catch_phrase"])
+    assert schema["propertyOrdering"] == ["optimized_title", "catch_phrase", "detail_body", "tags"]
+    assert list(COPY_FIELDS)[:3] == ["optimized_title", "catch_phrase", "detail_body"]
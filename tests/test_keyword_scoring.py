@@ -0,0 +1,26 @@
+import pandas as pd
+
+from src.analyzer.keyword_analyzer import filter_ads, organic_ranks
+from src.analyzer.keyword_scoring import KeywordScorer
+
+
+def test_organic_ranks_ignore_ads_above():
+    df = pd.DataFrame({
+        "순위": [1, 2, 3, 4, 5],
+        "상품명": ["광고1", "a", "광고2", "b", "c"],
+        "is_ad": [True, False, "True", False, False],
+    })
+    organic = organic_ranks(filter_ads(df))
+    assert organic["상품명"].tolist() == ["a", "b", "c"]
+    assert organic["순위"].tolist() == [1, 2, 3]
+
+
+def test_top_organic_item_gets_full_rank_weight():
+    scorer = KeywordScorer(rank_decay="log", price_band_weights=[], store_diversity_power=0)
+    df = organic_ranks(filter_ads(pd.DataFrame({
+        "순위": [1, 2, 3],
+        "상품명": ["광고", "기모", "슬랙스"],
+        "is_ad": [True, False, False],
+    })))
+    table = scorer.score_frame(df, [["기모"], ["슬랙스"]]).set_index("키워드")
+    assert table.loc["기모", "가중점수"] == 1.0
@@ -0,0 +1,26 @@
+import pandas as pd
+
+from src.storage.migrate_csv import migrate
+from src.storage.scrape_store import ScrapeStore
+
+
+def test_migrate_uses_keyword_map_and_skips_unknown(tmp_path):
+    raw_dir, reports_dir = tmp_path / "raw", tmp_path / "reports"
+    raw_dir.mkdir()
+    reports_dir.mkdir()
+    for timestamp in ("20240105_093000", "20240106_101500", "20240107_080000"):
+        pd.DataFrame({'순위': [1], '상품명': [f"상품 {timestamp}"]}).to_csv(raw_dir / f"results_{timestamp}.csv", index=False)
+
+    store = ScrapeStore(tmp_path / "store.db")
+    keyword_map = {"results_20240105_093000.csv": "기모 슬랙스", "20240106_101500": "와이드 팬츠"}
+    assert migrate(store, raw_dir, reports_dir, keyword_map) == 2
+
+    snapshots = store.snapshots()
+    assert dict(zip(snapshots['source'], snapshots['keyword'])) == {
+        "csv:results_20240105_093000.csv": "기모 슬랙스",
+        "csv:results_20240106_101500.csv": "와이드 팬츠",
+    }
+    # 키워드를 모르던 파일은 나중에 키워드를 알려주면 가져옴
+    assert migrate(store, raw_dir, reports_dir, {}, default_keyword="린넨 셔츠") == 1
+    assert store.keywords() == ["기모 슬랙스", "린넨 셔츠", "와이드 팬츠"]
+    store.close()
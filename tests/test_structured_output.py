@@ -0,0 +1,30 @@
+from src.writer.structured_output import invalid_fields, parse_copy, repair_json
+
+
+def test_trailing_commas_are_removed():
+    text = '{"optimized_title": "기모 슬랙스", "tags": ["#a", "#b",],}'
+    assert repair_json(text) == {"optimized_title": "기모 슬랙스", "tags": ["#a", "#b"]}
+
+
+def test_trailing_comma_inside_string_is_kept():
+    assert repair_json('{"catch_phrase": "a, }", "x": 1,}') == {"catch_phrase": "a, }", "x": 1}
+
+
+def test_code_fence_and_raw_newlines():
+    text = '```json\n{"detail_body": "첫 줄\n둘째 줄"}\n```'
+    assert repair_json(text) == {"detail_body": "첫 줄\n둘째 줄"}
+
+
+def test_truncated_response_keeps_completed_fields():
+    text = '{"optimized_title": "기모 슬랙스", "tags": ["#a", "#b"], "detail_body": "본문이 중간에 잘'
+    assert repair_json(text) == {"optimized_title": "기모 슬랙스", "tags": ["#a", "#b"]}
+
+
+def test_truncated_response_after_trailing_comma():
+    assert repair_json('{"optimized_title": "t", "tags": ["#a",') == {"optimized_title": "t"}
+
+
+def test_truncated_fields_are_reported_missing():
+    _, missing = parse_copy('{"optimized_title": "t", "catch_phrase": "c", "detail_body": "잘린', ["optimized_title", "catch_phrase", "detail_body"])
+    assert missing == ["detail_body"]
+    assert invalid_fields({"tags": []}, ["tags"]) == ["tags"]
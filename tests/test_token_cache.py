@@ -0,0 +1,70 @@
+from src.extractor import token_cache
+from src.extractor.token_cache import TokenCache, resolve_tokens
+
+POS_TAGS = ["NNG", "NNP"]
+
+
+def open_cache(tmp_path, stopwords=("할인",)):
+    fingerprint = TokenCache.make_fingerprint(stopwords, POS_TAGS, 2, "extractor")
+    return TokenCache(fingerprint, db_path=tmp_path / "token_cache.sqlite3")
+
+
+def test_entries_survive_reopen_with_same_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(token_cache, "kiwi_version", lambda: "0.20.0")
+    cache = open_cache(tmp_path)
+    cache.put_many({"기모 슬랙스": ["기모", "슬랙스"]})
+    cache.close()
+
+    cache = open_cache(tmp_path)
+    assert cache.get_many(["기모 슬랙스"]) == {"기모 슬랙스": ["기모", "슬랙스"]}
+    cache.close()
+
+
+def test_kiwi_version_change_invalidates_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(token_cache, "kiwi_version", lambda: "0.20.0")
+    cache = open_cache(tmp_path)
+    cache.put_many({"기모 슬랙스": ["기모", "슬랙스"]})
+    cache.close()
+
+    monkeypatch.setattr(token_cache, "kiwi_version", lambda: "0.21.0")
+    cache = open_cache(tmp_path)
+    assert cache.get_many(["기모 슬랙스"]) == {}
+    # 이전 버전 엔트리는 조회만 안 되는 게 아니라 삭제됨
+    assert cache._conn.execute("SELECT COUNT(*) FROM token_cache").fetchone()[0] == 0
+    cache.close()
+
+
+def test_stopword_change_misses_old_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(token_cache, "kiwi_version", lambda: "0.20.0")
+    cache = open_cache(tmp_path, stopwords=("할인",))
+    cache.put_many({"할인 기모 슬랙스": ["기모", "슬랙스"]})
+    cache.close()
+
+    cache = open_cache(tmp_path, stopwords=("할인", "기모"))
+    assert cache.get_many(["할인 기모 슬랙스"]) == {}
+    cache.close()
+
+
+def test_resolve_tokens_computes_each_miss_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(token_cache, "kiwi_version", lambda: "0.20.0")
+    cache = open_cache(tmp_path)
+    cache.put_many({"a b": ["a", "b"]})
+    batches = []
+
+    def compute(titles):
+        batches.append(list(titles))
+        return [title.split() for title in titles]
+
+    result = resolve_tokens(["c d", "a b", "c d", "e"], compute, cache)
+    assert result == [["c", "d"], ["a", "b"], ["c", "d"], ["e"]]
+    assert batches == [["c d", "e"]]
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert cache.get_many(["e"]) == {"e": ["e"]}
+    # 모두 히트면 계산하지 않음
+    resolve_tokens(["a b", "e"], compute, cache)
+    assert len(batches) == 1
+    cache.close()
+
+
+def test_resolve_tokens_without_cache():
+    assert resolve_tokens(["x y", "x y"], lambda titles: [t.split() for t in titles]) == [["x", "y"], ["x", "y"]]
@@ -0,0 +1,24 @@
+from src.extractor.tokenizer import Tokenizer
+
+# Kiwi 모델을 로드하지 않고 필터 설정만 확인
+NO_KIWI = object()
+
+
+def preset(name):
+    return Tokenizer.from_preset(name, kiwi=NO_KIWI, use_cache=False)
+
+
+def test_presets_keep_their_own_stopwords():
+    analyzer, extractor, scraper = preset("analyzer"), preset("extractor"), preset("scraper_tags")
+    assert {"추천", "정품", "쿠폰"} <= analyzer.stopwords
+    assert not {"추천", "정품", "쿠폰"} & extractor.stopwords
+    assert {"무료배송", "여성"} <= extractor.stopwords
+    assert scraper.stopwords == frozenset()
+
+
+def test_stopword_list_is_part_of_the_cache_fingerprint():
+    extractor = preset("extractor")
+    same_filters = Tokenizer(extractor.pos_tags, extractor.stopwords, extractor.min_length, name="extractor", kiwi=NO_KIWI, use_cache=False)
+    more_stopwords = Tokenizer(extractor.pos_tags, extractor.stopwords | {"추천"}, extractor.min_length, name="extractor", kiwi=NO_KIWI, use_cache=False)
+    assert same_filters.fingerprint == extractor.fingerprint
+    assert more_stopwords.fingerprint != extractor.fingerprint
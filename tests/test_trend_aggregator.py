@@ -0,0 +1,68 @@
+from datetime import datetime
+
+import pandas as pd
+
+from src.analyzer.trend_aggregator import KeywordTrendAggregator, run_source
+from src.storage.scrape_store import ScrapeStore
+
+
+class SplitAnalyzer:
+    """
+    Kiwi 없이 공백 기준으로 토큰을 나누는 테스트용 분석기
+    """
+
+    def _extract_keywords_many(self, titles):
+        return [title.split() for title in titles]
+
+
+def test_run_source_maps_results_csv_to_run_timestamp():
+    assert run_source("csv:results_20260101_120000.csv") == "run:20260101_120000"
+    assert run_source("run:20260101_120000") == "run:20260101_120000"
+    assert run_source("csv:other.csv") == "csv:other.csv"
+
+
+def test_run_ingested_through_store_and_csv_counts_once(tmp_path):
+    timestamp = "20260101_120000"
+    df = pd.DataFrame({
+        "순위": [1, 2, 3],
+        "상품명": ["기모 슬랙스", "기모 바지", "광고 상품"],
+        "is_ad": [False, False, True],
+    })
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    df.to_csv(raw_dir / f"results_{timestamp}.csv", index=False, encoding="utf-8-sig")
+
+    db_path = tmp_path / "store.sqlite3"
+    store = ScrapeStore(db_path)
+    store.append_snapshot("슬랙스", df, datetime(2026, 1, 1, 12, 0, 0), f"run:{timestamp}")
+
+    aggregator = KeywordTrendAggregator(analyzer=SplitAnalyzer(), db_path=db_path)
+    assert aggregator.ingest_store(store, "슬랙스") == 1
+    assert aggregator.ingest_directory(raw_dir, "슬랙스") == 0
+    # 순서를 바꿔도 (CSV 먼저) 한 번만 집계됨
+    assert aggregator.ingest_store(store, "슬랙스") == 0
+
+    counts = aggregator.daily_counts("슬랙스").set_index("키워드")
+    assert counts.loc["기모", "등장횟수"] == 2
+    assert counts.loc["기모", "관련_상품수"] == 2
+    assert counts.loc["기모", "전체_상품수"] == 2
+    assert "광고" not in counts.index
+    aggregator.close()
+    store.close()
+
+
+def test_csv_first_then_store_counts_once(tmp_path):
+    timestamp = "20260102_090000"
+    df = pd.DataFrame({"순위": [1], "상품명": ["기모 슬랙스"], "is_ad": [False]})
+    df.to_csv(tmp_path / f"results_{timestamp}.csv", index=False, encoding="utf-8-sig")
+
+    db_path = tmp_path / "store.sqlite3"
+    store = ScrapeStore(db_path)
+    store.append_snapshot("슬랙스", df, datetime(2026, 1, 2, 9, 0, 0), f"run:{timestamp}")
+
+    aggregator = KeywordTrendAggregator(analyzer=SplitAnalyzer(), db_path=db_path)
+    assert aggregator.ingest_directory(tmp_path, "슬랙스") == 1
+    assert aggregator.ingest_store(store, "슬랙스") == 0
+    assert aggregator.daily_counts("슬랙스").set_index("키워드").loc["슬랙스", "등장횟수"] == 1
+    aggregator.close()
+    store.close()